@@ -5,6 +5,7 @@ Provides utilities for:
 - Dew point calculations
 """
 
+import functools
 import math
 from typing import Optional, Tuple
 
@@ -50,6 +51,7 @@ def latlon_to_maidenhead(lat: float, lon: float) -> str:
     return grid
 
 
+@functools.lru_cache(maxsize=256)
 def maidenhead_to_latlon(grid: str) -> Tuple[float, float]:
     """Convert Maidenhead grid square to latitude/longitude (center of grid).
 
@@ -65,7 +67,8 @@ def maidenhead_to_latlon(grid: str) -> Tuple[float, float]:
 
     Returns:
         Tuple of (latitude, longitude) in decimal degrees, representing
-        the center of the grid square.
+        the center of the grid square. Results are memoized (MYLOCATION is
+        converted on every beacon); invalid grids are not cached.
 
     Raises:
         ValueError: If grid square format is invalid
@@ -109,6 +109,11 @@ class APRSManager:
         self.stations: Dict[str, APRSStation] = (
             {}
         )  # station -> comprehensive info
+        # Bumped whenever a station is added or removed, so derived
+        # indexes like get_callsign_index() know when to rebuild
+        self._stations_version = 0
+        self._callsign_index: Tuple[Tuple[str, str], ...] = ()
+        self._callsign_index_version = -1
 
         # Duplicate packet detection
         self.duplicate_detector = DuplicateDetector()
@@ -699,6 +704,7 @@ class APRSManager:
 
                 # Add station to dictionary
                 self.stations[callsign] = station
+                self._stations_version += 1
 
             # Restore messages
             for msg_data in data.get("messages", []):
@@ -781,6 +787,7 @@ class APRSManager:
             # Don't crash on load errors, just start fresh
             print_info(f"Warning: Failed to load APRS database: {e}")
             self.stations.clear()
+            self._stations_version += 1
             self.position_reports.clear()
             self.weather_reports.clear()
 
@@ -850,6 +857,7 @@ class APRSManager:
                 last_heard=now,
                 packets_heard=0,
             )
+            self._stations_version += 1
 
         # Update last_heard timestamp (don't increment packet count for duplicates)
         self.stations[callsign_upper].last_heard = now
@@ -923,6 +931,7 @@ class APRSManager:
                 last_heard=reception_time,
                 packets_heard=0,
             )
+            self._stations_version += 1
 
         # Update last heard (and potentially first heard)
         if reception_time < self.stations[callsign_upper].first_heard:
@@ -3045,6 +3054,25 @@ class APRSManager:
                 reverse=True,
             )
 
+    def get_callsign_index(self) -> Tuple[Tuple[str, str], ...]:
+        """Get all station callsigns, sorted for prefix lookup.
+
+        The index is rebuilt only after stations are added or removed,
+        so tab completion can bisect it on every keystroke without
+        lower-casing or sorting the callsigns again.
+
+        Returns:
+            Tuple of (lowercase callsign, callsign) pairs sorted by the
+            lowercase callsign
+        """
+        if self._callsign_index_version != self._stations_version:
+            self._callsign_index = tuple(sorted(
+                (station.callsign.lower(), station.callsign)
+                for station in self.stations.values()
+            ))
+            self._callsign_index_version = self._stations_version
+        return self._callsign_index
+
     def get_station(self, callsign: str) -> Optional[APRSStation]:
         """Get station information.
 
@@ -3486,6 +3514,7 @@ class APRSManager:
         message_count = len(self.monitored_messages)
 
         self.stations.clear()
+        self._stations_version += 1
         self.messages.clear()
         self.monitored_messages.clear()
         self.weather_reports.clear()
@@ -3512,6 +3541,7 @@ class APRSManager:
 
         for callsign in stations_to_remove:
             del self.stations[callsign]
+            self._stations_version += 1
             # Also remove from position and weather reports
             if callsign in self.position_reports:
                 del self.position_reports[callsign]
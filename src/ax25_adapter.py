@@ -147,6 +147,9 @@ class AX25Adapter:
         Used by RESET, HARDRESET, and POWERCYCLE commands to clear
         adapter state without reinitializing the full adapter.
         """
+        # Taken deliberately: _tx_worker holds this lock while it walks and
+        # retransmits queued frames, so waiting here guarantees no frame
+        # from before the reset is sent with the old sequence numbers
         async with self._tx_lock:
             self._tx_queue.clear()
         self._ns = 0
@@ -44,35 +44,66 @@ class CommandHandler:
     """
     Base class for command handlers with automatic registration.
 
-    Commands are registered via the @command decorator. The handler
-    automatically builds command dispatch tables and provides introspection
-    for help text and tab completion.
+    Commands are registered via the @command decorator. Each subclass
+    builds its command dispatch table once, when the class is defined, and
+    provides introspection for help text and tab completion.
     """
 
-    def __init__(self):
-        self.commands: Dict[str, Dict[str, Any]] = {}
-        self._register_commands()
+    # Subclasses that declare their own __slots__ get no per-instance dict
+    __slots__ = ("commands",)
+
+    # Command name -> metadata, built once per subclass by __init_subclass__
+    _command_table: Dict[str, Dict[str, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._command_table = cls._build_command_table()
 
-    def _register_commands(self):
-        """Scan class methods and register decorated commands."""
-        for name in dir(self):
+    @classmethod
+    def _build_command_table(cls) -> Dict[str, Dict[str, Any]]:
+        """Scan class methods and collect decorated commands."""
+        table: Dict[str, Dict[str, Any]] = {}
+        for name in dir(cls):
             if name.startswith('_'):
                 continue
 
-            method = getattr(self, name)
-            if not callable(method):
+            func = getattr(cls, name)
+            if not callable(func):
                 continue
 
             # Check if method is decorated as a command
-            if hasattr(method, '_is_command'):
-                for cmd_name in method._command_names:
-                    self.commands[cmd_name] = {
-                        'handler': method,
-                        'help': method._command_help,
-                        'usage': method._command_usage,
-                        'category': method._command_category,
-                        'method_name': name
-                    }
+            if hasattr(func, '_is_command'):
+                info = {
+                    # Unbound function; dispatch() passes self
+                    'handler': func,
+                    'is_async': inspect.iscoroutinefunction(func),
+                    'help': func._command_help,
+                    'usage': func._command_usage,
+                    'category': func._command_category,
+                    'method_name': name
+                }
+                for cmd_name in func._command_names:
+                    # A second method claiming the same name would silently
+                    # shadow the first
+                    if cmd_name in table:
+                        raise ValueError(
+                            f"{cls.__name__}: command {cmd_name} registered by both "
+                            f"{table[cmd_name]['method_name']} and {name}"
+                        )
+                    table[cmd_name] = info
+
+        # All names (in table order) that dispatch to each method, so help
+        # and category listings don't rescan the table per command
+        aliases: Dict[str, List[str]] = {}
+        for cmd_name, info in table.items():
+            aliases.setdefault(info['method_name'], []).append(cmd_name)
+        for info in table.values():
+            info['aliases'] = aliases[info['method_name']]
+        return table
+
+    def __init__(self):
+        # Shared with the class; the table is never modified per instance
+        self.commands: Dict[str, Dict[str, Any]] = type(self)._command_table
 
     async def dispatch(self, cmd: str, args: List[str]) -> bool:
         """
@@ -90,13 +121,13 @@ class CommandHandler:
         if cmd_upper not in self.commands:
             return False
 
-        handler = self.commands[cmd_upper]['handler']
+        info = self.commands[cmd_upper]
 
         # Call handler (supports both sync and async)
-        if inspect.iscoroutinefunction(handler):
-            await handler(args)
+        if info['is_async']:
+            await info['handler'](self, args)
         else:
-            handler(args)
+            info['handler'](self, args)
 
         return True
 
@@ -122,9 +153,7 @@ class CommandHandler:
             if category not in categories:
                 categories[category] = []
 
-            # Get all aliases for this command
-            aliases = [n for n, i in self.commands.items()
-                       if i['method_name'] == method_name]
+            aliases = cmd_info['aliases']
 
             # Format: "PRIMARY (alias1, alias2)"
             if len(aliases) > 1:
@@ -157,9 +186,7 @@ class CommandHandler:
             info = self.commands[cmd_upper]
             help_lines = []
 
-            # Get all aliases
-            aliases = [n for n, i in self.commands.items()
-                       if i['method_name'] == info['method_name']]
+            aliases = info['aliases']
 
             if len(aliases) > 1:
                 help_lines.append(f"Command: {', '.join(aliases)}")
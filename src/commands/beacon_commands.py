@@ -6,7 +6,6 @@ Handles automatic and manual APRS position beacon transmission.
 
 from .base import CommandHandler, command
 from src.utils import print_pt, print_info, print_error
-from datetime import datetime, timezone
 
 
 class BeaconCommandHandler(CommandHandler):
@@ -43,8 +42,8 @@ class BeaconCommandHandler(CommandHandler):
             print_pt(f"  Comment: {comment}")
 
             # Show last beacon time
-            if self.cmd_processor.last_beacon_time:
-                elapsed = (datetime.now(timezone.utc) - self.cmd_processor.last_beacon_time).total_seconds()
+            elapsed = self.cmd_processor.beacon_elapsed()
+            if elapsed is not None:
                 elapsed_min = int(elapsed // 60)
                 elapsed_sec = int(elapsed % 60)
                 time_str = self.cmd_processor.last_beacon_time.strftime("%H:%M:%S")
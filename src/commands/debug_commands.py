@@ -7,8 +7,10 @@ and frame history dumping/watching.
 
 import asyncio
 import os
+import re
 
 from prompt_toolkit import HTML
+from prompt_toolkit.formatted_text import to_formatted_text
 from prompt_toolkit.shortcuts import PromptSession
 from prompt_toolkit.key_binding import KeyBindings
 
@@ -18,9 +20,110 @@ from src.device_id import get_device_identifier
 from src.frame_analyzer import (
     decode_ax25_address,
     decode_kiss_frame,
-    format_frame_detailed
+    format_frame_detailed,
+    sanitize_for_xml
 )
-from src.utils import print_pt, print_info, print_error, print_header, print_debug
+from src.utils import print_pt, print_info, print_error, print_header, print_debug, cancel_tasks
+
+
+# Output-format keywords accepted by "debug dump"
+_MODE_TOKENS = {"brief": "brief", "detail": "detail", "watch": "watch"}
+
+# Frame range argument for "debug dump" (e.g., "4-13")
+_RANGE_RE = re.compile(r"^(\d+)-(\d+)$")
+
+# Brief dump line templates per direction: frame number, time, length, hex
+_BRIEF_TEMPLATES = {
+    "TX": "[{}] <green>TX</green> {} ({}b): {}",
+    "RX": "[{}] <cyan>RX</cyan> {} ({}b): {}",
+}
+
+# Watch mode banners, parsed once at import
+_WATCH_BANNER = to_formatted_text(HTML("<yellow>Monitoring for incoming frames...</yellow>"))
+_WATCH_EXIT_HINT = to_formatted_text(HTML("<gray>Press ESC or type '~~~' to exit</gray>"))
+_WATCH_PROMPT = to_formatted_text(HTML("<gray>[Watching... type '~~~' or press ESC to exit]</gray> "))
+_WATCH_EXITED = to_formatted_text(HTML("<yellow>Watch mode exited</yellow>"))
+
+# Static part of the "debug" help shown when no arguments are given
+_DEBUG_HELP = "\n".join([
+    "Debug levels:",
+    "  0 = Off (no debug output)",
+    "  1 = TNC monitor",
+    "  2 = Critical errors and events",
+    "  3 = Connection state changes",
+    "  4 = Frame transmission/reception",
+    "  5 = Protocol details, retransmissions",
+    "  6 = Everything (BLE, config, hex dumps)",
+    "",
+    "Usage: debug <level>  or  debug <level> filter <callsign>",
+    "       debug filter  or  debug filter clear",
+    "       debug save",
+    "       debug dump [n|-n|n-m] [brief|detail|watch]",
+    "Example: debug 5 filter k1mal-7  (debug level 5 for K1MAL-7 only)",
+    "         debug 2  (sets global level to 2, clears filters)",
+    "         debug save  (save frame buffer to disk)",
+    "         debug dump 5 brief  or  debug dump 3 detail",
+])
+
+
+def _set_station_filter(callsign, level):
+    """Set a per-station debug level, keeping the filters sorted by callsign.
+
+    Filters are displayed far more often than they change, so the dict is
+    re-ordered here once rather than sorted on every display.
+    """
+    filters = constants.DEBUG_STATION_FILTERS
+    filters[callsign] = level
+    ordered = sorted(filters.items())
+    filters.clear()
+    filters.update(ordered)
+
+
+def _find_acks(frames):
+    """
+    Find APRS message ACKs in a batch of frames.
+
+    Runs as one pass over the whole batch after the frames are printed.
+    A substring test on the raw bytes rejects most frames before any
+    AX.25 address walking is done.
+
+    Args:
+        frames: Iterable of FrameHistoryEntry objects
+
+    Returns:
+        List of "SRC -> ADDRESSEE (ID: n)" strings
+    """
+    acks = []
+    for frame in frames:
+        raw_bytes = frame.raw_bytes
+        if len(raw_bytes) <= 23 or b'ack' not in raw_bytes:
+            continue
+
+        ax25_payload = raw_bytes[2:-1]
+        # Extract info field (after addresses, control, pid)
+        offset = 14
+        while offset < len(ax25_payload) and not ax25_payload[offset - 1] & 0x01:
+            offset += 7
+        info = offset + 2
+
+        # Match ":ADDRESSEE:ack" on the raw bytes so only the short ACK
+        # body ever gets decoded
+        if (ax25_payload[info:info + 1] != b':'
+                or ax25_payload[info + 11:info + 14] != b'ack'):
+            continue
+
+        src = decode_ax25_address(ax25_payload[7:14])
+        if not src:
+            continue
+        to_call = ax25_payload[info + 1:info + 10].decode('ascii', errors='replace').strip()
+        msg_id = (
+            ax25_payload[info + 14:].split(b'{', 1)[0]
+            .rstrip(b'\r\n\x00')
+            .decode('ascii', errors='replace')
+            .strip()
+        )
+        acks.append(f"{src['full']} -> {to_call} (ID: {msg_id})")
+    return acks
 
 
 class DebugCommandHandler(CommandHandler):
@@ -54,7 +157,7 @@ class DebugCommandHandler(CommandHandler):
         decoded = decode_kiss_frame(frame.raw_bytes)
 
         # Format timestamp
-        time_str = frame.timestamp.strftime("%H:%M:%S.%f")[:-3]
+        time_str = frame.time_str
 
         # Use format_frame_detailed from frame_analyzer with HTML output
         lines = format_frame_detailed(
@@ -65,47 +168,40 @@ class DebugCommandHandler(CommandHandler):
             output_format='html'
         )
 
-        # Add console-specific device identification if APRS data is present
-        if decoded.get('aprs') and 'error' not in decoded:
-            aprs = decoded['aprs']
-            dest = decoded.get('ax25', {}).get('destination', {})
-            dest_call = dest.get('callsign') if dest else None
-
-            device_info = None
-            try:
-                device_id = get_device_identifier()
-
-                # Try to identify by tocall (destination address) for normal APRS
-                if dest_call:
-                    device_info = device_id.identify_by_tocall(dest_call)
-
-                # For MIC-E, try to identify by comment suffix
-                details = aprs.get('details', {})
-                if not device_info and aprs.get('type') == 'APRS MIC-E Position' and 'comment' in details:
-                    device_info = device_id.identify_by_mice(details.get('comment', ''))
-
-                if device_info:
-                    # Find where to insert (before hex dump)
-                    hex_dump_idx = None
-                    for i, line in enumerate(lines):
-                        if 'KISS Frame Hex Dump' in line or 'Hex Dump' in line:
-                            hex_dump_idx = i
-                            break
-
-                    # Build device info line
-                    device_line = f"  <yellow>Device:</yellow> {device_info['vendor']}"
-                    if device_info.get('model'):
-                        device_line += f" {device_info['model']}"
-                    if device_info.get('class'):
-                        device_line += f" ({device_info['class']})"
-
-                    # Insert before hex dump if found, otherwise at end
-                    if hex_dump_idx is not None:
-                        lines.insert(hex_dump_idx, device_line)
-                    else:
-                        lines.append(device_line)
-            except Exception:
-                pass
+        # Device identification only applies to decoded APRS frames
+        aprs = decoded.get('aprs')
+        if not aprs or 'error' in decoded:
+            return lines
+
+        dest = decoded.get('ax25', {}).get('destination', {})
+        dest_call = dest.get('callsign') if dest else None
+        device_id = get_device_identifier()
+
+        # Try to identify by tocall (destination address) for normal APRS
+        device_info = device_id.identify_by_tocall(dest_call) if dest_call else None
+
+        # For MIC-E, try to identify by comment suffix
+        details = aprs.get('details') or {}
+        if not device_info and aprs.get('type') == 'APRS MIC-E Position' and 'comment' in details:
+            device_info = device_id.identify_by_mice(details.get('comment', ''))
+
+        if not device_info:
+            return lines
+
+        # Build device info line
+        device_line = f"  <yellow>Device:</yellow> {sanitize_for_xml(device_info.vendor or '')}"
+        if device_info.model:
+            device_line += f" {sanitize_for_xml(device_info.model)}"
+        if device_info.class_type:
+            device_line += f" ({sanitize_for_xml(device_info.class_type)})"
+
+        # Insert before hex dump if found, otherwise at end
+        for i, line in enumerate(lines):
+            if 'Hex Dump' in getattr(line, 'value', line):
+                lines.insert(i, HTML(device_line))
+                break
+        else:
+            lines.append(HTML(device_line))
 
         return lines
 
@@ -129,31 +225,15 @@ class DebugCommandHandler(CommandHandler):
             debug dump detail watch     - Watch mode: live protocol analysis of incoming frames
         """
         if not args:
-            # Show current level and available levels
-            print_info(f"Current debug level: {constants.DEBUG_LEVEL}")
+            # Show current level and filters, then the static help text
+            lines = [f"Current debug level: {constants.DEBUG_LEVEL}"]
             if constants.DEBUG_STATION_FILTERS:
-                print_info("")
-                print_info("Active station filters:")
-                for call, level in sorted(constants.DEBUG_STATION_FILTERS.items()):
-                    print_info(f"  {call}: level {level}")
-            print_info("")
-            print_info("Debug levels:")
-            print_info("  0 = Off (no debug output)")
-            print_info("  1 = TNC monitor")
-            print_info("  2 = Critical errors and events")
-            print_info("  3 = Connection state changes")
-            print_info("  4 = Frame transmission/reception")
-            print_info("  5 = Protocol details, retransmissions")
-            print_info("  6 = Everything (BLE, config, hex dumps)")
-            print_info("")
-            print_info("Usage: debug <level>  or  debug <level> filter <callsign>")
-            print_info("       debug filter  or  debug filter clear")
-            print_info("       debug save")
-            print_info("       debug dump [n|-n|n-m] [brief|detail|watch]")
-            print_info("Example: debug 5 filter k1mal-7  (debug level 5 for K1MAL-7 only)")
-            print_info("         debug 2  (sets global level to 2, clears filters)")
-            print_info("         debug save  (save frame buffer to disk)")
-            print_info("         debug dump 5 brief  or  debug dump 3 detail")
+                lines.append("")
+                lines.append("Active station filters:")
+                for call, level in constants.DEBUG_STATION_FILTERS.items():
+                    lines.append(f"  {call}: level {level}")
+            lines.append("")
+            print_info("\n".join(lines) + "\n" + _DEBUG_HELP)
             return
 
         # Check for filter subcommand
@@ -181,7 +261,7 @@ class DebugCommandHandler(CommandHandler):
             # Check if this is a per-station filter (debug <level> filter <callsign>)
             if len(args) >= 3 and args[1].lower() == "filter":
                 callsign = args[2].upper().strip()
-                constants.DEBUG_STATION_FILTERS[callsign] = level
+                _set_station_filter(callsign, level)
                 print_info(f"Station filter set: {callsign} -> debug level {level}")
                 print_info(f"Global debug level remains: {constants.DEBUG_LEVEL}")
                 print_info("(Frames involving this station will use the higher level)")
@@ -222,7 +302,7 @@ class DebugCommandHandler(CommandHandler):
             # Show current filters
             if constants.DEBUG_STATION_FILTERS:
                 print_info("Active station filters:")
-                for call, level in sorted(constants.DEBUG_STATION_FILTERS.items()):
+                for call, level in constants.DEBUG_STATION_FILTERS.items():
                     print_info(f"  {call}: level {level}")
             else:
                 print_info("No station filters active")
@@ -244,13 +324,13 @@ class DebugCommandHandler(CommandHandler):
 
         # Show stats (access BUFFER_FILE from the instance's class)
         buffer_file = self.frame_history.BUFFER_FILE
-        if os.path.exists(buffer_file):
-            size = os.path.getsize(buffer_file)
-            size_kb = size / 1024
-            print_info(f"✓ Saved {len(self.frame_history.frames)} frames to {buffer_file}")
-            print_info(f"  File size: {size_kb:.1f} KB")
-        else:
+        try:
+            size_kb = os.stat(buffer_file).st_size / 1024
+        except FileNotFoundError:
             print_info("✓ Frame buffer saved")
+            return
+        print_info(f"✓ Saved {len(self.frame_history.frames)} frames to {buffer_file}")
+        print_info(f"  File size: {size_kb:.1f} KB")
 
     async def _debug_dump(self, args):
         """Dump frame history with various formats."""
@@ -258,67 +338,55 @@ class DebugCommandHandler(CommandHandler):
         count = None
         specific_frame = None
         frame_range = None  # (start, end) tuple for range
-        brief_mode = False
-        detail_mode = False
         watch_mode = False
         format_specified = None  # Track which format was specified
 
         # Parse arguments (count and/or brief/detail/watch)
         for arg in args:
-            if arg.lower() == "brief":
-                if format_specified == "detail":
-                    print_error("Cannot specify both 'brief' and 'detail'")
-                    return
-                brief_mode = True
-                detail_mode = False
-                format_specified = "brief"
-            elif arg.lower() == "detail":
-                if format_specified == "brief":
-                    print_error("Cannot specify both 'brief' and 'detail'")
-                    return
-                detail_mode = True
-                brief_mode = False
-                format_specified = "detail"
-            elif arg.lower() == "watch":
+            token = _MODE_TOKENS.get(arg.lower())
+            if token == "watch":
                 watch_mode = True
                 # If no format specified yet, default to detail for watch mode
-                if not format_specified:
-                    detail_mode = True
+                if format_specified is None:
                     format_specified = "detail"
-            else:
-                # Check if this is a range (e.g., "4-13")
-                if '-' in arg and not arg.startswith('-'):
-                    try:
-                        parts = arg.split('-')
-                        if len(parts) == 2:
-                            start = int(parts[0])
-                            end = int(parts[1])
-                            if start > 0 and end > 0 and start <= end:
-                                frame_range = (start, end)
-                            else:
-                                print_error("Range must be start-end where start <= end and both > 0")
-                                return
-                        else:
-                            print_error("Invalid range format (use start-end)")
-                            return
-                    except ValueError:
+            elif token is not None:
+                if format_specified is not None and format_specified != token:
+                    print_error("Cannot specify both 'brief' and 'detail'")
+                    return
+                format_specified = token
+            elif arg.isdecimal():
+                # Positive = specific frame number
+                specific_frame = int(arg)
+                if specific_frame == 0:
+                    print_error("Frame number must be non-zero")
+                    return
+            elif arg.startswith('-') and arg[1:].isdecimal():
+                # Negative = last n frames
+                count = int(arg[1:])
+                if count == 0:
+                    print_error("Frame number must be non-zero")
+                    return
+            elif '-' in arg and not arg.startswith('-'):
+                # Range (e.g., "4-13")
+                match = _RANGE_RE.match(arg)
+                if match is None:
+                    if arg.count('-') != 1:
+                        print_error("Invalid range format (use start-end)")
+                    else:
                         print_error(f"Invalid range: {arg}")
-                        return
+                    return
+                start, end = int(match.group(1)), int(match.group(2))
+                if start > 0 and end > 0 and start <= end:
+                    frame_range = (start, end)
                 else:
-                    try:
-                        num = int(arg)
-                        if num < 0:
-                            # Negative = last n frames
-                            count = abs(num)
-                        elif num > 0:
-                            # Positive = specific frame number
-                            specific_frame = num
-                        else:
-                            print_error("Frame number must be non-zero")
-                            return
-                    except ValueError:
-                        print_error(f"Unknown argument: {arg}")
-                        return
+                    print_error("Range must be start-end where start <= end and both > 0")
+                    return
+            else:
+                print_error(f"Unknown argument: {arg}")
+                return
+
+        brief_mode = format_specified == "brief"
+        detail_mode = format_specified == "detail"
 
         # Handle watch mode
         if watch_mode:
@@ -380,9 +448,6 @@ class DebugCommandHandler(CommandHandler):
                 f"Frame History - Detail ({header_suffix})"
             )
 
-            # Track ACKs
-            acks_found = []
-
             for frame in frames:
                 # Format frame with detailed analysis
                 detail_lines = self._format_detailed_frame(frame, frame.frame_number)
@@ -390,30 +455,12 @@ class DebugCommandHandler(CommandHandler):
                     print_pt(line)
                 print_pt("")  # Blank line between frames
 
-                # Check for ACKs
-                try:
-                    raw_bytes = frame.raw_bytes
-                    if len(raw_bytes) > 3:
-                        ax25_payload = raw_bytes[2:-1]
-                        # Quick check for APRS message
-                        if len(ax25_payload) > 20:
-                            # Extract info field (after addresses, control, pid)
-                            offset = 14
-                            while offset < len(ax25_payload) and not ax25_payload[offset - 1] & 0x01:
-                                offset += 7
-                            if offset + 2 < len(ax25_payload):
-                                info_bytes = ax25_payload[offset + 2:]
-                                info_str = info_bytes.decode('ascii', errors='replace').rstrip('\r\n\x00')
-                                if info_str.startswith(':') and len(info_str) >= 11:
-                                    message_text = info_str[11:]
-                                    if message_text.startswith('ack'):
-                                        src = decode_ax25_address(ax25_payload[7:14])
-                                        to_call = info_str[1:10].strip()
-                                        msg_id = message_text[3:].split('{')[0].strip()
-                                        if src:
-                                            acks_found.append(f"{src['full']} -> {to_call} (ID: {msg_id})")
-                except Exception:
-                    pass
+            # Summarize message ACKs seen in the dumped frames
+            acks_found = _find_acks(frames)
+            if acks_found:
+                print_info(f"Message ACKs in these frames ({len(acks_found)}):")
+                for ack in acks_found:
+                    print_info(f"  {ack}")
 
         elif brief_mode:
             # Brief mode - compact output
@@ -421,22 +468,20 @@ class DebugCommandHandler(CommandHandler):
                 f"Frame History - Brief ({header_suffix})"
             )
             for frame in frames:
-                time_str = frame.timestamp.strftime("%H:%M:%S.%f")[:-3]
-                direction_color = (
-                    "green" if frame.direction == "TX" else "cyan"
-                )
-                hex_str = frame.raw_bytes.hex()
-                print_pt(
-                    HTML(
-                        f"[{frame.frame_number}] <{direction_color}>{frame.direction}</{direction_color}> {time_str} ({len(frame.raw_bytes)}b): {hex_str}"
-                    )
-                )
+                template = _BRIEF_TEMPLATES.get(frame.direction, _BRIEF_TEMPLATES["RX"])
+                raw = frame.raw_bytes
+                print_pt(HTML(template.format(
+                    frame.frame_number,
+                    frame.time_str,
+                    len(raw),
+                    raw.hex()
+                )))
         else:
             # Verbose mode - hex editor style
             print_header(f"Frame History ({header_suffix})")
 
             for frame in frames:
-                time_str = frame.timestamp.strftime("%H:%M:%S.%f")[:-3]
+                time_str = frame.time_str
                 direction_color = (
                     "green" if frame.direction == "TX" else "cyan"
                 )
@@ -455,8 +500,8 @@ class DebugCommandHandler(CommandHandler):
     async def _debug_watch_mode(self):
         """Watch mode for debug dump - continuously display detailed protocol analysis for incoming frames."""
         print_header("Frame Watch Mode - Live Protocol Analysis")
-        print_pt(HTML("<yellow>Monitoring for incoming frames...</yellow>"))
-        print_pt(HTML("<gray>Press ESC or type '~~~' to exit</gray>"))
+        print_pt(_WATCH_BANNER)
+        print_pt(_WATCH_EXIT_HINT)
         print_pt("")
 
         # Track the last frame we've seen
@@ -516,7 +561,7 @@ class DebugCommandHandler(CommandHandler):
                 # Single prompt call - waits for user input (ESC or ~~~)
                 # This processes keyboard events (including ESC key binding)
                 line = await session.prompt_async(
-                    HTML("<gray>[Watching... type '~~~' or press ESC to exit]</gray> "),
+                    _WATCH_PROMPT,
                     key_bindings=kb
                 )
 
@@ -544,17 +589,12 @@ class DebugCommandHandler(CommandHandler):
             )
 
             # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+            await cancel_tasks(pending)
 
         except KeyboardInterrupt:
             pass
         finally:
             print_pt("")
-            print_pt(HTML("<yellow>Watch mode exited</yellow>"))
+            print_pt(_WATCH_EXITED)
             print_pt(HTML(f"<gray>Monitored {frame_counter} frame(s)</gray>"))
             print_pt("")
@@ -6,8 +6,8 @@ power management, and diagnostic utilities.
 """
 
 import asyncio
+import binascii
 import time
-from datetime import datetime, timezone
 from prompt_toolkit import HTML
 
 from .base import CommandHandler, command
@@ -19,6 +19,8 @@ from src.utils import (
     print_warning,
     print_debug,
     print_table_row,
+    build_table_row,
+    cancel_tasks,
 )
 from src.constants import (
     TNC_RX_UUID,
@@ -28,10 +30,129 @@ from src.constants import (
     TNC_TCP_PORT,
 )
 
+# GPS restarts requested within this many seconds of the previous one
+# finishing are skipped
+GPS_RESTART_DEBOUNCE = 0.5
+
+# Dual watch display names indexed by settings["double_channel"]
+_DUAL_STR = ("Off", "A+B", "B+A")
+
+# Byte translation table for hex dump ASCII columns (non-printables -> '.')
+_ASCII_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
+# Fixed STATUS/HEALTH lines, keyed by the boolean they display
+_STATUS_POWER = {
+    True: HTML("Power:         <green>ON</green>"),
+    False: HTML("Power:         <red>OFF</red>"),
+}
+_STATUS_TX = {
+    True: HTML("TX:            <red>TRANSMITTING</red>"),
+    False: HTML("TX:            <gray>Idle</gray>"),
+}
+_STATUS_RX = {
+    True: HTML("RX:            <green>RECEIVING</green>"),
+    False: HTML("RX:            <gray>Idle</gray>"),
+}
+_STATUS_SCAN = {
+    True: HTML("Scan:          <yellow>Active</yellow>"),
+    False: HTML("Scan:          <gray>Off</gray>"),
+}
+_HEALTH_BLE_CONNECTED = {
+    True: HTML("BLE Connected:     <green>Yes</green>"),
+    False: HTML("BLE Connected:     <red>No</red>"),
+}
+_HEALTH_SERIAL_MODE = HTML("Mode:              <green>Serial KISS TNC</green>")
+
+# SCAN_BLE characteristic annotations
+_HTML_RADIO_WRITE = HTML("    <green>→ RADIO_WRITE (commands)</green>")
+_HTML_RADIO_INDICATE = HTML("    <green>→ RADIO_INDICATE (responses)</green>")
+_HTML_TNC_TX = HTML("    <green>→ TNC_TX (TNC transmit)</green>")
+_HTML_TNC_RX = HTML("    <green>→ TNC_RX (TNC receive)</green>")
+_HTML_POTENTIAL_STREAM = HTML("    <cyan>→ Potential audio/data stream</cyan>")
+_KNOWN_UUIDS = {
+    RADIO_WRITE_UUID: _HTML_RADIO_WRITE,
+    RADIO_INDICATE_UUID: _HTML_RADIO_INDICATE,
+    TNC_TX_UUID: _HTML_TNC_TX,
+    TNC_RX_UUID: _HTML_TNC_RX,
+}
+
+# NOTIFICATIONS labels for the characteristics the console subscribes to
+_NOTIFY_UUID_LABELS = {
+    TNC_RX_UUID: "TNC RX UUID",
+    RADIO_INDICATE_UUID: "Radio indicate UUID",
+}
+
+
+# Body of a channel details block, filled from a decoded channel dict
+_CHANNEL_DETAILS = "\n".join((
+    "Name:      {name}",
+    "TX Freq:   {tx_freq_mhz:.4f} MHz",
+    "RX Freq:   {rx_freq_mhz:.4f} MHz",
+    "TX Tone:   {tx_tone}",
+    "RX Tone:   {rx_tone}",
+    "Power:     {power}",
+    "Bandwidth: {bandwidth}",
+    "",
+))
+
+# Accepted VFO names and DUAL/SCAN arguments
+_VFO_NAMES = frozenset(("a", "b"))
+_DUAL_MODES = {"off": 0, "ab": 1, "ba": 2}
+_SCAN_STATES = {"on": True, "off": False}
+
+
+def _parse_bounded_int(value, lo, hi, name):
+    """
+    Parse a command argument as an integer within lo..hi (inclusive).
+
+    Prints the error and returns None if the value is not a number or is
+    out of range.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        print_error(f"{name} must be a number {lo}-{hi}")
+        return None
+    if not lo <= number <= hi:
+        print_error(f"{name} must be {lo}-{hi}")
+        return None
+    return number
+
+
+def _decode_vfo_state(settings):
+    """
+    Work out the active VFO and dual watch mode from radio settings.
+
+    The active VFO follows double_channel when dual watch is on, and
+    falls back to vfo_x otherwise.
+
+    Args:
+        settings: Decoded settings dict from RadioController.get_settings()
+
+    Returns:
+        Tuple of (active_vfo, dual_str), e.g. ("A", "A+B")
+    """
+    mode = settings.get("double_channel")
+    if mode in (1, 2):
+        active_vfo = "A" if mode == 1 else "B"
+    else:
+        active_vfo = "A" if settings.get("vfo_x") in (None, 0) else "B"
+    dual_str = _DUAL_STR[mode] if mode in (0, 1, 2) else "Off"
+    return active_vfo, dual_str
+
 
 class RadioCommandHandler(CommandHandler):
     """Handles radio control and diagnostic commands."""
 
+    __slots__ = (
+        "cmd_processor",
+        "radio",
+        "serial_mode",
+        "_gps_monitor",
+        "_gps_restart_lock",
+        "_gps_last_restart",
+    )
+
     def __init__(self, cmd_processor):
         """
         Initialize radio command handler.
@@ -42,6 +163,10 @@ class RadioCommandHandler(CommandHandler):
         self.cmd_processor = cmd_processor
         self.radio = cmd_processor.radio
         self.serial_mode = cmd_processor.serial_mode
+        # src.console.gps_monitor, imported on first GPS restart
+        self._gps_monitor = None
+        self._gps_restart_lock = asyncio.Lock()
+        self._gps_last_restart = 0.0  # time.monotonic() of last GPS restart
         super().__init__()
 
     @command("STATUS",
@@ -51,65 +176,39 @@ class RadioCommandHandler(CommandHandler):
     async def status(self, args):
         """Show radio status."""
         print_info("Reading status...")
-        status = await self.radio.get_status()
-        settings = await self.radio.get_settings()
+        # Issue both reads at once; the radio's command lock keeps each
+        # reply paired with its request
+        status, settings = await asyncio.gather(
+            self.radio.get_status(),
+            self.radio.get_settings(),
+            return_exceptions=True,
+        )
+        if isinstance(settings, Exception):
+            print_error(f"Failed to read settings: {settings}")
+            settings = None
 
-        if status:
+        if isinstance(status, Exception):
+            print_error(f"Failed to read status: {status}")
+        elif status:
             print_header("Radio Status")
-            on_color = "green" if status["is_power_on"] else "red"
-            print_pt(
-                HTML(
-                    f"Power:         <{on_color}>{'ON' if status['is_power_on'] else 'OFF'}</{on_color}>"
-                )
-            )
-
-            tx_color = "red" if status["is_in_tx"] else "gray"
-            print_pt(
-                HTML(
-                    f"TX:            <{tx_color}>{'TRANSMITTING' if status['is_in_tx'] else 'Idle'}</{tx_color}>"
-                )
-            )
-
-            rx_color = "green" if status["is_in_rx"] else "gray"
-            print_pt(
-                HTML(
-                    f"RX:            <{rx_color}>{'RECEIVING' if status['is_in_rx'] else 'Idle'}</{rx_color}>"
-                )
-            )
-
-            scan_color = "yellow" if status["is_scan"] else "gray"
-            print_pt(
-                HTML(
-                    f"Scan:          <{scan_color}>{'Active' if status['is_scan'] else 'Off'}</{scan_color}>"
-                )
-            )
+            print_pt(_STATUS_POWER[bool(status["is_power_on"])])
+            print_pt(_STATUS_TX[bool(status["is_in_tx"])])
+            print_pt(_STATUS_RX[bool(status["is_in_rx"])])
+            print_pt(_STATUS_SCAN[bool(status["is_scan"])])
 
             # Add 1 to channel ID for display (radio uses 0-based internally, displays 1-based)
             print_pt(f"Channel:       {status['curr_ch_id'] + 1}")
             print_pt(f"RSSI:          {status['rssi']}/15")
 
             if settings:
-                # Prefer double_channel for active VFO selection when available
-                mode = settings.get("double_channel", None)
-                if mode is not None and mode in (1, 2):
-                    active_vfo = "A" if mode != 2 else "B"
-                else:
-                    vfo_x = settings.get("vfo_x", 0)
-                    active_vfo = "A" if vfo_x == 0 else "B"
+                active_vfo, dual_str = _decode_vfo_state(settings)
                 print_pt(f"Active VFO:    {active_vfo}")
-
-                dual_mode = settings.get("double_channel", 0)
-                dual_str = (
-                    "Off"
-                    if dual_mode == 0
-                    else "A+B" if dual_mode == 1 else "B+A"
-                )
                 print_pt(f"Dual Watch:    {dual_str}")
 
             # TNC status
-            idle_time = int(self.radio.get_tnc_idle_time())
+            diag = self.radio.snapshot_diagnostics()
             print_pt(
-                f"TNC Packets:   {self.radio.tnc_packet_count} ({idle_time}s idle)"
+                f"TNC Packets:   {diag.tnc_packets} ({diag.tnc_idle}s idle)"
             )
 
             # TNC Bridge status
@@ -141,17 +240,12 @@ class RadioCommandHandler(CommandHandler):
 
         # Check connection status (BLE mode only)
         if self.radio.client:
-            connected = self.radio.client.is_connected
-            conn_color = "green" if connected else "red"
-            print_pt(
-                HTML(
-                    f"BLE Connected:     <{conn_color}>{'Yes' if connected else 'No'}</{conn_color}>"
-                )
-            )
+            print_pt(_HEALTH_BLE_CONNECTED[bool(self.radio.client.is_connected)])
         else:
-            print_pt(HTML("Mode:              <green>Serial KISS TNC</green>"))
+            print_pt(_HEALTH_SERIAL_MODE)
 
-        idle_time = int(self.radio.get_tnc_idle_time())
+        diag = self.radio.snapshot_diagnostics()
+        idle_time = diag.tnc_idle
         idle_color = (
             "green"
             if idle_time < 60
@@ -163,13 +257,9 @@ class RadioCommandHandler(CommandHandler):
             )
         )
 
-        print_pt(f"TNC Packets RX:    {self.radio.tnc_packet_count}")
-        print_pt(f"Heartbeat Fails:   {self.radio.heartbeat_failures}")
-
-        hb_time = int(
-            (datetime.now(timezone.utc) - self.radio.last_heartbeat).total_seconds()
-        )
-        print_pt(f"Last Heartbeat:    {hb_time}s ago")
+        print_pt(f"TNC Packets RX:    {diag.tnc_packets}")
+        print_pt(f"Heartbeat Fails:   {diag.heartbeat_failures}")
+        print_pt(f"Last Heartbeat:    {diag.heartbeat_age}s ago")
 
         print_pt("")
         print_info("Running health check...")
@@ -196,16 +286,14 @@ class RadioCommandHandler(CommandHandler):
 
         try:
             # Check if notifications are still enabled
-            services = self.radio.client.services
+            services = list(self.radio.client.services)
 
             for service in services:
                 for char in service.characteristics:
-                    if char.uuid == TNC_RX_UUID:
-                        print_info(f"TNC RX UUID found: {char.uuid}")
-                        print_info(f"  Properties: {char.properties}")
-
-                    if char.uuid == RADIO_INDICATE_UUID:
-                        print_info(f"Radio indicate UUID found: {char.uuid}")
+                    uuid = char.uuid
+                    label = _NOTIFY_UUID_LABELS.get(uuid)
+                    if label:
+                        print_info(f"{label} found: {uuid}")
                         print_info(f"  Properties: {char.properties}")
 
             print_pt("")
@@ -234,11 +322,9 @@ class RadioCommandHandler(CommandHandler):
             # Print hex dump
             print_pt("Hex dump:")
             for i in range(0, len(data), 16):
-                chunk = data[i : i + 16]
-                hex_str = " ".join(f"{b:02x}" for b in chunk)
-                ascii_str = "".join(
-                    chr(b) if 32 <= b <= 126 else "." for b in chunk
-                )
+                chunk = bytes(data[i : i + 16])
+                hex_str = binascii.hexlify(chunk, b" ").decode("ascii")
+                ascii_str = chunk.translate(_ASCII_TABLE).decode("ascii")
                 print_pt(f"  {i:04x}: {hex_str:<48} {ascii_str}")
 
             print_pt(HTML(f"\n<yellow>Decoded VFO settings:</yellow>"))
@@ -263,46 +349,39 @@ class RadioCommandHandler(CommandHandler):
         if settings:
             print_header("VFO Configuration")
 
-            # Determine active VFO: prefer `double_channel` when present,
-            # otherwise fall back to `vfo_x`.
-            mode = settings.get("double_channel", None)
-            if mode is not None and mode in (1, 2):
-                active_vfo = "A" if mode != 2 else "B"
-            else:
-                vfo_x = settings.get("vfo_x", None)
-                active_vfo = "A" if (vfo_x is None or vfo_x == 0) else "B"
+            channel_a = settings["channel_a"]
+            channel_b = settings["channel_b"]
+            active_vfo, dual_str = _decode_vfo_state(settings)
             active_marker_a = "●" if active_vfo == "A" else "○"
             active_marker_b = "●" if active_vfo == "B" else "○"
 
             print_pt(
-                HTML(
-                    f"VFO A (Main):  {active_marker_a} Channel {settings['channel_a']}"
-                )
+                HTML(f"VFO A (Main):  {active_marker_a} Channel {channel_a}")
             )
             print_pt(
-                HTML(
-                    f"VFO B (Sub):   {active_marker_b} Channel {settings['channel_b']}"
-                )
+                HTML(f"VFO B (Sub):   {active_marker_b} Channel {channel_b}")
             )
 
-            mode = settings.get("double_channel", 0)
-            mode_str = "Off" if mode == 0 else "A+B" if mode == 1 else "B+A"
-            print_pt(f"Dual Watch:    {mode_str}")
+            print_pt(f"Dual Watch:    {dual_str}")
             print_pt(
                 f"Scan:          {'On' if settings.get('scan', False) else 'Off'}"
             )
             print_pt(f"Squelch:       {settings.get('squelch_level', 0)}")
             print_pt("")
 
-            print_info(f"Reading VFO A details (CH{settings['channel_a']})...")
-            ch_a = await self.radio.read_channel(settings["channel_a"])
-            if ch_a:
-                self._print_channel_details(ch_a)
-
-            print_info(f"Reading VFO B details (CH{settings['channel_b']})...")
-            ch_b = await self.radio.read_channel(settings["channel_b"])
-            if ch_b:
-                self._print_channel_details(ch_b)
+            print_info(
+                f"Reading VFO details (A: CH{channel_a}, B: CH{channel_b})..."
+            )
+            ch_a, ch_b = await asyncio.gather(
+                self.radio.read_channel(channel_a),
+                self.radio.read_channel(channel_b),
+                return_exceptions=True,
+            )
+            for label, channel in (("A", ch_a), ("B", ch_b)):
+                if isinstance(channel, Exception):
+                    print_error(f"Failed to read VFO {label} channel: {channel}")
+                elif channel:
+                    self._print_channel_details(channel)
         else:
             print_error("Failed to read VFO settings")
 
@@ -318,18 +397,12 @@ class RadioCommandHandler(CommandHandler):
             return
 
         vfo = args[0].lower()
-        if vfo not in ["a", "b"]:
+        if vfo not in _VFO_NAMES:
             print_error("VFO must be 'a' or 'b'")
             return
 
-        try:
-            channel_id = int(args[1])
-        except ValueError:
-            print_error("Channel ID must be a number")
-            return
-
-        if channel_id < 1 or channel_id > 256:
-            print_error("Channel ID must be 1-256")
+        channel_id = _parse_bounded_int(args[1], 1, 256, "Channel ID")
+        if channel_id is None:
             return
 
         print_info(f"Setting VFO {vfo.upper()} to channel {channel_id}...")
@@ -338,14 +411,17 @@ class RadioCommandHandler(CommandHandler):
         if success:
             print_info(f"✓ VFO {vfo.upper()} set to channel {channel_id}")
 
-            channel = await self.radio.read_channel(channel_id)
+            # The write invalidated the settings cache, so this is a fresh
+            # read-back from the radio
+            channel, settings = await asyncio.gather(
+                self.radio.read_channel(channel_id),
+                self.radio.get_settings(),
+            )
             if channel:
                 print_pt(
                     f"  {channel['name']}: {channel['tx_freq_mhz']:.4f} MHz"
                 )
 
-            await asyncio.sleep(0.3)
-            settings = await self.radio.get_settings()
             if settings:
                 actual_a = settings["channel_a"]
                 actual_b = settings["channel_b"]
@@ -364,7 +440,7 @@ class RadioCommandHandler(CommandHandler):
             return
 
         vfo = args[0].lower()
-        if vfo not in ["a", "b"]:
+        if vfo not in _VFO_NAMES:
             print_error("VFO must be 'a' or 'b'")
             return
 
@@ -387,13 +463,8 @@ class RadioCommandHandler(CommandHandler):
             return
 
         mode_str = args[0].lower()
-        if mode_str == "off":
-            mode = 0
-        elif mode_str == "ab":
-            mode = 1
-        elif mode_str == "ba":
-            mode = 2
-        else:
+        mode = _DUAL_MODES.get(mode_str)
+        if mode is None:
             print_error("Mode must be: off, ab, or ba")
             return
 
@@ -416,11 +487,8 @@ class RadioCommandHandler(CommandHandler):
             return
 
         state = args[0].lower()
-        if state == "on":
-            enabled = True
-        elif state == "off":
-            enabled = False
-        else:
+        enabled = _SCAN_STATES.get(state)
+        if enabled is None:
             print_error("State must be: on or off")
             return
 
@@ -442,14 +510,8 @@ class RadioCommandHandler(CommandHandler):
             print_error("Usage: squelch <0-15>")
             return
 
-        try:
-            level = int(args[0])
-        except ValueError:
-            print_error("Level must be a number 0-15")
-            return
-
-        if level < 0 or level > 15:
-            print_error("Level must be 0-15")
+        level = _parse_bounded_int(args[0], 0, 15, "Level")
+        if level is None:
             return
 
         print_info(f"Setting squelch to {level}...")
@@ -477,14 +539,8 @@ class RadioCommandHandler(CommandHandler):
             return
 
         # Set volume
-        try:
-            level = int(args[0])
-        except ValueError:
-            print_error("Level must be a number 0-15")
-            return
-
-        if level < 0 or level > 15:
-            print_error("Level must be 0-15")
+        level = _parse_bounded_int(args[0], 0, 15, "Level")
+        if level is None:
             return
 
         print_info(f"Setting volume to {level}...")
@@ -537,7 +593,8 @@ class RadioCommandHandler(CommandHandler):
         param = args[0].lower()
         value = " ".join(args[1:])
 
-        bss = await self.radio.get_bss_settings()
+        # Back-to-back SETBSS edits reuse the copy from the previous write
+        bss = await self.radio.get_bss_settings(use_cache=True)
         if not bss:
             print_error("Failed to read BSS settings")
             return
@@ -578,10 +635,8 @@ class RadioCommandHandler(CommandHandler):
             print_error("Usage: channel <id>")
             return
 
-        try:
-            channel_id = int(args[0])
-        except ValueError:
-            print_error("Channel ID must be a number")
+        channel_id = _parse_bounded_int(args[0], 1, 256, "Channel ID")
+        if channel_id is None:
             return
 
         print_info(f"Reading channel {channel_id}...")
@@ -601,15 +656,16 @@ class RadioCommandHandler(CommandHandler):
         if len(args) == 0:
             start = 1
             end = 30
-        elif len(args) == 1:
-            start = int(args[0])
-            end = start + 9
-        elif len(args) >= 2:
-            start = int(args[0])
-            end = int(args[1])
-
-        start = max(1, min(start, 256))
-        end = max(1, min(end, 256))
+        else:
+            start = _parse_bounded_int(args[0], 1, 256, "Start channel")
+            if start is None:
+                return
+            if len(args) == 1:
+                end = min(start + 9, 256)
+            else:
+                end = _parse_bounded_int(args[1], 1, 256, "End channel")
+                if end is None:
+                    return
 
         if start > end:
             print_error("Start channel must be <= end channel")
@@ -632,11 +688,12 @@ class RadioCommandHandler(CommandHandler):
             header=True,
         )
 
-        for ch_id in range(start, end + 1):
-            channel = await self.radio.read_channel(ch_id)
+        results = await self.radio.read_channel_range(start, end)
 
+        rows = []
+        for ch_id, channel in results:
             if channel:
-                print_table_row(
+                rows.append(build_table_row(
                     [
                         ch_id,
                         channel["name"][:12],
@@ -647,14 +704,14 @@ class RadioCommandHandler(CommandHandler):
                         channel["power"],
                     ],
                     widths,
-                )
+                ))
             else:
-                print_table_row(
+                rows.append(build_table_row(
                     [ch_id, "---", "---", "---", "---", "---", "---"], widths
-                )
-
-            await asyncio.sleep(0.05)
+                ))
 
+        # One write for the whole table instead of one per channel
+        print_pt("\n".join(rows))
         print_pt("")
 
     @command("POWER",
@@ -667,10 +724,8 @@ class RadioCommandHandler(CommandHandler):
             print_error("Usage: power <channel> <level>")
             return
 
-        try:
-            channel_id = int(args[0])
-        except ValueError:
-            print_error("Channel ID must be a number")
+        channel_id = _parse_bounded_int(args[0], 1, 256, "Channel ID")
+        if channel_id is None:
             return
 
         power_level = args[1].lower()
@@ -698,8 +753,11 @@ class RadioCommandHandler(CommandHandler):
             )
             return
 
+        channel_id = _parse_bounded_int(args[0], 1, 256, "Channel ID")
+        if channel_id is None:
+            return
+
         try:
-            channel_id = int(args[0])
             tx_freq = float(args[1])
             rx_freq = float(args[2])
         except ValueError:
@@ -739,7 +797,7 @@ class RadioCommandHandler(CommandHandler):
             return
 
         try:
-            services = self.radio.client.services
+            services = list(self.radio.client.services)
 
             for service in services:
                 print_pt(HTML(f"\n<b>Service:</b> {service.uuid}"))
@@ -756,33 +814,14 @@ class RadioCommandHandler(CommandHandler):
                     print_pt(f"    Properties: {props}")
 
                     # Check if this is a known UUID
-                    if char.uuid == RADIO_WRITE_UUID:
-                        print_pt(
-                            HTML("    <green>→ RADIO_WRITE (commands)</green>")
-                        )
-                    elif char.uuid == RADIO_INDICATE_UUID:
-                        print_pt(
-                            HTML(
-                                "    <green>→ RADIO_INDICATE (responses)</green>"
-                            )
-                        )
-                    elif char.uuid == TNC_TX_UUID:
-                        print_pt(
-                            HTML("    <green>→ TNC_TX (TNC transmit)</green>")
-                        )
-                    elif char.uuid == TNC_RX_UUID:
-                        print_pt(
-                            HTML("    <green>→ TNC_RX (TNC receive)</green>")
-                        )
+                    known = _KNOWN_UUIDS.get(char.uuid)
+                    if known:
+                        print_pt(known)
                     elif (
                         "notify" in char.properties
                         or "indicate" in char.properties
                     ):
-                        print_pt(
-                            HTML(
-                                "    <cyan>→ Potential audio/data stream</cyan>"
-                            )
-                        )
+                        print_pt(_HTML_POTENTIAL_STREAM)
 
                     # Show descriptors
                     if char.descriptors:
@@ -890,12 +929,12 @@ class RadioCommandHandler(CommandHandler):
             print_pt(HTML(f"Beacon:        <{beacon_color}>{beacon_status}</{beacon_color}>"))
 
             if beacon_enabled:
-                interval = cmd_proc.tnc_config.get("BEACON_INTERVAL") or "10"
+                interval = cmd_proc.tnc_config.get_or_default("BEACON_INTERVAL")
                 print_pt(f"Interval:      {interval} minutes")
 
-                if cmd_proc.last_beacon_time:
-                    elapsed = int((datetime.now(timezone.utc) - cmd_proc.last_beacon_time).total_seconds())
-                    print_pt(f"Last Beacon:   {elapsed}s ago")
+                elapsed = cmd_proc.beacon_elapsed()
+                if elapsed is not None:
+                    print_pt(f"Last Beacon:   {int(elapsed)}s ago")
 
         print_pt("")
         print_info("Use 'GPS RESTART' to restart GPS polling task")
@@ -905,72 +944,57 @@ class RadioCommandHandler(CommandHandler):
         """Restart the GPS polling task.
 
         This function resets the GPS communication state by:
-        1. Flushing stale responses from the BLE rx_queue
-        2. Cancelling the existing GPS polling task
+        1. Cancelling the existing GPS polling task
+        2. Flushing stale responses from the BLE rx_queue
         3. Creating a fresh GPS polling task
 
         Returns:
             bool: True if restart was successful, False otherwise
         """
-        try:
-            # Step 1: Flush stale GPS responses from rx_queue
-            # This clears any error responses that might be stuck in the queue
-            print_debug("Flushing rx_queue to clear stale GPS responses...", level=2)
-            flushed_count = 0
-            while not self.radio.rx_queue.empty():
-                try:
-                    _ = self.radio.rx_queue.get_nowait()
-                    flushed_count += 1
-                except asyncio.QueueEmpty:
-                    break
-
-            if flushed_count > 0:
-                print_debug(f"Flushed {flushed_count} stale response(s) from queue", level=2)
-
-            # Step 2: Find and cancel the existing GPS task
-            if hasattr(self.radio, 'background_tasks'):
-                for task in self.radio.background_tasks:
-                    # Check if this is the GPS task by examining its coroutine name
-                    # Note: Accessing _coro.cr_code.co_name is implementation-dependent
-                    # and may need adjustment in future Python versions
-                    if hasattr(task, '_coro') and hasattr(task._coro, 'cr_code'):
-                        if 'gps_monitor' in task._coro.cr_code.co_name:
-                            print_debug("Cancelling existing GPS task...", level=2)
-                            task.cancel()
-                            try:
-                                await task
-                            except asyncio.CancelledError:
-                                pass
-                            # Remove from background tasks list
-                            self.radio.background_tasks.remove(task)
-                            break
-
-            # Step 3: Import gps_monitor here to avoid circular import
+        if self._gps_monitor is None:
+            # Imported here to avoid circular import
             # (console.py imports RadioCommandHandler from this module)
             from src.console import gps_monitor
+            self._gps_monitor = gps_monitor
+
+        # Serialize restarts; a restart requested while another was running,
+        # or just after one finished, is already satisfied by it
+        async with self._gps_restart_lock:
+            if time.monotonic() - self._gps_last_restart < GPS_RESTART_DEBOUNCE:
+                print_debug("GPS task was just restarted, skipping", level=2)
+                return True
+
+            try:
+                # Step 1: Cancel the existing GPS task first, so it can no longer
+                # send requests or take replies while the queue is flushed
+                old_task = self.radio.named_background_tasks.pop("gps_monitor", None)
+                if old_task:
+                    print_debug("Cancelling existing GPS task...", level=2)
+                    await cancel_tasks([old_task])
+
+                # Step 2: Flush stale GPS responses from rx_queue
+                # This clears any error responses that might be stuck in the queue
+                print_debug("Flushing rx_queue to clear stale GPS responses...", level=2)
+                flushed_count = self.radio.drain_rx_queue()
+
+                if flushed_count > 0:
+                    print_debug(f"Flushed {flushed_count} stale response(s) from queue", level=2)
+
+                # Step 3: Create new GPS task with clean state
+                self.radio.start_background_task(
+                    self._gps_monitor(self.radio), name="gps_monitor"
+                )
 
-            # Step 4: Create new GPS task with clean state
-            new_task = asyncio.create_task(gps_monitor(self.radio))
-
-            # Add to background tasks if the list exists
-            if hasattr(self.radio, 'background_tasks'):
-                self.radio.background_tasks.append(new_task)
-
-            print_debug("New GPS task created with flushed queue", level=2)
-            return True
+                print_debug("New GPS task created with flushed queue", level=2)
+                # Only a restart that started a task debounces the next one
+                self._gps_last_restart = time.monotonic()
+                return True
 
-        except Exception as e:
-            print_error(f"Error restarting GPS task: {e}")
-            return False
+            except Exception as e:
+                print_error(f"Error restarting GPS task: {e}")
+                return False
 
     def _print_channel_details(self, channel):
         """Print formatted channel details."""
         print_header(f"Channel {channel['id']}")
-        print_pt(f"Name:      {channel['name']}")
-        print_pt(f"TX Freq:   {channel['tx_freq_mhz']:.4f} MHz")
-        print_pt(f"RX Freq:   {channel['rx_freq_mhz']:.4f} MHz")
-        print_pt(f"TX Tone:   {channel['tx_tone']}")
-        print_pt(f"RX Tone:   {channel['rx_tone']}")
-        print_pt(f"Power:     {channel['power']}")
-        print_pt(f"Bandwidth: {channel['bandwidth']}")
-        print_pt("")
+        print_pt(_CHANNEL_DETAILS.format_map(channel))
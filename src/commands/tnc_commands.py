@@ -6,14 +6,53 @@ configuration, and protocol parameters.
 """
 
 from .base import CommandHandler, command
-from src.utils import print_pt, print_info, print_error, print_debug
+from src.utils import print_pt, print_info, print_error, print_warning, print_debug, cancel_tasks
 from prompt_toolkit import HTML
 import asyncio
+import re
+
+
+# Parameters shown by DISPLAY (prevents stray entries from showing)
+_DISPLAY_PARAMS = frozenset((
+    # Identity
+    'MYCALL', 'MYALIAS', 'MYLOCATION', 'RADIO_MAC',
+    # Protocol
+    'UNPROTO', 'MONITOR', 'TXDELAY', 'DEBUGFRAMES',
+    # APRS Messaging
+    'AUTO_ACK', 'RETRY', 'RETRY_FAST', 'RETRY_SLOW',
+    # Beaconing
+    'BEACON', 'BEACON_INTERVAL', 'BEACON_PATH',
+    'BEACON_SYMBOL', 'BEACON_COMMENT', 'LAST_BEACON',
+    # Digipeater
+    'DIGIPEAT',
+    # Debug
+    'DEBUG_BUFFER',
+    # Server Ports
+    'AGWPE_HOST', 'AGWPE_PORT', 'TNC_HOST', 'TNC_PORT',
+    'WEBUI_HOST', 'WEBUI_PORT', 'WEBUI_PASSWORD',
+    # Weather Station
+    'WX_ENABLE', 'WX_BACKEND', 'WX_ADDRESS', 'WX_PORT',
+    'WX_INTERVAL', 'WX_AVERAGE_WIND', 'WXTREND',
+))
+
+_ON_OFF = frozenset(("ON", "OFF"))
+_DIGIPEATER_MODES = frozenset(("ON", "OFF", "SELF"))
+
+# Unsigned decimal number, e.g. "10" or "2.5"
+_DECIMAL_RE = re.compile(r"^\d+(\.\d+)?$", re.ASCII)
+
+_DISPLAY_HEADER = HTML("<cyan><b>TNC Parameters:</b></cyan>")
+_RECENT_FRAMES_HEADER = HTML("<cyan><b>Recent Frames:</b></cyan>")
+_CONV_TEXT_HINT = HTML(
+    "<gray>Type text to send, type '~~~' to return to command mode</gray>"
+)
 
 
 class TNCCommandHandler(CommandHandler):
     """Handles TNC-2 protocol commands."""
 
+    __slots__ = ("cmd_processor", "tnc_config", "ax25", "radio", "_frame_history")
+
     def __init__(self, cmd_processor):
         """
         Initialize TNC command handler.
@@ -25,6 +64,7 @@ class TNCCommandHandler(CommandHandler):
         self.tnc_config = cmd_processor.tnc_config
         self.ax25 = cmd_processor.ax25
         self.radio = cmd_processor.radio
+        self._frame_history = getattr(cmd_processor, 'frame_history', None)
         super().__init__()
 
     @command("CONNECT", "C",
@@ -61,12 +101,12 @@ class TNCCommandHandler(CommandHandler):
         self.cmd_processor.tnc_conversation_mode = True
         if self.cmd_processor.tnc_connected_to:
             print_info(f"Entering conversation mode with {self.cmd_processor.tnc_connected_to}")
-            print_pt(HTML("<gray>Type text to send, type '~~~' to return to command mode</gray>"))
+            print_pt(_CONV_TEXT_HINT)
         else:
             print_info("Entering conversation mode - will send UI frames to UNPROTO address")
             unproto = self.tnc_config.get("UNPROTO")
             print_pt(HTML(f"<gray>UNPROTO: {unproto}</gray>"))
-            print_pt(HTML("<gray>Type text to send, type '~~~' to return to command mode</gray>"))
+            print_pt(_CONV_TEXT_HINT)
 
     @command("MYCALL",
              help_text="Display or set station callsign",
@@ -212,6 +252,9 @@ class TNCCommandHandler(CommandHandler):
             return
 
         value = args[0].upper()
+        if value not in _ON_OFF:
+            print_error("Usage: MONITOR [ON|OFF]")
+            return
         self.tnc_config.set("MONITOR", value)
         print_info(f"MONITOR set to {value}")
 
@@ -227,6 +270,9 @@ class TNCCommandHandler(CommandHandler):
             return
 
         value = args[0].upper()
+        if value not in _ON_OFF:
+            print_error("Usage: AUTO_ACK [ON|OFF]")
+            return
         self.tnc_config.set("AUTO_ACK", value)
         print_info(f"AUTO_ACK set to {value}")
 
@@ -237,9 +283,9 @@ class TNCCommandHandler(CommandHandler):
     async def retry(self, args):
         """Set number of message retry attempts."""
         if not args:
-            count = self.tnc_config.get("RETRY") or "3"
-            fast = self.tnc_config.get("RETRY_FAST") or "30"
-            slow = self.tnc_config.get("RETRY_SLOW") or "300"
+            count = self.tnc_config.get_or_default("RETRY")
+            fast = self.tnc_config.get_or_default("RETRY_FAST")
+            slow = self.tnc_config.get_or_default("RETRY_SLOW")
             print_pt(f"RETRY: {count}")
             print_pt(f"RETRY_FAST: {fast} seconds")
             print_pt(f"RETRY_SLOW: {slow} seconds")
@@ -249,15 +295,15 @@ class TNCCommandHandler(CommandHandler):
             print_pt(f"  Retries 2-{count}: RETRY_SLOW seconds each")
             return
 
-        try:
-            count = int(args[0])
-            if count < 0 or count > 10:
-                print_error("Retry count must be 0-10")
-                return
-            self.tnc_config.set("RETRY", str(count))
-            print_info(f"Message retry count set to {count}")
-        except ValueError:
+        if not args[0].isdecimal():
             print_error("RETRY must be a number")
+            return
+        count = int(args[0])
+        if count > 10:
+            print_error("Retry count must be 0-10")
+            return
+        self.tnc_config.set("RETRY", str(count))
+        print_info(f"Message retry count set to {count}")
 
     @command("RETRY_FAST",
              help_text="Set first retry timeout (seconds)",
@@ -266,21 +312,21 @@ class TNCCommandHandler(CommandHandler):
     async def retry_fast(self, args):
         """Set timeout for first retry attempt."""
         if not args:
-            timeout = self.tnc_config.get("RETRY_FAST") or "30"
+            timeout = self.tnc_config.get_or_default("RETRY_FAST")
             print_pt(f"RETRY_FAST: {timeout} seconds")
             print_pt("")
             print_pt("First retry timeout after sending message.")
             return
 
-        try:
-            timeout = int(args[0])
-            if timeout < 5 or timeout > 300:
-                print_error("RETRY_FAST must be 5-300 seconds")
-                return
-            self.tnc_config.set("RETRY_FAST", str(timeout))
-            print_info(f"Fast retry timeout set to {timeout} seconds")
-        except ValueError:
+        if not args[0].isdecimal():
             print_error("RETRY_FAST must be a number")
+            return
+        timeout = int(args[0])
+        if timeout < 5 or timeout > 300:
+            print_error("RETRY_FAST must be 5-300 seconds")
+            return
+        self.tnc_config.set("RETRY_FAST", str(timeout))
+        print_info(f"Fast retry timeout set to {timeout} seconds")
 
     @command("RETRY_SLOW",
              help_text="Set subsequent retry timeout (seconds)",
@@ -289,21 +335,21 @@ class TNCCommandHandler(CommandHandler):
     async def retry_slow(self, args):
         """Set timeout for subsequent retry attempts."""
         if not args:
-            timeout = self.tnc_config.get("RETRY_SLOW") or "300"
+            timeout = self.tnc_config.get_or_default("RETRY_SLOW")
             print_pt(f"RETRY_SLOW: {timeout} seconds")
             print_pt("")
             print_pt("Subsequent retry timeout after first retry.")
             return
 
-        try:
-            timeout = int(args[0])
-            if timeout < 30 or timeout > 3600:
-                print_error("RETRY_SLOW must be 30-3600 seconds")
-                return
-            self.tnc_config.set("RETRY_SLOW", str(timeout))
-            print_info(f"Slow retry timeout set to {timeout} seconds")
-        except ValueError:
+        if not args[0].isdecimal():
             print_error("RETRY_SLOW must be a number")
+            return
+        timeout = int(args[0])
+        if timeout < 30 or timeout > 3600:
+            print_error("RETRY_SLOW must be 30-3600 seconds")
+            return
+        self.tnc_config.set("RETRY_SLOW", str(timeout))
+        print_info(f"Slow retry timeout set to {timeout} seconds")
 
     @command("DEBUG_BUFFER",
              help_text="Frame buffer debugging control",
@@ -312,66 +358,84 @@ class TNCCommandHandler(CommandHandler):
     async def debug_buffer(self, args):
         """Control frame buffer debugging."""
         if not args:
-            enabled = self.tnc_config.get("DEBUG_BUFFER") or "OFF"
+            enabled = self.tnc_config.get_or_default("DEBUG_BUFFER")
             size = self.tnc_config.get("DEBUG_BUFFER_SIZE") or "10"
             print_pt(f"DEBUG_BUFFER: {enabled}")
             print_pt(f"DEBUG_BUFFER_SIZE: {size} MB")
-            if hasattr(self.cmd_processor, 'frame_history'):
-                count = len(self.cmd_processor.frame_history.frames)
+            if self._frame_history is not None:
+                count = len(self._frame_history.frames)
                 print_pt(f"Current buffer: {count} frames")
             return
 
-        subcmd = args[0].upper()
-
-        if subcmd in ("ON", "OFF"):
-            self.tnc_config.set("DEBUG_BUFFER", subcmd)
-            print_info(f"DEBUG_BUFFER set to {subcmd}")
-
-        elif subcmd == "SIZE":
-            if len(args) < 2:
-                print_error("Usage: DEBUG_BUFFER SIZE <mb>")
-                return
-            try:
-                size_mb = float(args[1])
-                if size_mb < 1 or size_mb > 100:
-                    print_error("Size must be 1-100 MB")
-                    return
-                self.tnc_config.set("DEBUG_BUFFER_SIZE", str(size_mb))
-                print_info(f"Buffer size set to {size_mb} MB")
-            except ValueError:
-                print_error("Size must be a number")
-
-        elif subcmd == "DUMP":
-            if hasattr(self.cmd_processor, 'frame_history'):
-                await self.cmd_processor.frame_history.save()
-                print_info("Frame buffer saved to ~/.console_frame_buffer.json.gz")
-            else:
-                print_error("Frame buffer not initialized")
+        handler = self._DEBUG_BUFFER_SUBCOMMANDS.get(args[0].upper())
+        if handler is None:
+            print_error("Usage: DEBUG_BUFFER [ON|OFF|SIZE <mb>|DUMP|CLEAR|LIST]")
+            return
+        await handler(self, args)
 
-        elif subcmd == "CLEAR":
-            if hasattr(self.cmd_processor, 'frame_history'):
-                self.cmd_processor.frame_history.clear()
-                print_info("Frame buffer cleared")
-            else:
-                print_error("Frame buffer not initialized")
-
-        elif subcmd == "LIST":
-            if hasattr(self.cmd_processor, 'frame_history'):
-                recent = self.cmd_processor.frame_history.get_recent(20)
-                if not recent:
-                    print_info("Frame buffer is empty")
-                    return
-                print_pt(HTML("<cyan><b>Recent Frames:</b></cyan>"))
-                for frame in recent:
-                    timestamp = frame.timestamp.strftime("%H:%M:%S.%f")[:-3]
-                    direction = frame.direction
-                    size = len(frame.raw_bytes)
-                    print_pt(f"  [{frame.frame_number}] {direction} {timestamp} ({size}b)")
-            else:
-                print_error("Frame buffer not initialized")
+    async def _debug_buffer_on_off(self, args):
+        """DEBUG_BUFFER ON|OFF"""
+        value = args[0].upper()
+        self.tnc_config.set("DEBUG_BUFFER", value)
+        print_info(f"DEBUG_BUFFER set to {value}")
+
+    async def _debug_buffer_size(self, args):
+        """DEBUG_BUFFER SIZE <mb>"""
+        if len(args) < 2:
+            print_error("Usage: DEBUG_BUFFER SIZE <mb>")
+            return
+        if not _DECIMAL_RE.match(args[1]):
+            print_error("Size must be a number")
+            return
+        size_mb = float(args[1])
+        if size_mb < 1 or size_mb > 100:
+            print_error("Size must be 1-100 MB")
+            return
+        self.tnc_config.set("DEBUG_BUFFER_SIZE", str(size_mb))
+        print_info(f"Buffer size set to {size_mb} MB")
+
+    async def _debug_buffer_dump(self, args):
+        """DEBUG_BUFFER DUMP"""
+        if self._frame_history is not None:
+            await self._frame_history.save_to_disk_async()
+            print_info("Frame buffer saved to ~/.console_frame_buffer.json.gz")
+        else:
+            print_error("Frame buffer not initialized")
 
+    async def _debug_buffer_clear(self, args):
+        """DEBUG_BUFFER CLEAR"""
+        if self._frame_history is not None:
+            self._frame_history.clear()
+            print_info("Frame buffer cleared")
         else:
-            print_error("Usage: DEBUG_BUFFER [ON|OFF|SIZE <mb>|DUMP|CLEAR|LIST]")
+            print_error("Frame buffer not initialized")
+
+    async def _debug_buffer_list(self, args):
+        """DEBUG_BUFFER LIST"""
+        if self._frame_history is None:
+            print_error("Frame buffer not initialized")
+            return
+        recent = self._frame_history.get_recent(20)
+        if not recent:
+            print_info("Frame buffer is empty")
+            return
+        lines = []
+        for frame in recent:
+            lines.append(
+                f"  [{frame.frame_number}] {frame.direction} {frame.time_str} ({len(frame.raw_bytes)}b)"
+            )
+        print_pt(_RECENT_FRAMES_HEADER)
+        print_pt("\n".join(lines))
+
+    # DEBUG_BUFFER subcommand -> handler (plain functions, called with self)
+    _DEBUG_BUFFER_SUBCOMMANDS = {
+        "ON": _debug_buffer_on_off,
+        "OFF": _debug_buffer_on_off,
+        "SIZE": _debug_buffer_size,
+        "DUMP": _debug_buffer_dump,
+        "CLEAR": _debug_buffer_clear,
+        "LIST": _debug_buffer_list,
+    }
 
     @command("DIGIPEATER", "DIGI",
              help_text="Toggle digipeater mode",
@@ -386,7 +450,7 @@ class TNCCommandHandler(CommandHandler):
           SELF - Only digipeat packets from your callsign (any SSID)
         """
         if not args:
-            current = self.tnc_config.get("DIGIPEAT") or "OFF"
+            current = self.tnc_config.get_or_default("DIGIPEAT")
             print_pt(f"DIGIPEATER: {current}")
             print_pt("")
             print_pt("Modes:")
@@ -399,7 +463,7 @@ class TNCCommandHandler(CommandHandler):
             return
 
         value = args[0].upper()
-        if value not in ("ON", "OFF", "SELF"):
+        if value not in _DIGIPEATER_MODES:
             print_error("Usage: DIGIPEATER [ON|OFF|SELF]")
             return
 
@@ -415,35 +479,14 @@ class TNCCommandHandler(CommandHandler):
              category="config")
     async def display(self, args):
         """Display all TNC configuration parameters."""
-        # Whitelist of valid parameters (prevent stray entries from showing)
-        VALID_PARAMS = {
-            # Identity
-            'MYCALL', 'MYALIAS', 'MYLOCATION', 'RADIO_MAC',
-            # Protocol
-            'UNPROTO', 'MONITOR', 'TXDELAY', 'DEBUGFRAMES',
-            # APRS Messaging
-            'AUTO_ACK', 'RETRY', 'RETRY_FAST', 'RETRY_SLOW',
-            # Beaconing
-            'BEACON', 'BEACON_INTERVAL', 'BEACON_PATH',
-            'BEACON_SYMBOL', 'BEACON_COMMENT', 'LAST_BEACON',
-            # Digipeater
-            'DIGIPEAT',
-            # Debug
-            'DEBUG_BUFFER',
-            # Server Ports
-            'AGWPE_HOST', 'AGWPE_PORT', 'TNC_HOST', 'TNC_PORT',
-            'WEBUI_HOST', 'WEBUI_PORT', 'WEBUI_PASSWORD',
-            # Weather Station
-            'WX_ENABLE', 'WX_BACKEND', 'WX_ADDRESS', 'WX_PORT',
-            'WX_INTERVAL', 'WX_AVERAGE_WIND', 'WXTREND',
-        }
-
-        print_pt(HTML("<cyan><b>TNC Parameters:</b></cyan>"))
-        for key in sorted(self.tnc_config.settings.keys()):
-            if key not in VALID_PARAMS:
-                continue  # Skip invalid/deprecated parameters
-            value = self.tnc_config.get(key)
-            print_pt(f"  {key:20s} {value}")
+        # Settings are kept in grouped DEFAULTS order, so no sorting needed
+        lines = [
+            f"  {key:20s} {value}"
+            for key, value in self.tnc_config.settings.items()
+            if key in _DISPLAY_PARAMS  # Skip invalid/deprecated parameters
+        ]
+        print_pt(_DISPLAY_HEADER)
+        print_pt("\n".join(lines))
 
     @command("STATUS",
              help_text="Display TNC status",
@@ -491,8 +534,10 @@ class TNCCommandHandler(CommandHandler):
         # Send hardware reset command
         try:
             await self.radio.reset_radio()
-            await asyncio.sleep(2.0)
-            print_info("Radio hardware reset complete")
+            if await self.radio.wait_ready():
+                print_info("Radio hardware reset complete")
+            else:
+                print_warning("Radio did not report ON within 2 s after reset")
         except Exception as e:
             print_error(f"Hardware reset failed: {e}")
 
@@ -510,22 +555,22 @@ class TNCCommandHandler(CommandHandler):
             # Stop TX worker
             if self.ax25 and self.ax25._tx_task:
                 print_debug("Stopping TX worker...", level=1)
-                self.ax25._tx_task.cancel()
-                try:
-                    await self.ax25._tx_task
-                except asyncio.CancelledError:
-                    pass
+                await cancel_tasks([self.ax25._tx_task])
                 self.ax25._tx_task = None
 
             # Power OFF the radio
             print_info("  Turning radio OFF...")
             await self.radio.set_hardware_power(False)
-            await asyncio.sleep(2.0)
+            powered_off = await self.radio.wait_ready(powered=False)
+            if not powered_off:
+                print_warning("Radio did not report OFF within 2 s")
 
             # Power ON the radio
             print_info("  Turning radio ON...")
             await self.radio.set_hardware_power(True)
-            await asyncio.sleep(2.0)
+            powered_on = await self.radio.wait_ready()
+            if not powered_on:
+                print_warning("Radio did not report ON within 2 s")
 
             # Reset adapter state
             if self.ax25:
@@ -535,7 +580,10 @@ class TNCCommandHandler(CommandHandler):
                 print_debug("Restarting TX worker...", level=4)
                 self.ax25._tx_task = asyncio.create_task(self.ax25._tx_worker())
 
-            print_info("Power cycle complete - TNC should be fully reset")
+            if powered_off and powered_on:
+                print_info("Power cycle complete - TNC should be fully reset")
+            else:
+                print_warning("Power cycle finished, but the radio's power state was not confirmed")
         except Exception as e:
             print_error(f"Power cycle failed: {e}")
 
@@ -550,7 +598,9 @@ class TNCCommandHandler(CommandHandler):
             print_error("Example: tncsend c000c0")
             return
 
-        hex_str = "".join(args).replace(" ", "")
+        # Arguments are already whitespace-split, so joining them removes
+        # all spacing; a hex dump pasted as "c0 00 c0" is accepted as-is
+        hex_str = "".join(args)
 
         try:
             data = bytes.fromhex(hex_str)
@@ -4,11 +4,68 @@ Weather station command handlers.
 Handles configuration of weather station integration for APRS beaconing.
 """
 
+import functools
+
 from .base import CommandHandler, command
 from src.utils import print_pt, print_info, print_error, print_header
 from src.weather_manager import WeatherStationManager
 
 
+_ON_OFF = frozenset(("ON", "OFF"))
+
+# Static help text printed below the current value by the no-argument
+# forms of WX_AVERAGE_WIND and WXTREND (one print_pt call each)
+_WX_AVG_WIND_HELP = "\n".join((
+    "",
+    "Wind averaging for beacons:",
+    "  ON  - Average wind speed over beacon interval (recommended)",
+    "  OFF - Use instantaneous wind reading",
+))
+
+_WXTREND_HELP = "\n".join((
+    "",
+    "Pressure tendency threshold for Zambretti weather forecasting:",
+    "  - Determines when pressure is 'rising', 'falling', or 'steady'",
+    "  - Higher values = less sensitive (fewer weather change predictions)",
+    "  - Lower values = more sensitive (more weather change predictions)",
+    "",
+    "Recommended values:",
+    "  0.17 - WMO/NOAA standard (0.5 mb in 3 hours)",
+    "  0.30 - Default (conservative, fewer false alarms)",
+    "  0.50 - Very conservative",
+))
+
+# Shown by PWS when the station is not yet configured
+_PWS_CONFIG_HINT = "\n".join((
+    "\nConfiguration:",
+    "  WX_BACKEND <ecowitt|davis|...>",
+    "  WX_ADDRESS <IP or serial port>",
+    "  WX_ENABLE ON",
+))
+
+# PWS SHOW rows: (label, WeatherData attribute, format). A row is shown only
+# when its attribute is not None; formats get the value and d=WeatherData.
+_PWS_SHOW_FIELDS = (
+    ("Outdoor Temperature", "temperature_outdoor", "{:.1f}°F"),
+    ("Indoor Temperature", "temperature_indoor", "{:.1f}°F"),
+    ("Dew Point", "dew_point", "{:.1f}°F"),
+    ("Outdoor Humidity", "humidity_outdoor", "{}%"),
+    ("Pressure", "pressure_relative", "{:.2f} mb"),
+    ("Wind", "wind_speed", "{:.1f} mph @ {d.wind_direction}°"),
+    ("Gust", "wind_gust", "{:.1f} mph"),
+    ("Rain (24h)", "rain_daily", "{:.2f} in"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _backend_list():
+    """Return the "Available backends" listing (BACKENDS is static)."""
+    return "\n".join(
+        f"  {backend_id:12} - {info['description']}"
+        for backend_id, info in WeatherStationManager.list_backends().items()
+    )
+
+
 class WeatherCommandHandler(CommandHandler):
     """Handles weather station configuration commands."""
 
@@ -21,7 +78,8 @@ class WeatherCommandHandler(CommandHandler):
         """
         self.cmd_processor = cmd_processor
         self.tnc_config = cmd_processor.tnc_config
-        self.weather_manager = cmd_processor.weather_manager
+        self.weather_manager = getattr(cmd_processor, 'weather_manager', None)
+        self._weather_available = self.weather_manager is not None
         super().__init__()
 
     @command("WX_ENABLE",
@@ -36,7 +94,7 @@ class WeatherCommandHandler(CommandHandler):
             return
 
         value = args[0].upper()
-        if value not in ["ON", "OFF"]:
+        if value not in _ON_OFF:
             print_error("Usage: WX_ENABLE <ON|OFF>")
             return
 
@@ -64,8 +122,7 @@ class WeatherCommandHandler(CommandHandler):
             print_pt(f"WX_BACKEND: {backend}")
             print_pt("")
             print_pt("Available backends:")
-            for backend_id, info in WeatherStationManager.list_backends().items():
-                print_pt(f"  {backend_id:12} - {info['description']}")
+            print_pt(_backend_list())
             return
 
         backend = args[0].lower()
@@ -100,13 +157,15 @@ class WeatherCommandHandler(CommandHandler):
             print_pt(f"WX_PORT: {port or '(auto)'}")
             return
 
-        try:
-            port = int(args[0])
-            if self.weather_manager.configure(port=port):
-                self.tnc_config.set("WX_PORT", str(port))
-                print_info(f"WX_PORT set to {port}")
-        except ValueError:
+        value = args[0]
+        if not value.isdecimal():
             print_error("WX_PORT must be a number (1-65535)")
+            return
+
+        # configure() range-checks and reports out-of-range values
+        if self.weather_manager.configure(port=int(value)):
+            self.tnc_config.set("WX_PORT", value)
+            print_info(f"WX_PORT set to {value}")
 
     @command("WX_INTERVAL",
              help_text="Set weather update interval (seconds)",
@@ -119,13 +178,15 @@ class WeatherCommandHandler(CommandHandler):
             print_pt(f"WX_INTERVAL: {interval} seconds")
             return
 
-        try:
-            interval = int(args[0])
-            if self.weather_manager.configure(update_interval=interval):
-                self.tnc_config.set("WX_INTERVAL", str(interval))
-                print_info(f"WX_INTERVAL set to {interval} seconds")
-        except ValueError:
+        value = args[0]
+        if not value.isdecimal():
             print_error("WX_INTERVAL must be a number (30-3600)")
+            return
+
+        # configure() range-checks and reports out-of-range values
+        if self.weather_manager.configure(update_interval=int(value)):
+            self.tnc_config.set("WX_INTERVAL", value)
+            print_info(f"WX_INTERVAL set to {value} seconds")
 
     @command("WX_AVERAGE_WIND",
              help_text="Enable/disable wind speed averaging",
@@ -135,15 +196,11 @@ class WeatherCommandHandler(CommandHandler):
         """Enable or disable wind speed averaging for beacons."""
         if not args:
             status = self.tnc_config.get("WX_AVERAGE_WIND")
-            print_pt(f"WX_AVERAGE_WIND: {status}")
-            print_pt("")
-            print_pt("Wind averaging for beacons:")
-            print_pt("  ON  - Average wind speed over beacon interval (recommended)")
-            print_pt("  OFF - Use instantaneous wind reading")
+            print_pt(f"WX_AVERAGE_WIND: {status}\n{_WX_AVG_WIND_HELP}")
             return
 
         value = args[0].upper()
-        if value not in ["ON", "OFF"]:
+        if value not in _ON_OFF:
             print_error("Usage: WX_AVERAGE_WIND <ON|OFF>")
             return
 
@@ -159,17 +216,7 @@ class WeatherCommandHandler(CommandHandler):
         """Set pressure tendency threshold for Zambretti forecasting."""
         if not args:
             threshold = self.tnc_config.get("WXTREND")
-            print_pt(f"WXTREND: {threshold} mb/hr")
-            print_pt("")
-            print_pt("Pressure tendency threshold for Zambretti weather forecasting:")
-            print_pt("  - Determines when pressure is 'rising', 'falling', or 'steady'")
-            print_pt("  - Higher values = less sensitive (fewer weather change predictions)")
-            print_pt("  - Lower values = more sensitive (more weather change predictions)")
-            print_pt("")
-            print_pt("Recommended values:")
-            print_pt("  0.17 - WMO/NOAA standard (0.5 mb in 3 hours)")
-            print_pt("  0.30 - Default (conservative, fewer false alarms)")
-            print_pt("  0.50 - Very conservative")
+            print_pt(f"WXTREND: {threshold} mb/hr\n{_WXTREND_HELP}")
             return
 
         try:
@@ -204,114 +251,114 @@ class WeatherCommandHandler(CommandHandler):
         Note: This controls YOUR local weather station hardware.
               Use 'aprs wx' to view remote APRS weather stations.
         """
-        if not hasattr(self.cmd_processor, 'weather_manager'):
+        if not self._weather_available:
             print_error("Weather station not available")
             return
 
         if not args:
+            # Nothing to report for an idle, unconfigured station
+            if not self.weather_manager.enabled and not self.weather_manager.configured:
+                print_pt(f"PWS: disabled and not configured\n{_PWS_CONFIG_HINT}")
+                return
+
             # Show status
             status = self.weather_manager.get_status()
 
-            print_header("Personal Weather Station Status")
-            print_pt(f"Enabled: {status['enabled']}")
-            print_pt(f"Configured: {status['configured']}")
-            print_pt(f"Connected: {status['connected']}")
+            lines = [
+                f"Enabled: {status['enabled']}",
+                f"Configured: {status['configured']}",
+                f"Connected: {status['connected']}",
+            ]
 
             if status['backend']:
-                print_pt(f"Backend: {status['backend']}")
+                lines.append(f"Backend: {status['backend']}")
             if status['address']:
-                print_pt(f"Address: {status['address']}")
+                lines.append(f"Address: {status['address']}")
             if status['port']:
-                print_pt(f"Port: {status['port']}")
+                lines.append(f"Port: {status['port']}")
 
-            print_pt(f"Update Interval: {status['update_interval']}s")
+            lines.append(f"Update Interval: {status['update_interval']}s")
 
             if status['last_update']:
-                print_pt(f"Last Update: {status['last_update']}")
+                lines.append(f"Last Update: {status['last_update']}")
 
             if status['has_data']:
-                print_pt("\nUse 'pws show' to see current weather data")
+                lines.append("\nUse 'pws show' to see current weather data")
 
             if not status['configured']:
-                print_pt("\nConfiguration:")
-                print_pt("  WX_BACKEND <ecowitt|davis|...>")
-                print_pt("  WX_ADDRESS <IP or serial port>")
-                print_pt("  WX_ENABLE ON")
+                lines.append(_PWS_CONFIG_HINT)
 
+            print_header("Personal Weather Station Status")
+            print_pt("\n".join(lines))
             return
 
         subcmd = args[0].lower()
+        handler = self._PWS_SUBCOMMANDS.get(subcmd)
+        if handler is None:
+            print_error(f"Unknown pws command: {subcmd}")
+            print_info("Use 'pws' with no args to see status")
+            return
+        await handler(self)
+
+    async def _pws_show(self):
+        """PWS SHOW - show current weather."""
+        data = self.weather_manager.get_cached_weather()
+        if not data:
+            print_error("No weather data available")
+            print_info("Use 'pws fetch' to get fresh data")
+            return
 
-        if subcmd == "show":
-            # Show current weather
-            data = self.weather_manager.get_cached_weather()
-            if not data:
-                print_error("No weather data available")
-                print_info("Use 'pws fetch' to get fresh data")
-                return
-
-            print_header("Current Weather")
-
-            if data.temperature_outdoor is not None:
-                print_pt(f"Outdoor Temperature: {data.temperature_outdoor:.1f}°F")
-            if data.temperature_indoor is not None:
-                print_pt(f"Indoor Temperature: {data.temperature_indoor:.1f}°F")
-            if data.dew_point is not None:
-                print_pt(f"Dew Point: {data.dew_point:.1f}°F")
-
-            if data.humidity_outdoor is not None:
-                print_pt(f"Outdoor Humidity: {data.humidity_outdoor}%")
-
-            if data.pressure_relative is not None:
-                print_pt(f"Pressure: {data.pressure_relative:.2f} mb")
-
-            if data.wind_speed is not None:
-                print_pt(f"Wind: {data.wind_speed:.1f} mph @ {data.wind_direction}°")
-            if data.wind_gust is not None:
-                print_pt(f"Gust: {data.wind_gust:.1f} mph")
-
-            if data.rain_daily is not None:
-                print_pt(f"Rain (24h): {data.rain_daily:.2f} in")
-
-            print_pt(f"\nLast updated: {data.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        elif subcmd == "fetch":
-            # Fetch fresh data
-            print_info("Fetching weather data...")
-            data = await self.weather_manager.get_current_weather()
-
-            if not data:
-                print_error("Failed to fetch weather data")
-                return
-
-            print_info("✓ Weather data updated")
-            # Show the data
-            await self.pws(["show"])
+        lines = []
+        for label, attr, fmt in _PWS_SHOW_FIELDS:
+            value = getattr(data, attr)
+            if value is not None:
+                lines.append(f"{label}: {fmt.format(value, d=data)}")
+        lines.append(f"\nLast updated: {data.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        elif subcmd == "connect":
-            # Connect to weather station
-            success = await self.weather_manager.connect()
-            if not success:
-                print_error("Failed to connect to weather station")
+        print_header("Current Weather")
+        print_pt("\n".join(lines))
 
-        elif subcmd == "disconnect":
-            # Disconnect from weather station
-            await self.weather_manager.disconnect()
+    async def _pws_fetch(self):
+        """PWS FETCH - fetch fresh data and show it."""
+        print_info("Fetching weather data...")
+        data = await self.weather_manager.get_current_weather()
 
-        elif subcmd == "test":
-            # Test connection
-            print_info("Testing connection...")
-            if not self.weather_manager._station:
-                print_error("Not connected to weather station")
-                print_info("Use 'pws connect' first")
-                return
+        if not data:
+            print_error("Failed to fetch weather data")
+            return
 
-            success = await self.weather_manager._station.test_connection()
-            if success:
-                print_info("✓ Connection test passed")
-            else:
-                print_error("Connection test failed")
+        print_info("✓ Weather data updated")
+        await self._pws_show()
+
+    async def _pws_connect(self):
+        """PWS CONNECT"""
+        success = await self.weather_manager.connect()
+        if not success:
+            print_error("Failed to connect to weather station")
+
+    async def _pws_disconnect(self):
+        """PWS DISCONNECT"""
+        await self.weather_manager.disconnect()
+
+    async def _pws_test(self):
+        """PWS TEST - test connection."""
+        print_info("Testing connection...")
+        if not self.weather_manager._station:
+            print_error("Not connected to weather station")
+            print_info("Use 'pws connect' first")
+            return
 
+        success = await self.weather_manager._station.test_connection()
+        if success:
+            print_info("✓ Connection test passed")
         else:
-            print_error(f"Unknown pws command: {subcmd}")
-            print_info("Use 'pws' with no args to see status")
+            print_error("Connection test failed")
+
+    # PWS subcommand -> handler (plain functions, called with self)
+    _PWS_SUBCOMMANDS = {
+        "show": _pws_show,
+        "fetch": _pws_fetch,
+        "connect": _pws_connect,
+        "disconnect": _pws_disconnect,
+        "test": _pws_test,
+    }
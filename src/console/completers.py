@@ -1,8 +1,315 @@
 """Tab completion for TNC and console commands."""
 
+import bisect
+
 from prompt_toolkit.completion import Completer, Completion
 
 
+# TNC-2 commands offered for completion, sorted for _prefix_slice()
+_TNC_COMMANDS = tuple(sorted((
+    "CONNECT",
+    "DISCONNECT",
+    "CONVERSE",
+    "MYCALL",
+    "MYALIAS",
+    "MYLOCATION",
+    "UNPROTO",
+    "MONITOR",
+    "AUTO_ACK",
+    "BEACON",
+    "DIGIPEATER",
+    "DIGI",
+    "RETRY",
+    "RETRY_FAST",
+    "RETRY_SLOW",
+    "DISPLAY",
+    "STATUS",
+    "RESET",
+    "HARDRESET",
+    "POWERCYCLE",
+    "DEBUGFRAMES",
+    "AGWPE_HOST",
+    "AGWPE_PORT",
+    "TNC_HOST",
+    "TNC_PORT",
+    "WEBUI_HOST",
+    "WEBUI_PORT",
+    "WEBUI_PASSWORD",
+    "WX_ENABLE",
+    "WX_BACKEND",
+    "WX_ADDRESS",
+    "WX_PORT",
+    "WX_INTERVAL",
+    "WX_AVERAGE_WIND",
+    "QUIT",
+    "EXIT",
+)))
+
+# Brief help shown next to each TNC completion
+_TNC_HELP = {
+    "CONNECT": "Connect to station",
+    "DISCONNECT": "Disconnect from station",
+    "CONVERSE": "Enter conversation mode",
+    "MYCALL": "Set/show my callsign",
+    "MYALIAS": "Set/show my alias",
+    "MYLOCATION": "Set manual position (Maidenhead grid, e.g., FN31pr)",
+    "RADIO_MAC": "Set Bluetooth MAC address for BLE radio (e.g., 38:D2:00:01:62:C2)",
+    "UNPROTO": "Set unproto destination",
+    "MONITOR": "Toggle monitor mode",
+    "AUTO_ACK": "Auto-acknowledge APRS messages (ON/OFF)",
+    "BEACON": "GPS beacon (ON/OFF/INTERVAL/PATH/SYMBOL/COMMENT/NOW)",
+    "DIGIPEATER": "Digipeater mode (ON/OFF/SELF) - repeats direct packets",
+    "DIGI": "Digipeater mode (ON/OFF/SELF) - short alias",
+    "RETRY": "Set max retry attempts (1-10)",
+    "RETRY_FAST": "Fast retry timeout in seconds (5-300) for non-digipeated messages",
+    "RETRY_SLOW": "Slow retry timeout in seconds (60-86400) for digipeated messages",
+    "DISPLAY": "Toggle display mode",
+    "STATUS": "Show TNC status",
+    "RESET": "Reset TNC settings",
+    "HARDRESET": "Hard reset radio",
+    "POWERCYCLE": "Power cycle radio",
+    "DEBUGFRAMES": "Toggle frame debugging",
+    "AGWPE_HOST": "Set AGWPE bind address (0.0.0.0=all, 127.0.0.1=localhost)",
+    "AGWPE_PORT": "Set AGWPE server port (default: 8000)",
+    "TNC_HOST": "Set TNC bridge bind address (0.0.0.0=all, 127.0.0.1=localhost)",
+    "TNC_PORT": "Set TNC bridge port (default: 8001)",
+    "WEBUI_HOST": "Set Web UI bind address (0.0.0.0=all, 127.0.0.1=localhost)",
+    "WEBUI_PORT": "Set Web UI port (default: 8002)",
+    "WEBUI_PASSWORD": "Set password for Web UI POST endpoints (empty = disabled)",
+    "WX_ENABLE": "Enable/disable weather station (ON/OFF)",
+    "WX_BACKEND": "Set weather station backend (ecowitt, davis, etc.)",
+    "WX_ADDRESS": "Set weather station IP or serial port",
+    "WX_PORT": "Set weather station port (blank = auto)",
+    "WX_INTERVAL": "Set update interval in seconds (30-3600)",
+    "WX_AVERAGE_WIND": "Average wind over beacon interval (ON/OFF)",
+    "QUIT": "Exit TNC mode",
+    "EXIT": "Exit TNC mode",
+}
+
+
+# Brief help shown next to each console command completion
+_COMMAND_HELP = {
+    "help": "Show available commands",
+    "status": "Show radio status",
+    "health": "Show radio health",
+    "notifications": "Toggle notifications",
+    "vfo": "Select VFO (A/B)",
+    "setvfo": "Set VFO frequency",
+    "active": "Set active channel",
+    "dual": "Toggle dual watch",
+    "scan": "Toggle scan mode",
+    "squelch": "Set squelch level",
+    "volume": "Set volume level",
+    "bss": "Show BSS status",
+    "setbss": "Set BSS user ID",
+    "poweron": "Power on radio",
+    "poweroff": "Power off radio",
+    "power": "Set TX power",
+    "channel": "Show channel info",
+    "list": "List channels",
+    "freq": "Show/set frequency",
+    "dump": "Dump config/status",
+    "debug": "Set debug level (0-6), filter by station, or dump frames (dump/filter)",
+    "tncsend": "Send TNC data",
+    "aprs": "APRS commands / Switch to APRS mode",
+    "radio": "Radio commands / Switch to radio mode",
+    "scan_ble": "Scan BLE characteristics",
+    "tnc": "Enter TNC mode",
+    "quit": "Exit console",
+    "exit": "Exit console",
+    # APRS subcommands (when shown as top-level in APRS mode)
+    "message": "APRS messaging",
+    "msg": "APRS messaging (alias for message)",
+    "station": "Station database",
+    "wx": "Weather stations",
+    "weather": "Weather stations (alias for wx)",
+    "pws": "Personal Weather Station",
+}
+
+# APRS subcommands offered as top-level commands in APRS mode
+_APRS_SUBCMDS = ("message", "msg", "station", "wx", "weather")
+
+# Radio commands hidden from first-word completion in APRS mode
+_RADIO_CMDS_HIDDEN = frozenset((
+    "status", "health", "vfo", "setvfo", "active", "dual",
+    "scan", "squelch", "volume", "channel", "list", "power",
+    "freq", "bss", "setbss", "poweron", "poweroff", "scan_ble",
+    "notifications", "gps",
+))
+
+# VFOs and TX power levels offered after "vfo"/"setvfo" and "power"
+_VFOS = ("a", "b")
+_POWER_LEVELS = ("high", "medium", "low")
+
+# Meta text for "debug" levels and subcommands
+_DEBUG_META = {
+    "0": "Off (no debug output)",
+    "1": "TNC monitor",
+    "2": "Critical errors and events",
+    "3": "Connection state changes",
+    "4": "Frame transmission/reception",
+    "5": "Protocol details, retransmissions",
+    "6": "Everything (BLE, config, hex dumps)",
+    "dump": "Dump frame history",
+    "filter": "Show/set station-specific debug filters",
+}
+# Already in sorted order, so _prefix_slice() can bisect it
+_DEBUG_OPTIONS = tuple(_DEBUG_META)
+
+# Output modes offered after "debug dump"
+_DEBUG_DUMP_META = {
+    "brief": "compact hex output",
+    "detail": "Wireshark-style protocol analysis",
+    "watch": "live frame analysis (ESC to exit)",
+}
+
+# "pws" subcommands and their meta text
+_PWS_SUBCOMMAND_META = {
+    "show": "Display current weather data",
+    "fetch": "Fetch fresh weather data now",
+    "connect": "Connect to weather station",
+    "disconnect": "Disconnect from weather station",
+    "test": "Test connection to weather station",
+}
+
+# TNC-2 configuration commands offered after "tnc"
+_TNC_SUBCOMMAND_META = {
+    "display": "Show all TNC parameters",
+    "mycall": "Set your callsign",
+    "myalias": "Set your alias",
+    "mylocation": "Set Maidenhead grid square",
+    "connect": "Connect to station",
+    "disconnect": "Disconnect current connection",
+    "conv": "Enter conversation mode",
+    "unproto": "Set unproto destination",
+    "monitor": "Enable/disable packet monitoring",
+    "auto_ack": "Enable/disable auto ACK",
+    "retry": "Set retry count",
+    "retry_fast": "Set fast retry timeout",
+    "retry_slow": "Set slow retry timeout",
+    "digipeater": "Enable/disable digipeater",
+    "debug_buffer": "Set debug buffer size",
+    "status": "Show TNC status",
+    "reset": "Reset TNC settings",
+    "hardreset": "Hard reset (factory defaults)",
+    "powercycle": "Power cycle radio",
+    "tncsend": "Send raw hex to TNC",
+}
+# Sorted for _prefix_slice(), matching the order TNC mode completes in
+_TNC_SUBCOMMANDS = tuple(sorted(_TNC_SUBCOMMAND_META))
+
+
+def _prefix_slice(words, prefix):
+    """Return the words of a sorted sequence that start with a prefix.
+
+    Words sharing a prefix form one contiguous run in sorted order, so
+    two bisects find it without testing every word.
+
+    Args:
+        words: Sorted sequence of strings
+        prefix: Prefix to match
+
+    Returns:
+        Slice of words starting with prefix
+    """
+    lo = bisect.bisect_left(words, prefix)
+    hi = bisect.bisect_left(words, prefix + "\uffff", lo)
+    return words[lo:hi]
+
+
+def _tokenize(text):
+    """Split console input into finished words and the word being typed.
+
+    Args:
+        text: Input text before the cursor
+
+    Returns:
+        Tuple of (words, partial): the lowercase words before the cursor
+        word, and the lowercase word at the cursor ("" after a space)
+    """
+    words = text.lower().split()
+    partial = words.pop() if words and not text[-1].isspace() else ""
+    return words, partial
+
+
+def _station_callsigns(command_processor, prefix):
+    """Return the callsigns of heard APRS stations starting with a prefix.
+
+    Args:
+        command_processor: CommandProcessor owning the APRS manager
+        prefix: Lowercase prefix to match
+
+    Returns:
+        List of matching station callsigns
+    """
+    index = command_processor.aprs_manager.get_callsign_index()
+    lo = bisect.bisect_left(index, (prefix,))
+    hi = bisect.bisect_left(index, (prefix + "\uffff",), lo)
+    return [callsign for _lower, callsign in index[lo:hi]]
+
+
+# Declarative APRS completion tree shared by "aprs <subcommand>" and the
+# top-level subcommands of APRS mode.  Each node maps a word to
+# (meta, child); child is the next node, None for a final word, or a
+# provider called with the command processor and the typed prefix that
+# returns the matching words.
+_MSG_MONITOR_NODE = {
+    "list": ("List all monitored messages", None),
+}
+
+_MSG_NODE = {
+    "read": ("Read messages addressed to you", None),
+    "send": ("Send APRS message to callsign", None),
+    "clear": ("Clear read messages", None),
+    "monitor": ("View all monitored messages", _MSG_MONITOR_NODE),
+}
+
+_WX_SORT_NODE = {
+    "last": ("Most recent first", None),
+    "name": ("Alphabetically by callsign", None),
+    "temp": ("Highest temperature first", None),
+    "humidity": ("Highest humidity first", None),
+    "pressure": ("Highest pressure first", None),
+}
+
+_WX_NODE = {
+    "list": ("List weather stations", _WX_SORT_NODE),
+}
+
+_POSITION_NODE = {
+    "list": ("", None),
+}
+
+_STATION_SORT_NODE = {
+    "last": ("Sort by last heard (most recent first)", None),
+    "name": ("Sort alphabetically by callsign", None),
+    "packets": ("Sort by packet count (highest first)", None),
+    "hops": ("Sort by hop count (direct RF first)", None),
+}
+
+_STATION_NODE = {
+    "list": ("List all heard stations", _STATION_SORT_NODE),
+    "show": ("Show detailed station info", _station_callsigns),
+}
+
+_DATABASE_NODE = {
+    "clear": ("", None),
+    "prune": ("", None),
+}
+
+_APRS_TREE = {
+    "message": (_COMMAND_HELP["message"], _MSG_NODE),
+    "msg": (_COMMAND_HELP["msg"], _MSG_NODE),
+    "wx": (_COMMAND_HELP["wx"], _WX_NODE),
+    "weather": (_COMMAND_HELP["weather"], _WX_NODE),
+    "position": ("", _POSITION_NODE),
+    "pos": ("", _POSITION_NODE),
+    "station": (_COMMAND_HELP["station"], _STATION_NODE),
+    "database": ("", _DATABASE_NODE),
+    "db": ("", _DATABASE_NODE),
+}
+
+
 class TNCCompleter(Completer):
     """Tab completion for TNC mode commands."""
 
@@ -19,106 +326,15 @@ class TNCCompleter(Completer):
         text = document.text_before_cursor.upper()
         words = text.split()
 
-        # TNC-2 commands
-        tnc_commands = [
-            "CONNECT",
-            "DISCONNECT",
-            "CONVERSE",
-            "MYCALL",
-            "MYALIAS",
-            "MYLOCATION",
-            "UNPROTO",
-            "MONITOR",
-            "AUTO_ACK",
-            "BEACON",
-            "DIGIPEATER",
-            "DIGI",
-            "RETRY",
-            "RETRY_FAST",
-            "RETRY_SLOW",
-            "DISPLAY",
-            "STATUS",
-            "RESET",
-            "HARDRESET",
-            "POWERCYCLE",
-            "DEBUGFRAMES",
-            "AGWPE_HOST",
-            "AGWPE_PORT",
-            "TNC_HOST",
-            "TNC_PORT",
-            "WEBUI_HOST",
-            "WEBUI_PORT",
-            "WEBUI_PASSWORD",
-            "WX_ENABLE",
-            "WX_BACKEND",
-            "WX_ADDRESS",
-            "WX_PORT",
-            "WX_INTERVAL",
-            "WX_AVERAGE_WIND",
-            "QUIT",
-            "EXIT",
-        ]
-
         if not words or (len(words) == 1 and not text.endswith(" ")):
             word = words[0] if words else ""
-            for cmd in tnc_commands:
-                if cmd.startswith(word):
-                    yield Completion(
-                        cmd,
-                        start_position=-len(word),
-                        display=cmd,
-                        display_meta=self._get_tnc_help(cmd),
-                    )
-
-    def _get_tnc_help(self, cmd):
-        """Get brief help for TNC command.
-
-        Args:
-            cmd: TNC command name
-
-        Returns:
-            Brief help string
-        """
-        help_text = {
-            "CONNECT": "Connect to station",
-            "DISCONNECT": "Disconnect from station",
-            "CONVERSE": "Enter conversation mode",
-            "MYCALL": "Set/show my callsign",
-            "MYALIAS": "Set/show my alias",
-            "MYLOCATION": "Set manual position (Maidenhead grid, e.g., FN31pr)",
-            "RADIO_MAC": "Set Bluetooth MAC address for BLE radio (e.g., 38:D2:00:01:62:C2)",
-            "UNPROTO": "Set unproto destination",
-            "MONITOR": "Toggle monitor mode",
-            "AUTO_ACK": "Auto-acknowledge APRS messages (ON/OFF)",
-            "BEACON": "GPS beacon (ON/OFF/INTERVAL/PATH/SYMBOL/COMMENT/NOW)",
-            "DIGIPEATER": "Digipeater mode (ON/OFF/SELF) - repeats direct packets",
-            "DIGI": "Digipeater mode (ON/OFF/SELF) - short alias",
-            "RETRY": "Set max retry attempts (1-10)",
-            "RETRY_FAST": "Fast retry timeout in seconds (5-300) for non-digipeated messages",
-            "RETRY_SLOW": "Slow retry timeout in seconds (60-86400) for digipeated messages",
-            "DISPLAY": "Toggle display mode",
-            "STATUS": "Show TNC status",
-            "RESET": "Reset TNC settings",
-            "HARDRESET": "Hard reset radio",
-            "POWERCYCLE": "Power cycle radio",
-            "DEBUGFRAMES": "Toggle frame debugging",
-            "AGWPE_HOST": "Set AGWPE bind address (0.0.0.0=all, 127.0.0.1=localhost)",
-            "AGWPE_PORT": "Set AGWPE server port (default: 8000)",
-            "TNC_HOST": "Set TNC bridge bind address (0.0.0.0=all, 127.0.0.1=localhost)",
-            "TNC_PORT": "Set TNC bridge port (default: 8001)",
-            "WEBUI_HOST": "Set Web UI bind address (0.0.0.0=all, 127.0.0.1=localhost)",
-            "WEBUI_PORT": "Set Web UI port (default: 8002)",
-            "WEBUI_PASSWORD": "Set password for Web UI POST endpoints (empty = disabled)",
-            "WX_ENABLE": "Enable/disable weather station (ON/OFF)",
-            "WX_BACKEND": "Set weather station backend (ecowitt, davis, etc.)",
-            "WX_ADDRESS": "Set weather station IP or serial port",
-            "WX_PORT": "Set weather station port (blank = auto)",
-            "WX_INTERVAL": "Set update interval in seconds (30-3600)",
-            "WX_AVERAGE_WIND": "Average wind over beacon interval (ON/OFF)",
-            "QUIT": "Exit TNC mode",
-            "EXIT": "Exit TNC mode",
-        }
-        return help_text.get(cmd, "")
+            for cmd in _prefix_slice(_TNC_COMMANDS, word):
+                yield Completion(
+                    cmd,
+                    start_position=-len(word),
+                    display=cmd,
+                    display_meta=_TNC_HELP.get(cmd, ""),
+                )
 
 
 class CommandCompleter(Completer):
@@ -131,10 +347,20 @@ class CommandCompleter(Completer):
             command_processor: CommandProcessor instance to get available commands
         """
         self.command_processor = command_processor
+        # (console_mode, serial_mode, commands id, commands len) -> tuple
+        self._command_cache = {}
+        # Key and completions of the last call, reused when nothing changed
+        self._last_key = None
+        self._last_results = ()
 
     def get_completions(self, document, complete_event):
         """Generate completions for the current input.
 
+        prompt_toolkit may ask again for the same input (re-render, meta
+        refresh), so the completions of the last call are kept and reused
+        while the input, console mode, command table and heard stations
+        are unchanged.
+
         Args:
             document: Current document (input text)
             complete_event: Completion event
@@ -143,526 +369,221 @@ class CommandCompleter(Completer):
             Completion objects for matching commands
         """
         text = document.text_before_cursor
-        words = text.split()
+        cp = self.command_processor
+        key = (
+            text,
+            cp.console_mode,
+            cp.serial_mode,
+            id(cp.commands),
+            len(cp.commands),
+            cp.aprs_manager.get_callsign_index(),
+        )
+        if key != self._last_key:
+            self._last_results = tuple(self._generate_completions(text))
+            self._last_key = key
+        yield from self._last_results
+
+    def _generate_completions(self, text):
+        """Generate completions for the input before the cursor.
 
-        # If empty or just whitespace, show all commands
-        if not words or (len(words) == 1 and not text.endswith(" ")):
-            # Completing the first word (command)
-            word = words[0] if words else ""
+        Args:
+            text: Input text before the cursor
+
+        Yields:
+            Completion objects for matching commands
+        """
+        # Lower-case the input once; all matching below is case-insensitive
+        words, partial = _tokenize(text)
+
+        # Completing the first word (command)
+        if not words:
+            # Commands are sorted, so bisect to the matching run
+            for cmd in _prefix_slice(self._command_list(), partial):
+                yield Completion(
+                    cmd,
+                    start_position=-len(partial),
+                    display=cmd,
+                    display_meta=self._get_command_help(cmd),
+                )
+
+        # Arguments of a multi-word command
+        else:
+            handler = self._COMPLETERS.get(words[0])
+            if handler is not None:
+                yield from handler(self, words, partial)
+
+    def _command_list(self):
+        """Get the sorted first-word commands for the current mode.
+
+        The list only changes when the console mode or the command table
+        does, so it is built once per combination and reused on every
+        keystroke.
+
+        Returns:
+            Sorted tuple of command names
+        """
+        cp = self.command_processor
+        key = (cp.console_mode, cp.serial_mode, id(cp.commands), len(cp.commands))
+        commands = self._command_cache.get(key)
+        if commands is not None:
+            return commands
+
+        # Get base commands
+        commands = set(cp.commands)
+
+        # Mode-specific filtering
+        if cp.console_mode == "aprs":
+            # APRS mode: add APRS subcommands as top-level, hide radio commands
+            # (keep "radio" for mode switching if BLE)
+            commands.update(_APRS_SUBCMDS)
+            commands -= _RADIO_CMDS_HIDDEN
+
+            # In serial mode, also hide the "radio" command (can't switch to radio mode)
+            if cp.serial_mode:
+                commands.discard("radio")
+
+        # Radio mode: APRS subcommands stay hidden, full commands shown
+        # normally (keep "aprs" for mode switching)
+
+        commands = tuple(sorted(commands))
+        self._command_cache[key] = commands
+        return commands
+
+    def _complete_aprs(self, words, partial):
+        """Complete "aprs" subcommands and their arguments."""
+        yield from self._complete_tree(_APRS_TREE, words[1:], partial)
+
+    def _complete_aprs_shorthand(self, words, partial):
+        """Complete APRS subcommands used without the "aprs" prefix."""
+        # Only APRS mode offers the subcommands as top-level commands
+        if self.command_processor.console_mode == "aprs":
+            yield from self._complete_tree(_APRS_TREE, words, partial)
+
+    def _complete_tree(self, node, path, partial):
+        """Complete the word at the cursor by walking a completion tree.
+
+        Args:
+            node: Root node mapping each word to (meta, child)
+            path: Finished words typed below the root
+            partial: Word being typed
+
+        Yields:
+            Completion objects for the word being typed
+        """
+        for word in path:
+            entry = node.get(word) if isinstance(node, dict) else None
+            if entry is None:
+                return
+            node = entry[1]
+
+        if isinstance(node, dict):
+            for word, (meta, _child) in node.items():
+                if word.startswith(partial):
+                    yield Completion(
+                        word,
+                        start_position=-len(partial),
+                        display=word,
+                        display_meta=meta,
+                    )
+        elif node is not None:
+            for word in node(self.command_processor, partial):
+                yield Completion(
+                    word,
+                    start_position=-len(partial),
+                    display=word,
+                )
+
+    def _complete_vfo(self, words, partial):
+        """Complete VFO names for "vfo" and "setvfo"."""
+        if len(words) == 1:
+            for vfo in _VFOS:
+                if vfo.startswith(partial):
+                    yield Completion(
+                        vfo.upper(),
+                        start_position=-len(partial),
+                        display=vfo.upper(),
+                    )
+
+    def _complete_power(self, words, partial):
+        """Complete TX power levels for "power"."""
+        if len(words) == 1:
+            for level in _POWER_LEVELS:
+                if level.startswith(partial):
+                    yield Completion(
+                        level, start_position=-len(partial), display=level
+                    )
 
-            # Get base commands
-            commands = sorted(self.command_processor.commands.keys())
-
-            # Mode-specific filtering
-            if self.command_processor.console_mode == "aprs":
-                # APRS mode: add APRS subcommands as top-level, hide radio commands
-                aprs_subcommands = ["message", "msg", "station", "wx", "weather"]
-                commands = sorted(set(commands + aprs_subcommands))
-
-                # Hide radio-specific commands (keep "radio" for mode switching if BLE)
-                radio_commands = ["status", "health", "vfo", "setvfo", "active", "dual",
-                                "scan", "squelch", "volume", "channel", "list", "power",
-                                "freq", "bss", "setbss", "poweron", "poweroff", "scan_ble",
-                                "notifications", "gps"]
-                commands = [c for c in commands if c not in radio_commands]
-
-                # In serial mode, also hide the "radio" command (can't switch to radio mode)
-                if self.command_processor.serial_mode:
-                    commands = [c for c in commands if c != "radio"]
-
-            elif self.command_processor.console_mode == "radio":
-                # Radio mode: don't show APRS subcommands as top-level (keep "aprs" for mode switching)
-                pass  # APRS subcommands stay hidden, full commands shown normally
-
-            # Filter and yield matching commands
-            for cmd in commands:
-                if cmd.startswith(word.lower()):
+    def _complete_debug(self, words, partial):
+        """Complete debug levels and the dump/filter subcommands."""
+        if len(words) == 1:
+            # Add 'dump' and 'filter' to completions
+            for option in _prefix_slice(_DEBUG_OPTIONS, partial):
+                yield Completion(
+                    option,
+                    start_position=-len(partial),
+                    display=option,
+                    display_meta=_DEBUG_META[option],
+                )
+        elif words[1] == "dump":
+            # After "debug dump", suggest "brief", "detail", or "watch"
+            # for the next word or any later word being typed
+            if len(words) == 2 or partial:
+                for mode, meta in _DEBUG_DUMP_META.items():
+                    if mode.startswith(partial):
+                        yield Completion(
+                            mode,
+                            start_position=-len(partial),
+                            display=mode,
+                            display_meta=meta,
+                        )
+        elif words[1] == "filter":
+            # After "debug filter", suggest "clear"
+            if len(words) == 2 and "clear".startswith(partial):
+                yield Completion(
+                    "clear",
+                    start_position=-len(partial),
+                    display="clear",
+                    display_meta="Clear all station filters",
+                )
+
+    def _complete_pws(self, words, partial):
+        """Complete "pws" (Personal Weather Station) subcommands."""
+        if len(words) == 1:
+            for subcmd, meta in _PWS_SUBCOMMAND_META.items():
+                if subcmd.startswith(partial):
                     yield Completion(
-                        cmd,
-                        start_position=-len(word),
-                        display=cmd,
-                        display_meta=self._get_command_help(cmd),
+                        subcmd,
+                        start_position=-len(partial),
+                        display=subcmd,
+                        display_meta=meta,
                     )
 
-        # Special completion for multi-word commands
-        elif len(words) >= 1:
-            first_word = words[0].lower()
-
-            # APRS command completions
-            if first_word == "aprs":
-                if len(words) == 1 or (
-                    len(words) == 2 and not text.endswith(" ")
-                ):
-                    # Complete aprs subcommands
-                    subcommands = [
-                        "message",
-                        "msg",
-                        "wx",
-                        "weather",
-                        "position",
-                        "pos",
-                        "station",
-                        "database",
-                        "db",
-                    ]
-                    word = words[1] if len(words) == 2 else ""
-                    for sub in subcommands:
-                        if sub.startswith(word):
-                            yield Completion(
-                                sub, start_position=-len(word), display=sub
-                            )
-                elif len(words) >= 2:
-                    subcmd = words[1].lower()
-                    if subcmd in ("message", "msg"):
-                        if len(words) == 2 or (
-                            len(words) == 3 and not text.endswith(" ")
-                        ):
-                            # Complete message actions
-                            actions = ["read", "send", "clear", "monitor"]
-                            word = words[2] if len(words) == 3 else ""
-                            for action in actions:
-                                if action.startswith(word):
-                                    yield Completion(
-                                        action,
-                                        start_position=-len(word),
-                                        display=action,
-                                    )
-                        elif len(words) >= 3:
-                            action = words[2].lower()
-                            if action == "monitor":
-                                if len(words) == 3 or (
-                                    len(words) == 4 and not text.endswith(" ")
-                                ):
-                                    # Complete monitor subactions
-                                    subactions = ["list"]
-                                    word = words[3] if len(words) == 4 else ""
-                                    for subaction in subactions:
-                                        if subaction.startswith(word):
-                                            yield Completion(
-                                                subaction,
-                                                start_position=-len(word),
-                                                display=subaction,
-                                            )
-                    elif subcmd in ("wx", "weather"):
-                        if len(words) == 2 or (
-                            len(words) == 3 and not text.endswith(" ")
-                        ):
-                            # Complete wx actions
-                            actions = ["list"]
-                            word = words[2] if len(words) == 3 else ""
-                            for action in actions:
-                                if action.startswith(word):
-                                    yield Completion(
-                                        action,
-                                        start_position=-len(word),
-                                        display=action,
-                                    )
-                        elif len(words) >= 3:
-                            # Complete sort options for "aprs wx list"
-                            action = words[2].lower()
-                            if action == "list":
-                                if len(words) == 3 or (
-                                    len(words) == 4 and not text.endswith(" ")
-                                ):
-                                    sort_options = [
-                                        "last",
-                                        "name",
-                                        "temp",
-                                        "humidity",
-                                        "pressure",
-                                    ]
-                                    word = words[3] if len(words) == 4 else ""
-                                    for option in sort_options:
-                                        if option.startswith(word):
-                                            # Add descriptive meta text
-                                            meta = {
-                                                "last": "Most recent first",
-                                                "name": "Alphabetically by callsign",
-                                                "temp": "Highest temperature first",
-                                                "humidity": "Highest humidity first",
-                                                "pressure": "Highest pressure first",
-                                            }.get(option, "")
-                                            yield Completion(
-                                                option,
-                                                start_position=-len(word),
-                                                display=option,
-                                                display_meta=meta,
-                                            )
-                    elif subcmd in ("position", "pos"):
-                        if len(words) == 2 or (
-                            len(words) == 3 and not text.endswith(" ")
-                        ):
-                            # Complete position actions
-                            actions = ["list"]
-                            word = words[2] if len(words) == 3 else ""
-                            for action in actions:
-                                if action.startswith(word):
-                                    yield Completion(
-                                        action,
-                                        start_position=-len(word),
-                                        display=action,
-                                    )
-                    elif subcmd == "station":
-                        if len(words) == 2 or (
-                            len(words) == 3 and not text.endswith(" ")
-                        ):
-                            # Complete station actions
-                            actions = ["list", "show"]
-                            word = words[2] if len(words) == 3 else ""
-                            for action in actions:
-                                if action.startswith(word):
-                                    yield Completion(
-                                        action,
-                                        start_position=-len(word),
-                                        display=action,
-                                    )
-                        elif len(words) >= 3 and words[2].lower() == "show":
-                            # Complete with known station callsigns
-                            if len(words) == 3 or (
-                                len(words) == 4 and not text.endswith(" ")
-                            ):
-                                word = words[3] if len(words) == 4 else ""
-                                stations = (
-                                    self.command_processor.aprs_manager.get_all_stations()
-                                )
-                                for station in stations:
-                                    if station.callsign.lower().startswith(
-                                        word.lower()
-                                    ):
-                                        yield Completion(
-                                            station.callsign,
-                                            start_position=-len(word),
-                                            display=station.callsign,
-                                        )
-                        elif len(words) >= 3 and words[2].lower() == "list":
-                            # Complete sort order options for station list
-                            if len(words) == 3 or (
-                                len(words) == 4 and not text.endswith(" ")
-                            ):
-                                word = words[3] if len(words) == 4 else ""
-                                sort_options = [
-                                    (
-                                        "name",
-                                        "Sort alphabetically by callsign",
-                                    ),
-                                    (
-                                        "packets",
-                                        "Sort by packet count (highest first)",
-                                    ),
-                                    (
-                                        "last",
-                                        "Sort by last heard (most recent first)",
-                                    ),
-                                    (
-                                        "hops",
-                                        "Sort by hop count (direct RF first)",
-                                    ),
-                                ]
-                                for option, meta in sort_options:
-                                    if option.startswith(word.lower()):
-                                        yield Completion(
-                                            option,
-                                            start_position=-len(word),
-                                            display=option,
-                                            display_meta=meta,
-                                        )
-                    elif subcmd in ("database", "db"):
-                        if len(words) == 2 or (
-                            len(words) == 3 and not text.endswith(" ")
-                        ):
-                            # Complete database actions
-                            actions = ["clear", "prune"]
-                            word = words[2] if len(words) == 3 else ""
-                            for action in actions:
-                                if action.startswith(word):
-                                    yield Completion(
-                                        action,
-                                        start_position=-len(word),
-                                        display=action,
-                                    )
-
-            # APRS subcommands as top-level commands (in APRS mode)
-            # Handle "message ?", "station ?", etc. when used without "aprs" prefix
-            elif self.command_processor.console_mode == "aprs" and first_word in ("message", "msg", "station", "wx", "weather"):
-                # Redirect to the same logic as "aprs <subcommand>"
-                # Treat first_word as if it were the second word after "aprs"
-                subcmd = first_word
-
-                if subcmd in ("message", "msg"):
-                    if len(words) == 1 or (len(words) == 2 and not text.endswith(" ")):
-                        # Complete message actions
-                        actions = ["read", "send", "clear", "monitor"]
-                        word = words[1] if len(words) == 2 else ""
-                        for action in actions:
-                            if action.startswith(word):
-                                meta = {
-                                    "read": "Read messages addressed to you",
-                                    "send": "Send APRS message to callsign",
-                                    "clear": "Clear read messages",
-                                    "monitor": "View all monitored messages"
-                                }.get(action, "")
-                                yield Completion(
-                                    action,
-                                    start_position=-len(word),
-                                    display=action,
-                                    display_meta=meta,
-                                )
-                    elif len(words) >= 2:
-                        action = words[1].lower()
-                        if action == "monitor":
-                            if len(words) == 2 or (len(words) == 3 and not text.endswith(" ")):
-                                # Complete monitor subactions
-                                subactions = ["list"]
-                                word = words[2] if len(words) == 3 else ""
-                                for subaction in subactions:
-                                    if subaction.startswith(word):
-                                        yield Completion(
-                                            subaction,
-                                            start_position=-len(word),
-                                            display=subaction,
-                                            display_meta="List all monitored messages",
-                                        )
-
-                elif subcmd in ("wx", "weather"):
-                    if len(words) == 1 or (len(words) == 2 and not text.endswith(" ")):
-                        # Complete wx actions
-                        actions = ["list"]
-                        word = words[1] if len(words) == 2 else ""
-                        for action in actions:
-                            if action.startswith(word):
-                                yield Completion(
-                                    action,
-                                    start_position=-len(word),
-                                    display=action,
-                                    display_meta="List weather stations",
-                                )
-                    elif len(words) >= 2:
-                        # Complete sort options for "wx list"
-                        action = words[1].lower()
-                        if action == "list":
-                            if len(words) == 2 or (len(words) == 3 and not text.endswith(" ")):
-                                sort_options = ["last", "name", "temp", "humidity", "pressure"]
-                                word = words[2] if len(words) == 3 else ""
-                                for option in sort_options:
-                                    if option.startswith(word):
-                                        meta = {
-                                            "last": "Most recent first",
-                                            "name": "Alphabetically by callsign",
-                                            "temp": "Highest temperature first",
-                                            "humidity": "Highest humidity first",
-                                            "pressure": "Highest pressure first",
-                                        }.get(option, "")
-                                        yield Completion(
-                                            option,
-                                            start_position=-len(word),
-                                            display=option,
-                                            display_meta=meta,
-                                        )
-
-                elif subcmd == "station":
-                    if len(words) == 1 or (len(words) == 2 and not text.endswith(" ")):
-                        # Complete station actions
-                        actions = ["list", "show"]
-                        word = words[1] if len(words) == 2 else ""
-                        for action in actions:
-                            if action.startswith(word):
-                                meta = {
-                                    "list": "List all heard stations",
-                                    "show": "Show detailed station info",
-                                }.get(action, "")
-                                yield Completion(
-                                    action,
-                                    start_position=-len(word),
-                                    display=action,
-                                    display_meta=meta,
-                                )
-                    elif len(words) >= 2 and words[1].lower() == "show":
-                        # Complete with known station callsigns
-                        if len(words) == 2 or (len(words) == 3 and not text.endswith(" ")):
-                            word = words[2] if len(words) == 3 else ""
-                            stations = self.command_processor.aprs_manager.get_all_stations()
-                            for station in stations:
-                                if station.callsign.lower().startswith(word.lower()):
-                                    yield Completion(
-                                        station.callsign,
-                                        start_position=-len(word),
-                                        display=station.callsign,
-                                    )
-                    elif len(words) >= 2 and words[1].lower() == "list":
-                        # Complete sort options for "station list"
-                        if len(words) == 2 or (len(words) == 3 and not text.endswith(" ")):
-                            sort_options = ["last", "name", "packets", "hops"]
-                            word = words[2] if len(words) == 3 else ""
-                            for option in sort_options:
-                                if option.startswith(word):
-                                    meta = {
-                                        "last": "Most recent first",
-                                        "name": "Alphabetically by callsign",
-                                        "packets": "Most packets first",
-                                        "hops": "Fewest hops first",
-                                    }.get(option, "")
-                                    yield Completion(
-                                        option,
-                                        start_position=-len(word),
-                                        display=option,
-                                        display_meta=meta,
-                                    )
-
-            # VFO completions
-            elif first_word in ("vfo", "setvfo"):
-                if len(words) == 1 or (
-                    len(words) == 2 and not text.endswith(" ")
-                ):
-                    vfos = ["a", "b"]
-                    word = words[1] if len(words) == 2 else ""
-                    for vfo in vfos:
-                        if vfo.startswith(word.lower()):
-                            yield Completion(
-                                vfo.upper(),
-                                start_position=-len(word),
-                                display=vfo.upper(),
-                            )
-
-            # Power completions
-            elif first_word == "power":
-                if len(words) == 1 or (
-                    len(words) == 2 and not text.endswith(" ")
-                ):
-                    levels = ["high", "medium", "low"]
-                    word = words[1] if len(words) == 2 else ""
-                    for level in levels:
-                        if level.startswith(word.lower()):
-                            yield Completion(
-                                level, start_position=-len(word), display=level
-                            )
-
-            # Debug level completions
-            elif first_word == "debug":
-                if len(words) == 1 or (
-                    len(words) == 2 and not text.endswith(" ")
-                ):
-                    level_meta = {
-                        "0": "Off (no debug output)",
-                        "1": "TNC monitor",
-                        "2": "Critical errors and events",
-                        "3": "Connection state changes",
-                        "4": "Frame transmission/reception",
-                        "5": "Protocol details, retransmissions",
-                        "6": "Everything (BLE, config, hex dumps)",
-                        "dump": "Dump frame history",
-                        "filter": "Show/set station-specific debug filters",
-                    }
-                    # Add 'dump' and 'filter' to completions
-                    options = ["0", "1", "2", "3", "4", "5", "6", "dump", "filter"]
-                    word = words[1] if len(words) == 2 else ""
-                    for option in options:
-                        if option.startswith(word.lower()):
-                            yield Completion(
-                                option,
-                                start_position=-len(word),
-                                display=option,
-                                display_meta=level_meta[option],
-                            )
-                elif len(words) >= 2 and words[1].lower() == "dump":
-                    # After "debug dump", suggest "brief", "detail", or "watch"
-                    if len(words) == 2 or (
-                        len(words) >= 3 and not text.endswith(" ")
-                    ):
-                        word = words[-1] if len(words) >= 3 else ""
-                        if "brief".startswith(word.lower()):
-                            yield Completion(
-                                "brief",
-                                start_position=-len(word),
-                                display="brief",
-                                display_meta="compact hex output",
-                            )
-                        if "detail".startswith(word.lower()):
-                            yield Completion(
-                                "detail",
-                                start_position=-len(word),
-                                display="detail",
-                                display_meta="Wireshark-style protocol analysis",
-                            )
-                        if "watch".startswith(word.lower()):
-                            yield Completion(
-                                "watch",
-                                start_position=-len(word),
-                                display="watch",
-                                display_meta="live frame analysis (ESC to exit)",
-                            )
-                elif len(words) >= 2 and words[1].lower() == "filter":
-                    # After "debug filter", suggest "clear"
-                    if len(words) == 2 or (
-                        len(words) == 3 and not text.endswith(" ")
-                    ):
-                        word = words[2] if len(words) == 3 else ""
-                        if "clear".startswith(word.lower()):
-                            yield Completion(
-                                "clear",
-                                start_position=-len(word),
-                                display="clear",
-                                display_meta="Clear all station filters",
-                            )
-
-            # PWS (Personal Weather Station) completions
-            elif first_word == "pws":
-                if len(words) == 1 or (
-                    len(words) == 2 and not text.endswith(" ")
-                ):
-                    subcommands_meta = {
-                        "show": "Display current weather data",
-                        "fetch": "Fetch fresh weather data now",
-                        "connect": "Connect to weather station",
-                        "disconnect": "Disconnect from weather station",
-                        "test": "Test connection to weather station",
-                    }
-                    word = words[1] if len(words) == 2 else ""
-                    for subcmd, meta in subcommands_meta.items():
-                        if subcmd.startswith(word.lower()):
-                            yield Completion(
-                                subcmd,
-                                start_position=-len(word),
-                                display=subcmd,
-                                display_meta=meta,
-                            )
-
-            # TNC command completions
-            elif first_word == "tnc":
-                if len(words) == 1 or (
-                    len(words) == 2 and not text.endswith(" ")
-                ):
-                    # TNC-2 configuration commands
-                    subcommands_meta = {
-                        "display": "Show all TNC parameters",
-                        "mycall": "Set your callsign",
-                        "myalias": "Set your alias",
-                        "mylocation": "Set Maidenhead grid square",
-                        "connect": "Connect to station",
-                        "disconnect": "Disconnect current connection",
-                        "conv": "Enter conversation mode",
-                        "unproto": "Set unproto destination",
-                        "monitor": "Enable/disable packet monitoring",
-                        "auto_ack": "Enable/disable auto ACK",
-                        "retry": "Set retry count",
-                        "retry_fast": "Set fast retry timeout",
-                        "retry_slow": "Set slow retry timeout",
-                        "digipeater": "Enable/disable digipeater",
-                        "debug_buffer": "Set debug buffer size",
-                        "status": "Show TNC status",
-                        "reset": "Reset TNC settings",
-                        "hardreset": "Hard reset (factory defaults)",
-                        "powercycle": "Power cycle radio",
-                        "tncsend": "Send raw hex to TNC",
-                    }
-                    word = words[1] if len(words) == 2 else ""
-                    for subcmd, meta in subcommands_meta.items():
-                        if subcmd.startswith(word.lower()):
-                            yield Completion(
-                                subcmd,
-                                start_position=-len(word),
-                                display=subcmd,
-                                display_meta=meta,
-                            )
+    def _complete_tnc(self, words, partial):
+        """Complete TNC-2 configuration commands after "tnc"."""
+        if len(words) == 1:
+            for subcmd in _prefix_slice(_TNC_SUBCOMMANDS, partial):
+                yield Completion(
+                    subcmd,
+                    start_position=-len(partial),
+                    display=subcmd,
+                    display_meta=_TNC_SUBCOMMAND_META[subcmd],
+                )
+
+    # First word -> argument completer, called as handler(self, words, partial)
+    _COMPLETERS = {
+        "aprs": _complete_aprs,
+        "message": _complete_aprs_shorthand,
+        "msg": _complete_aprs_shorthand,
+        "station": _complete_aprs_shorthand,
+        "wx": _complete_aprs_shorthand,
+        "weather": _complete_aprs_shorthand,
+        "vfo": _complete_vfo,
+        "setvfo": _complete_vfo,
+        "power": _complete_power,
+        "debug": _complete_debug,
+        "pws": _complete_pws,
+        "tnc": _complete_tnc,
+    }
 
     def _get_command_help(self, cmd):
         """Get brief help text for a command.
@@ -673,41 +594,4 @@ class CommandCompleter(Completer):
         Returns:
             Brief help string
         """
-        help_text = {
-            "help": "Show available commands",
-            "status": "Show radio status",
-            "health": "Show radio health",
-            "notifications": "Toggle notifications",
-            "vfo": "Select VFO (A/B)",
-            "setvfo": "Set VFO frequency",
-            "active": "Set active channel",
-            "dual": "Toggle dual watch",
-            "scan": "Toggle scan mode",
-            "squelch": "Set squelch level",
-            "volume": "Set volume level",
-            "bss": "Show BSS status",
-            "setbss": "Set BSS user ID",
-            "poweron": "Power on radio",
-            "poweroff": "Power off radio",
-            "power": "Set TX power",
-            "channel": "Show channel info",
-            "list": "List channels",
-            "freq": "Show/set frequency",
-            "dump": "Dump config/status",
-            "debug": "Set debug level (0-6), filter by station, or dump frames (dump/filter)",
-            "tncsend": "Send TNC data",
-            "aprs": "APRS commands / Switch to APRS mode",
-            "radio": "Radio commands / Switch to radio mode",
-            "scan_ble": "Scan BLE characteristics",
-            "tnc": "Enter TNC mode",
-            "quit": "Exit console",
-            "exit": "Exit console",
-            # APRS subcommands (when shown as top-level in APRS mode)
-            "message": "APRS messaging",
-            "msg": "APRS messaging (alias for message)",
-            "station": "Station database",
-            "wx": "Weather stations",
-            "weather": "Weather stations (alias for wx)",
-            "pws": "Personal Weather Station",
-        }
-        return help_text.get(cmd, "")
+        return _COMMAND_HELP.get(cmd, "")
@@ -1,17 +1,31 @@
 """Frame history tracking for debugging."""
 
 import asyncio
-import base64
-import gzip
 import json
 import os
 import time
 import traceback
+from binascii import a2b_base64, b2a_base64
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from typing import List
 
+# ISA-L's igzip is a drop-in, format-compatible and much faster gzip
+try:
+    from isal import igzip as gzip
+    HAS_ISAL = True
+except ImportError:
+    import gzip
+    HAS_ISAL = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     import ujson
     HAS_UJSON = True
@@ -25,6 +39,10 @@ from src.utils import (
     print_warning,
 )
 
+# Byte -> printable ASCII (or '.') translation table for hex dumps
+_ASCII_TABLE = bytes(b if 0x20 <= b <= 0x7E else 0x2E for b in range(256))
+
+
 @dataclass
 class FrameHistoryEntry:
     """Represents a captured frame for debugging."""
@@ -33,26 +51,49 @@ class FrameHistoryEntry:
     direction: str  # 'RX' or 'TX'
     raw_bytes: bytes
     frame_number: int  # Sequential frame number
+    # "HH:MM:SS.mmm" rendering of timestamp, filled on first use
+    _time_str: str = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def time_str(self) -> str:
+        """Timestamp formatted as HH:MM:SS.mmm (cached)."""
+        if self._time_str is None:
+            # %-formatting the fields is cheaper than strftime() plus a slice
+            ts = self.timestamp
+            self._time_str = "%02d:%02d:%02d.%03d" % (
+                ts.hour, ts.minute, ts.second, ts.microsecond // 1000
+            )
+        return self._time_str
+
+    def to_record(self) -> dict:
+        """Return the saved-buffer form of this frame.
+
+        Built on each save rather than kept per entry: a cached record
+        costs several times the frame itself and isn't counted against
+        the buffer size limit.
+        """
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'direction': self.direction,
+            'raw_bytes': b2a_base64(self.raw_bytes, newline=False).decode('ascii'),
+            'frame_number': self.frame_number
+        }
 
     def format_hex(self) -> str:
         """Format frame as hex dump."""
-        hex_str = self.raw_bytes.hex()
-        # Format as groups of 2 hex chars (bytes)
-        formatted = " ".join(
-            hex_str[i : i + 2] for i in range(0, len(hex_str), 2)
-        )
-        return formatted
+        # Space-separated groups of 2 hex chars (bytes)
+        return self.raw_bytes.hex(" ")
 
     def format_ascii(self, chunk: bytes) -> str:
         """Format bytes as ASCII (printable chars or dots)."""
-        return "".join(chr(b) if 0x20 <= b <= 0x7E else "." for b in chunk)
+        return chunk.translate(_ASCII_TABLE).decode("ascii")
 
     def format_hex_lines(self) -> List[str]:
         """Format frame as hex editor style lines (hex + ASCII)."""
         lines = []
         for i in range(0, len(self.raw_bytes), 16):
             chunk = self.raw_bytes[i : i + 16]
-            hex_part = " ".join(f"{b:02x}" for b in chunk)
+            hex_part = chunk.hex(" ")
             # Pad hex part to align ASCII column (16 bytes * 3 chars - 1 space = 47 chars)
             hex_part = hex_part.ljust(47)
             ascii_part = self.format_ascii(chunk)
@@ -66,6 +107,12 @@ class FrameHistory:
     # File path for persistent storage
     BUFFER_FILE = os.path.expanduser("~/.console_frame_buffer.json.gz")
     AUTO_SAVE_INTERVAL = 100  # Save every N frames
+    # How often (seconds) to re-resolve the local UTC offset used to stamp
+    # frames, so DST changes are picked up without a lookup per frame
+    LOCAL_TZ_REFRESH = 60.0
+    # gzip level for saves; base64 payloads gain little from level 9 but
+    # cost several times the CPU on every auto-save (3 is also igzip's max)
+    COMPRESS_LEVEL = 3
 
     def __init__(self, max_size_mb: int = 10, buffer_mode: bool = True):
         self.buffer_mode = buffer_mode  # True = MB-based, False = simple 10-frame buffer
@@ -86,6 +133,10 @@ class FrameHistory:
         self._save_lock = asyncio.Lock()
         self._last_save_time = 0  # Track last save for monitoring
 
+        # Cached local timezone for add_frame() timestamps
+        self._local_tz = None
+        self._local_tz_checked = 0.0
+
         # Note: load_from_disk() called explicitly after creation to display load info
 
     def add_frame(self, direction: str, raw_bytes: bytes):
@@ -97,19 +148,15 @@ class FrameHistory:
         """
         self.frame_counter += 1
         entry = FrameHistoryEntry(
-            timestamp=datetime.now().astimezone(),  # Timezone-aware in local timezone
+            timestamp=self._local_now(),  # Timezone-aware in local timezone
             direction=direction,
             raw_bytes=raw_bytes,
             frame_number=self.frame_counter
         )
-        self.frames.append(entry)
+        self._append(entry)
 
         if self.buffer_mode:
-            self.current_size_bytes += len(raw_bytes)
-            # Remove old frames if we exceed size limit
-            while self.current_size_bytes > self.max_size_bytes and len(self.frames) > 1:
-                removed = self.frames.popleft()
-                self.current_size_bytes -= len(removed.raw_bytes)
+            self._trim()
 
         # Auto-save periodically (async to avoid blocking)
         self.frames_since_save += 1
@@ -118,6 +165,38 @@ class FrameHistory:
             asyncio.create_task(self.save_to_disk_async())
             self.frames_since_save = 0
 
+    def _local_now(self) -> datetime:
+        """Current time in the local timezone (cheaper than now().astimezone())."""
+        now = time.monotonic()
+        if self._local_tz is None or now - self._local_tz_checked >= self.LOCAL_TZ_REFRESH:
+            self._local_tz = datetime.now().astimezone().tzinfo
+            self._local_tz_checked = now
+        return datetime.now(self._local_tz)
+
+    def _append(self, entry: FrameHistoryEntry):
+        """Append an entry, keeping the size total in step."""
+        self.frames.append(entry)
+        if self.buffer_mode:
+            self.current_size_bytes += len(entry.raw_bytes)
+
+    def _trim(self) -> int:
+        """Drop oldest frames until within max_size_bytes (buffer mode).
+
+        Returns:
+            Number of frames removed
+        """
+        trimmed = 0
+        while self.current_size_bytes > self.max_size_bytes and len(self.frames) > 1:
+            removed = self.frames.popleft()
+            self.current_size_bytes -= len(removed.raw_bytes)
+            trimmed += 1
+        return trimmed
+
+    def clear(self):
+        """Drop all frames from history (frame numbering continues)."""
+        self.frames.clear()
+        self.current_size_bytes = 0
+
     def get_recent(self, count: int = None) -> List[FrameHistoryEntry]:
         """Get recent frames.
 
@@ -127,11 +206,12 @@ class FrameHistory:
         Returns:
             List of frames (most recent last)
         """
-        if count is None:
+        if not count:
             return list(self.frames)
         else:
-            # Return last N frames
-            return list(self.frames)[-count:]
+            # Return last N frames without copying the whole deque first
+            total = len(self.frames)
+            return list(islice(self.frames, max(0, total - count), total))
 
     def get_by_number(self, frame_number: int) -> FrameHistoryEntry:
         """Get a specific frame by its number.
@@ -142,6 +222,22 @@ class FrameHistory:
         Returns:
             FrameHistoryEntry or None if not found
         """
+        if not self.frames:
+            return None
+
+        # Frames are appended with consecutive numbers and only trimmed from
+        # the front, so the position follows from the oldest frame's number.
+        # Indexing a deque walks its 64-entry blocks, so this is linear in
+        # 1/64 of the buffer rather than O(1), but needs no extra memory
+        index = frame_number - self.frames[0].frame_number
+        if 0 <= index < len(self.frames):
+            frame = self.frames[index]
+            if frame.frame_number == frame_number:
+                return frame
+
+        # Gaps (frames skipped as corrupted on load) - fall back to a scan
+        if self.frames[-1].frame_number - self.frames[0].frame_number + 1 == len(self.frames):
+            return None
         for frame in self.frames:
             if frame.frame_number == frame_number:
                 return frame
@@ -167,9 +263,7 @@ class FrameHistory:
             # Calculate current size
             self.current_size_bytes = sum(len(f.raw_bytes) for f in self.frames)
             # Trim if needed
-            while self.current_size_bytes > self.max_size_bytes and len(self.frames) > 1:
-                removed = self.frames.popleft()
-                self.current_size_bytes -= len(removed.raw_bytes)
+            self._trim()
         else:
             # Convert to simple mode
             old_frames = list(self.frames)[-10:]  # Keep last 10
@@ -186,9 +280,7 @@ class FrameHistory:
         if self.buffer_mode:
             self.max_size_bytes = size_mb * 1024 * 1024
             # Trim if needed
-            while self.current_size_bytes > self.max_size_bytes and len(self.frames) > 1:
-                removed = self.frames.popleft()
-                self.current_size_bytes -= len(removed.raw_bytes)
+            self._trim()
 
     async def save_to_disk_async(self):
         """Save frame buffer to disk asynchronously (non-blocking).
@@ -225,15 +317,9 @@ class FrameHistory:
             # (frames may be added by background tasks while we're saving)
             frames_snapshot = list(self.frames)
 
-            # Serialize frames to JSON-compatible format
-            frames_data = []
-            for frame in frames_snapshot:
-                frames_data.append({
-                    'timestamp': frame.timestamp.isoformat(),
-                    'direction': frame.direction,
-                    'raw_bytes': base64.b64encode(frame.raw_bytes).decode('ascii'),
-                    'frame_number': frame.frame_number
-                })
+            # Serialize frames to JSON-compatible format; only frames added
+            # since the previous save need base64/isoformat work
+            frames_data = [frame.to_record() for frame in frames_snapshot]
 
             data = {
                 'frame_counter': self.frame_counter,
@@ -243,14 +329,18 @@ class FrameHistory:
                 'saved_at': datetime.now(timezone.utc).isoformat()
             }
 
-            # Write compressed JSON
+            # Prefer orjson (emits bytes directly), then ujson, then stdlib
+            if HAS_ORJSON:
+                payload = orjson.dumps(data)
+            elif HAS_UJSON:
+                payload = ujson.dumps(data, ensure_ascii=False).encode('utf-8')
+            else:
+                payload = json.dumps(data).encode('utf-8')
+
+            # Write compressed JSON in one binary write (no text-mode wrapper)
             temp_file = self.BUFFER_FILE + ".tmp"
-            with gzip.open(temp_file, 'wt', encoding='utf-8') as f:
-                # Use ujson for 3-5x faster serialization if available
-                if HAS_UJSON:
-                    f.write(ujson.dumps(data, ensure_ascii=False))
-                else:
-                    json.dump(data, f)
+            with gzip.open(temp_file, 'wb', compresslevel=self.COMPRESS_LEVEL) as f:
+                f.write(payload)
 
             # Atomic rename
             os.replace(temp_file, self.BUFFER_FILE)
@@ -260,6 +350,28 @@ class FrameHistory:
             print_error(f"Failed to save frame buffer: {type(e).__name__}: {e}")
             print_debug(traceback.format_exc(), level=3)
 
+    def _first_kept_index(self, saved_frames: list) -> int:
+        """Index of the oldest saved frame that fits in the current buffer.
+
+        Walks back from the newest frame totalling payload sizes (estimated
+        from the base64 length, so nothing is decoded), mirroring _trim().
+        """
+        if not self.buffer_mode:
+            return max(0, len(saved_frames) - (self.frames.maxlen or 0))
+
+        total = self.current_size_bytes
+        newest = len(saved_frames) - 1
+        for index in range(newest, -1, -1):
+            frame_data = saved_frames[index]
+            encoded = frame_data.get('raw_bytes') if isinstance(frame_data, dict) else None
+            if isinstance(encoded, str):
+                # Malformed entries add nothing here and count as corrupted later
+                total += len(encoded) * 3 // 4 - encoded.endswith('=') - encoded.endswith('==')
+            # Like _trim(), always keep at least the newest frame
+            if total > self.max_size_bytes and index < newest:
+                return index + 1
+        return 0
+
     async def load_from_disk_async(self) -> dict:
         """Load frame buffer from disk asynchronously (non-blocking).
 
@@ -299,12 +411,17 @@ class FrameHistory:
             # Get file size before loading
             result['file_size_kb'] = os.path.getsize(self.BUFFER_FILE) / 1024
 
-            with gzip.open(self.BUFFER_FILE, 'rt', encoding='utf-8') as f:
-                # Use ujson for faster deserialization if available
-                if HAS_UJSON:
-                    data = ujson.loads(f.read())
-                else:
-                    data = json.load(f)
+            with gzip.open(self.BUFFER_FILE, 'rb') as f:
+                raw = f.read()
+
+            # Prefer orjson, then ujson; all three parse UTF-8 bytes directly
+            if HAS_ORJSON:
+                data = orjson.loads(raw)
+            elif HAS_UJSON:
+                data = ujson.loads(raw)
+            else:
+                data = json.loads(raw)
+            del raw  # Decompressed text is no longer needed
 
             # Restore frame counter (important to maintain sequential numbering)
             self.frame_counter = data.get('frame_counter', 0)
@@ -312,9 +429,10 @@ class FrameHistory:
             # Pre-compute local timezone once (optimization for legacy naive timestamps)
             local_tz = datetime.now(timezone.utc).astimezone().tzinfo
 
-            # Restore frames
+            # Restore frames, skipping older ones that would be trimmed anyway
+            saved_frames = data.get('frames', [])
             corrupted = 0
-            for frame_data in data.get('frames', []):
+            for frame_data in saved_frames[self._first_kept_index(saved_frames):]:
                 try:
                     # Load timestamp and make timezone-aware if needed
                     ts = datetime.fromisoformat(frame_data['timestamp'])
@@ -325,14 +443,10 @@ class FrameHistory:
                     entry = FrameHistoryEntry(
                         timestamp=ts,
                         direction=frame_data['direction'],
-                        raw_bytes=base64.b64decode(frame_data['raw_bytes']),
+                        raw_bytes=a2b_base64(frame_data['raw_bytes']),
                         frame_number=frame_data['frame_number']
                     )
-                    self.frames.append(entry)
-
-                    # Update size tracking for buffer mode
-                    if self.buffer_mode:
-                        self.current_size_bytes += len(entry.raw_bytes)
+                    self._append(entry)
 
                 except Exception:
                     # Skip corrupted frames but continue loading others
@@ -342,10 +456,7 @@ class FrameHistory:
             # Trim to current buffer size if needed
             trimmed = 0
             if self.buffer_mode:
-                while self.current_size_bytes > self.max_size_bytes and len(self.frames) > 1:
-                    removed = self.frames.popleft()
-                    self.current_size_bytes -= len(removed.raw_bytes)
-                    trimmed += 1
+                trimmed = self._trim()
 
             # Calculate start frame number (lowest frame in buffer)
             start_frame = self.frames[0].frame_number if self.frames else self.frame_counter
@@ -362,8 +473,7 @@ class FrameHistory:
             print_error(f"Failed to load frame buffer: {type(e).__name__}: {e}")
             print_warning("Starting with empty frame buffer")
             print_debug(traceback.format_exc(), level=3)
-            self.frames.clear()
+            self.clear()
             self.frame_counter = 0
-            self.current_size_bytes = 0
             return result
 
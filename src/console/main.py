@@ -197,10 +197,10 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
             return
 
     # Create APRS manager early so database can load in parallel with radio connection
-    mycall = tnc_config.get("MYCALL") or "NOCALL"
-    retry_count = int(tnc_config.get("RETRY") or "3")
-    retry_fast = int(tnc_config.get("RETRY_FAST") or "20")
-    retry_slow = int(tnc_config.get("RETRY_SLOW") or "600")
+    mycall = tnc_config.get_or_default("MYCALL")
+    retry_count = int(tnc_config.get_or_default("RETRY"))
+    retry_fast = int(tnc_config.get_or_default("RETRY_FAST"))
+    retry_slow = int(tnc_config.get_or_default("RETRY_SLOW"))
     aprs_manager = APRSManager(mycall, max_retries=retry_count,
                                retry_fast=retry_fast, retry_slow=retry_slow)
 
@@ -309,6 +309,8 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
                 # Pairing failed - might already be paired or not required
                 print_debug(f"Pairing attempt: {e}", level=3)
 
+            print_debug(f"BLE ATT MTU: {client.mtu_size}", level=3)
+
             await client.start_notify(RADIO_INDICATE_UUID, handle_indication)
             await client.start_notify(TNC_RX_UUID, handle_tnc)
 
@@ -352,11 +354,11 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
         radio.shared_ax25 = shared_ax25
 
         # Create digipeater (read state from TNC config)
-        digipeat_mode = (tnc_config.get("DIGIPEAT") or "OFF").upper()
+        digipeat_mode = tnc_config.get_or_default("DIGIPEAT").upper()
         # Validate mode (ON, OFF, SELF)
         if digipeat_mode not in ("ON", "OFF", "SELF"):
             digipeat_mode = "OFF"
-        myalias = tnc_config.get("MYALIAS") or ""
+        myalias = tnc_config.get_or_default("MYALIAS")
         radio.digipeater = Digipeater(mycall, my_alias=myalias, mode=digipeat_mode)
 
         # ========================================================================
@@ -372,8 +374,8 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
             if tcp_host:
                 return  # Bridges disabled in TCP client mode
             try:
-                tnc_host = tnc_config.get("TNC_HOST") or "0.0.0.0"
-                tnc_port = int(tnc_config.get("TNC_PORT") or "8001")
+                tnc_host = tnc_config.get_or_default("TNC_HOST")
+                tnc_port = int(tnc_config.get_or_default("TNC_PORT"))
                 radio.tnc_bridge = TNCBridge(radio, port=tnc_port)
                 await radio.tnc_bridge.start(host=tnc_host)
             except OSError as e:
@@ -391,8 +393,8 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
                 return  # Bridges disabled in TCP client mode
             try:
                 from src.agwpe_bridge import AGWPEBridge
-                agwpe_host = tnc_config.get("AGWPE_HOST") or "0.0.0.0"
-                agwpe_port = int(tnc_config.get("AGWPE_PORT") or "8000")
+                agwpe_host = tnc_config.get_or_default("AGWPE_HOST")
+                agwpe_port = int(tnc_config.get_or_default("AGWPE_PORT"))
                 radio.agwpe_bridge = AGWPEBridge(
                     radio,
                     get_mycall=lambda: tnc_config.get("MYCALL"),
@@ -415,8 +417,8 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
         # Task 4: Start Web UI server
         async def start_web_ui():
             try:
-                webui_host = tnc_config.get("WEBUI_HOST") or "0.0.0.0"
-                webui_port = int(tnc_config.get("WEBUI_PORT") or "8002")
+                webui_host = tnc_config.get_or_default("WEBUI_HOST")
+                webui_port = int(tnc_config.get_or_default("WEBUI_PORT"))
                 radio.web_server = WebServer(
                     radio=radio,
                     aprs_manager=radio.aprs_manager,
@@ -459,46 +461,35 @@ async def main(auto_tnc=False, auto_connect=None, auto_debug=False,
         print_info("All components initialized")
         print_info("Monitoring TNC traffic...")
 
-        # Create background task list
-        background_tasks = [
-            asyncio.create_task(tnc_monitor(tnc_queue, radio)),
-            asyncio.create_task(message_retry_monitor(radio)),
-            asyncio.create_task(autosave_monitor(radio)),
-        ]
+        # Start background monitors; tracked on radio for graceful shutdown
+        radio.start_background_task(tnc_monitor(tnc_queue, radio))
+        radio.start_background_task(message_retry_monitor(radio))
+        radio.start_background_task(autosave_monitor(radio))
 
         # Add BLE-only monitors (GPS, connection, heartbeat)
         if not serial_port and not tcp_host:
-            background_tasks.extend([
-                asyncio.create_task(gps_monitor(radio)),  # GPS only available in BLE mode
-                asyncio.create_task(connection_watcher(radio)),
-                asyncio.create_task(heartbeat_monitor(radio)),
-            ])
-
-        # Store background tasks on radio for graceful shutdown
-        radio.background_tasks = background_tasks
-
-        # Create full task list including command loop
-        tasks = background_tasks.copy()
-
-        # Add command loop with pre-initialized processor
-        tasks.append(
-            asyncio.create_task(
-                command_loop(
-                    radio, processor=processor,
-                    auto_tnc=auto_tnc, auto_connect=auto_connect,
-                    serial_mode=serial_mode
-                )
+            # GPS only available in BLE mode; named so "GPS restart" can find it
+            radio.start_background_task(gps_monitor(radio), name="gps_monitor")
+            radio.start_background_task(connection_watcher(radio))
+            radio.start_background_task(heartbeat_monitor(radio))
+
+        # Run the command loop with pre-initialized processor
+        command_task = asyncio.create_task(
+            command_loop(
+                radio, processor=processor,
+                auto_tnc=auto_tnc, auto_connect=auto_connect,
+                serial_mode=serial_mode
             )
         )
 
-        # Wait for command loop to finish (last task)
-        await tasks[-1]
+        # Wait for command loop to finish
+        await command_task
 
         # Mark as shutting down to suppress disconnect error
         is_shutting_down = True
 
-        # Cancel other tasks
-        for task in tasks[:-1]:  # All except command_loop
+        # Cancel background tasks (including any restarted since startup)
+        for task in list(radio.background_tasks):
             task.cancel()
 
         # Stop TNC bridge (if started)
@@ -483,13 +483,7 @@ async def gps_monitor(radio):
             # Step 1: Flush stale GPS responses from rx_queue
             # This clears any error responses that might be stuck in the queue
             print_debug("Flushing rx_queue to clear stale GPS responses...", level=2)
-            flushed_count = 0
-            while not radio.rx_queue.empty():
-                try:
-                    _ = radio.rx_queue.get_nowait()
-                    flushed_count += 1
-                except asyncio.QueueEmpty:
-                    break
+            flushed_count = radio.drain_rx_queue()
 
             if flushed_count > 0:
                 print_debug(f"Flushed {flushed_count} stale response(s) from queue", level=2)
@@ -65,7 +65,7 @@ def calculate_hop_count(addresses: List[str]) -> int:
     # Count USED digipeaters in path (those marked with asterisk)
     # addresses[2:] contains the digipeater path
     # Only count digipeaters with * (the "used" bit set in AX.25)
-    used_count = sum(1 for digi in addresses[2:] if digi.endswith('*'))
+    used_count = sum(digi[-1:] == '*' for digi in addresses[2:])
     return used_count
 
 
@@ -5,6 +5,7 @@ import functools
 import random
 import string
 import sys
+import time
 import traceback
 from datetime import datetime, timezone
 
@@ -32,6 +33,7 @@ from src.utils import (
     print_info,
     print_pt,
     print_warning,
+    cancel_tasks,
 )
 
 from .frame_history import FrameHistory
@@ -101,24 +103,24 @@ class CommandProcessor:
         if hasattr(self.radio, 'aprs_manager') and self.radio.aprs_manager:
             self.aprs_manager = self.radio.aprs_manager
             # Update retry config from TNC config if it changed
-            retry_count = int(self.tnc_config.get("RETRY") or "3")
-            retry_fast = int(self.tnc_config.get("RETRY_FAST") or "20")
-            retry_slow = int(self.tnc_config.get("RETRY_SLOW") or "600")
+            retry_count = int(self.tnc_config.get_or_default("RETRY"))
+            retry_fast = int(self.tnc_config.get_or_default("RETRY_FAST"))
+            retry_slow = int(self.tnc_config.get_or_default("RETRY_SLOW"))
             self.aprs_manager.max_retries = retry_count
             self.aprs_manager.retry_fast = retry_fast
             self.aprs_manager.retry_slow = retry_slow
         else:
-            mycall = self.tnc_config.get("MYCALL") or "NOCALL"
-            retry_count = int(self.tnc_config.get("RETRY") or "3")
-            retry_fast = int(self.tnc_config.get("RETRY_FAST") or "20")
-            retry_slow = int(self.tnc_config.get("RETRY_SLOW") or "600")
+            mycall = self.tnc_config.get_or_default("MYCALL")
+            retry_count = int(self.tnc_config.get_or_default("RETRY"))
+            retry_fast = int(self.tnc_config.get_or_default("RETRY_FAST"))
+            retry_slow = int(self.tnc_config.get_or_default("RETRY_SLOW"))
             self.aprs_manager = APRSManager(mycall, max_retries=retry_count,
                                            retry_fast=retry_fast, retry_slow=retry_slow)
             # Attach to radio so tnc_monitor() can access it
             self.radio.aprs_manager = self.aprs_manager
 
         # Frame history for debugging
-        debug_buffer_setting = self.tnc_config.get("DEBUG_BUFFER") or "10"
+        debug_buffer_setting = self.tnc_config.get_or_default("DEBUG_BUFFER")
         if debug_buffer_setting.upper() == "OFF":
             self.frame_history = FrameHistory(buffer_mode=False)
             load_info = self.frame_history.load_from_disk()
@@ -156,7 +158,7 @@ class CommandProcessor:
         backend = self.tnc_config.get("WX_BACKEND")
         address = self.tnc_config.get("WX_ADDRESS")
         port_str = self.tnc_config.get("WX_PORT")
-        interval_str = self.tnc_config.get("WX_INTERVAL") or "300"
+        interval_str = self.tnc_config.get_or_default("WX_INTERVAL")
         enabled = self.tnc_config.get("WX_ENABLE") == "ON"
 
         port = int(port_str) if port_str else None
@@ -185,6 +187,14 @@ class CommandProcessor:
         else:
             self.last_beacon_time = None
 
+        # Monotonic counterpart of last_beacon_time, used for elapsed-time
+        # checks; a persisted wall-clock time is converted once here
+        if self.last_beacon_time is not None:
+            age = (datetime.now(timezone.utc) - self.last_beacon_time).total_seconds()
+            self.last_beacon_monotonic = time.monotonic() - age
+        else:
+            self.last_beacon_monotonic = None
+
         self.gps_poll_task = None  # Background GPS polling task
         self.gps_consecutive_failures = 0  # Track consecutive GPS failures for auto-recovery
         self.gps_needs_restart = False  # Flag to trigger GPS task restart
@@ -579,9 +589,9 @@ class CommandProcessor:
         print_pt("")
 
         # Show server ports from TNC config
-        tnc_port = self.tnc_config.get("TNC_PORT") or "8001"
-        agwpe_port = self.tnc_config.get("AGWPE_PORT") or "8000"
-        webui_port = self.tnc_config.get("WEBUI_PORT") or "8002"
+        tnc_port = self.tnc_config.get_or_default("TNC_PORT")
+        agwpe_port = self.tnc_config.get_or_default("AGWPE_PORT")
+        webui_port = self.tnc_config.get_or_default("WEBUI_PORT")
         print_pt(HTML(f"<b>TNC TCP Bridge:</b> Port {tnc_port} (bidirectional)"))
         print_pt(HTML(f"<b>AGWPE Bridge:</b> Port {agwpe_port}"))
         print_pt(HTML(f"<b>Web UI:</b> Port {webui_port}"))
@@ -619,6 +629,7 @@ class CommandProcessor:
                 print_debug(f"Error closing TNC: {e}", level=2)
 
         # Now save - TNC closed, no more frames being added
+        self.tnc_config.flush()
         save_tasks = []
 
         # Save APRS station database
@@ -864,12 +875,7 @@ class CommandProcessor:
                     )
 
                     # Cancel the pending task
-                    for task in pending:
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
+                    await cancel_tasks(pending)
 
                     # Check which task completed
                     if watcher_task in done and watcher_task.result():
@@ -1215,7 +1221,7 @@ class CommandProcessor:
         # Handle disconnected conversation mode - send UI frames
         if not self.tnc_connected_to:
             # Parse UNPROTO setting: "DEST VIA PATH1,PATH2"
-            unproto = self.tnc_config.get("UNPROTO") or "CQ"
+            unproto = self.tnc_config.get_or_default("UNPROTO")
             parts = unproto.split()
             dest = parts[0] if parts else "CQ"
             path = []
@@ -1393,18 +1399,12 @@ class CommandProcessor:
 
                     # Check if beacon is enabled and due
                     if self.tnc_config.get("BEACON") == "ON":
-                        beacon_interval = int(self.tnc_config.get("BEACON_INTERVAL") or "10")
+                        beacon_interval = int(self.tnc_config.get_or_default("BEACON_INTERVAL"))
 
                         # Check if it's time to beacon
-                        now = datetime.now(timezone.utc)
-                        should_beacon = False
-
-                        if self.last_beacon_time is None:
-                            should_beacon = True  # First beacon
-                        else:
-                            elapsed = (now - self.last_beacon_time).total_seconds()
-                            if elapsed >= (beacon_interval * 60):
-                                should_beacon = True
+                        elapsed = self.beacon_elapsed()
+                        # First beacon, or interval has passed
+                        should_beacon = elapsed is None or elapsed >= (beacon_interval * 60)
 
                         if should_beacon:
                             await self._send_position_beacon(position)
@@ -1425,18 +1425,12 @@ class CommandProcessor:
 
                     # Check if beacon is enabled with manual location (MYLOCATION)
                     if self.tnc_config.get("BEACON") == "ON" and self.tnc_config.get("MYLOCATION"):
-                        beacon_interval = int(self.tnc_config.get("BEACON_INTERVAL") or "10")
+                        beacon_interval = int(self.tnc_config.get_or_default("BEACON_INTERVAL"))
 
                         # Check if it's time to beacon
-                        now = datetime.now(timezone.utc)
-                        should_beacon = False
-
-                        if self.last_beacon_time is None:
-                            should_beacon = True  # First beacon
-                        else:
-                            elapsed = (now - self.last_beacon_time).total_seconds()
-                            if elapsed >= (beacon_interval * 60):
-                                should_beacon = True
+                        elapsed = self.beacon_elapsed()
+                        # First beacon, or interval has passed
+                        should_beacon = elapsed is None or elapsed >= (beacon_interval * 60)
 
                         if should_beacon:
                             await self._send_position_beacon(None)  # Use MYLOCATION
@@ -1445,6 +1439,12 @@ class CommandProcessor:
                 print_error(f"GPS poll task error: {e}")
                 await asyncio.sleep(10)  # Back off on error
 
+    def beacon_elapsed(self):
+        """Seconds since the last beacon was sent, or None if never."""
+        if self.last_beacon_monotonic is None:
+            return None
+        return time.monotonic() - self.last_beacon_monotonic
+
     async def _send_position_beacon(self, position=None):
         """Send APRS position beacon.
 
@@ -1456,9 +1456,9 @@ class CommandProcessor:
         try:
             # Get beacon settings
             mycall = self.tnc_config.get("MYCALL")
-            symbol = self.tnc_config.get("BEACON_SYMBOL") or "/["
+            symbol = self.tnc_config.get_or_default("BEACON_SYMBOL")
             comment = self.tnc_config.get("BEACON_COMMENT") or ""
-            path_str = self.tnc_config.get("BEACON_PATH") or "WIDE1-1"
+            path_str = self.tnc_config.get_or_default("BEACON_PATH")
 
             # Parse path
             path = [p.strip() for p in path_str.split(",")]
@@ -1510,7 +1510,7 @@ class CommandProcessor:
             wx_source = None
             if hasattr(self, 'weather_manager') and self.weather_manager.enabled:
                 # Get beacon interval for wind averaging
-                beacon_interval_min = int(self.tnc_config.get("BEACON_INTERVAL") or "10")
+                beacon_interval_min = int(self.tnc_config.get_or_default("BEACON_INTERVAL"))
                 beacon_interval_sec = beacon_interval_min * 60
 
                 # Get weather data with wind averaging over beacon interval
@@ -1602,6 +1602,7 @@ class CommandProcessor:
             # Update timestamp (both in-memory and persisted to config)
             now = datetime.now(timezone.utc)
             self.last_beacon_time = now
+            self.last_beacon_monotonic = time.monotonic()
             self.tnc_config.set("LAST_BEACON", now.isoformat())
 
             # Show beacon info
@@ -1636,7 +1637,7 @@ class CommandProcessor:
             info = f":{to_padded}:{message_text}{{{message_id}"
 
             # Get my callsign
-            mycall = self.tnc_config.get("MYCALL") or "NOCALL"
+            mycall = self.tnc_config.get_or_default("MYCALL")
 
             # Send via radio
             await self.radio.send_aprs(mycall, info, to_call="APFSYC", path=None)
@@ -1662,7 +1663,7 @@ class CommandProcessor:
             info = f":{to_padded}:ack{message_id}"
 
             # Get my callsign
-            mycall = self.tnc_config.get("MYCALL") or "NOCALL"
+            mycall = self.tnc_config.get_or_default("MYCALL")
 
             # Send via radio
             await self.radio.send_aprs(mycall, info, to_call="APFSYC", path=None)
@@ -1,5 +1,7 @@
 """TNC-2 style configuration management."""
 
+import asyncio
+import atexit
 import json
 import os
 import shutil
@@ -19,6 +21,58 @@ from src.utils import (
 class TNCConfig:
     """TNC-2 style configuration management."""
 
+    # Default value for every setting; also the fallback used by
+    # get_or_default() when a setting has been left empty. Settings are
+    # displayed in this (grouped) order.
+    DEFAULTS = {
+        # Identity
+        "MYCALL": "NOCALL",
+        "MYALIAS": "",
+        "MYLOCATION": "",  # Maidenhead grid square (2-10 chars) for manual position
+        "RADIO_MAC": "",  # Bluetooth MAC address for BLE radio (e.g., 38:D2:00:01:62:C2)
+        # Protocol
+        "UNPROTO": "CQ",
+        "MONITOR": "ON",
+        "TXDELAY": "30",
+        "DEBUGFRAMES": "OFF",
+        # APRS messaging
+        "AUTO_ACK": "ON",  # Automatic ACK for APRS messages with IDs
+        "RETRY": "3",
+        "RETRY_FAST": "20",  # Fast retry timeout (seconds) for non-digipeated messages
+        "RETRY_SLOW": "600",  # Slow retry timeout (seconds) for digipeated but not ACKed - 10 minutes
+        # Beaconing
+        "BEACON": "OFF",
+        "BEACON_INTERVAL": "10",
+        "BEACON_PATH": "WIDE1-1",
+        "BEACON_SYMBOL": "/[",
+        "BEACON_COMMENT": "FSY Packet Console",
+        "LAST_BEACON": "",  # Timestamp of last beacon sent (ISO format)
+        # Digipeater
+        "DIGIPEAT": "OFF",
+        # Debug
+        "DEBUG_BUFFER": "10",  # Frame history buffer size in MB (or "OFF" for simple 10-frame mode)
+        # Servers
+        "AGWPE_HOST": "0.0.0.0",  # AGWPE bind address (0.0.0.0=all, 127.0.0.1=localhost)
+        "AGWPE_PORT": "8000",  # AGWPE-compatible server port
+        "TNC_HOST": "0.0.0.0",    # TNC bridge bind address (0.0.0.0=all, 127.0.0.1=localhost)
+        "TNC_PORT": "8001",    # TNC TCP bridge port
+        "WEBUI_HOST": "0.0.0.0",  # Web UI bind address (0.0.0.0=all, 127.0.0.1=localhost)
+        "WEBUI_PORT": "8002",  # Web UI HTTP server port
+        "WEBUI_PASSWORD": "",  # Password for POST API endpoints (empty = disabled)
+        # Weather station
+        "WX_ENABLE": "OFF",  # Enable weather station integration
+        "WX_BACKEND": "ecowitt",  # Backend type: ecowitt, davis, ambient, etc.
+        "WX_ADDRESS": "",  # IP address (http) or serial port path (serial)
+        "WX_PORT": "",  # Port number for network stations (blank = auto)
+        "WX_INTERVAL": "300",  # Update interval in seconds (300 = 5 minutes)
+        "WX_AVERAGE_WIND": "ON",  # Average wind over beacon interval (ON/OFF)
+        "WXTREND": "0.3",  # Pressure tendency threshold in mb/hr for Zambretti (0.3 = ~1.0 mb in 3 hours)
+    }
+
+    # Seconds to wait after a set() before writing, so bursts of changes
+    # are coalesced into a single save
+    SAVE_DELAY = 0.5
+
     def __init__(self, config_file=None):
         # Default to user's home directory
         if config_file is None:
@@ -27,44 +81,15 @@ class TNCConfig:
         self.config_file = config_file
         self.legacy_file = "tnc_config.json"  # Old location in project directory
 
-        self.settings = {
-            "MYCALL": "NOCALL",
-            "MYALIAS": "",
-            "MYLOCATION": "",  # Maidenhead grid square (2-10 chars) for manual position
-            "RADIO_MAC": "",  # Bluetooth MAC address for BLE radio (e.g., 38:D2:00:01:62:C2)
-            "UNPROTO": "CQ",
-            "DIGIPEAT": "OFF",
-            "MONITOR": "ON",
-            "DEBUGFRAMES": "OFF",
-            "TXDELAY": "30",
-            "RETRY": "3",
-            "RETRY_FAST": "20",  # Fast retry timeout (seconds) for non-digipeated messages
-            "RETRY_SLOW": "600",  # Slow retry timeout (seconds) for digipeated but not ACKed - 10 minutes
-            "AUTO_ACK": "ON",  # Automatic ACK for APRS messages with IDs
-            "BEACON": "OFF",
-            "BEACON_INTERVAL": "10",
-            "BEACON_PATH": "WIDE1-1",
-            "BEACON_SYMBOL": "/[",
-            "BEACON_COMMENT": "FSY Packet Console",
-            "LAST_BEACON": "",  # Timestamp of last beacon sent (ISO format)
-            "DEBUG_BUFFER": "10",  # Frame history buffer size in MB (or "OFF" for simple 10-frame mode)
-            "AGWPE_HOST": "0.0.0.0",  # AGWPE bind address (0.0.0.0=all, 127.0.0.1=localhost)
-            "AGWPE_PORT": "8000",  # AGWPE-compatible server port
-            "TNC_HOST": "0.0.0.0",    # TNC bridge bind address (0.0.0.0=all, 127.0.0.1=localhost)
-            "TNC_PORT": "8001",    # TNC TCP bridge port
-            "WEBUI_HOST": "0.0.0.0",  # Web UI bind address (0.0.0.0=all, 127.0.0.1=localhost)
-            "WEBUI_PORT": "8002",  # Web UI HTTP server port
-            "WEBUI_PASSWORD": "",  # Password for POST API endpoints (empty = disabled)
-            "WX_ENABLE": "OFF",  # Enable weather station integration
-            "WX_BACKEND": "ecowitt",  # Backend type: ecowitt, davis, ambient, etc.
-            "WX_ADDRESS": "",  # IP address (http) or serial port path (serial)
-            "WX_PORT": "",  # Port number for network stations (blank = auto)
-            "WX_INTERVAL": "300",  # Update interval in seconds (300 = 5 minutes)
-            "WX_AVERAGE_WIND": "ON",  # Average wind over beacon interval (ON/OFF)
-            "WXTREND": "0.3",  # Pressure tendency threshold in mb/hr for Zambretti (0.3 = ~1.0 mb in 3 hours)
-        }
+        # Starts in DEFAULTS order; loading a saved file only updates values
+        # (and appends any unknown keys at the end)
+        self.settings = dict(self.DEFAULTS)
         self.load()
 
+        # Pending debounced save (asyncio TimerHandle), flushed at exit
+        self._save_handle = None
+        atexit.register(self.flush)
+
     def load(self):
         """Load configuration from file, with migration from legacy location."""
         try:
@@ -72,8 +97,9 @@ class TNCConfig:
             if not os.path.exists(self.config_file) and os.path.exists(self.legacy_file):
                 print_info(f"Migrating config from {self.legacy_file} to {self.config_file}")
                 try:
-                    # Copy the file to new location
-                    shutil.copy2(self.legacy_file, self.config_file)
+                    # Copy the file to new location (contents only; copyfile
+                    # uses the kernel's sendfile fast path on Linux)
+                    shutil.copyfile(self.legacy_file, self.config_file)
                     print_info(f"Migration complete. You can safely delete {self.legacy_file}")
                 except Exception as e:
                     print_error(f"Could not migrate config file: {e}")
@@ -93,14 +119,36 @@ class TNCConfig:
             print_debug(f"Could not load TNC config: {e}", level=6)
 
     def save(self):
-        """Save configuration to file."""
+        """Save configuration to file (atomically, replacing any pending save)."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
         try:
-            with open(self.config_file, "w") as f:
+            temp_file = self.config_file + ".tmp"
+            with open(temp_file, "w") as f:
                 json.dump(self.settings, f, indent=2)
+            os.replace(temp_file, self.config_file)
             print_debug(f"Saved TNC config to {self.config_file}", level=6)
         except Exception as e:
             print_error(f"Could not save TNC config: {e}")
 
+    def _schedule_save(self):
+        """Save shortly, restarting the delay if a save is already pending."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (startup, scripts) - write immediately
+            self.save()
+            return
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        self._save_handle = loop.call_later(self.SAVE_DELAY, self.save)
+
+    def flush(self):
+        """Write a pending debounced save now, if there is one."""
+        if self._save_handle is not None:
+            self.save()
+
     def set(self, key, value):
         """Set a configuration value."""
         key = key.upper()
@@ -167,7 +215,7 @@ class TNCConfig:
                     return False
 
             self.settings[key] = value
-            self.save()
+            self._schedule_save()
             return True
         return False
 
@@ -175,14 +223,19 @@ class TNCConfig:
         """Get a configuration value."""
         return self.settings.get(key.upper(), "")
 
+    def get_or_default(self, key):
+        """Get a configuration value, or its default if unset or empty."""
+        key = key.upper()
+        return self.settings.get(key) or self.DEFAULTS.get(key, "")
+
     def display(self):
         """Display all settings."""
         print_header("TNC-2 Configuration")
-        for key in sorted(self.settings.keys()):
-            value = self.settings[key]
-            if value:
-                print_pt(HTML(f"<b>{key:12s}</b> {value}"))
-            else:
-                print_pt(HTML(f"<gray>{key:12s} (not set)</gray>"))
+        # Settings are already in display (DEFAULTS) order; render in one write
+        lines = [
+            f"<b>{key:12s}</b> {value}" if value else f"<gray>{key:12s} (not set)</gray>"
+            for key, value in self.settings.items()
+        ]
+        print_pt(HTML("\n".join(lines)))
         print_pt("")
 
@@ -52,4 +52,5 @@ DEBUG_LEVEL = 0
 # Per-station debug filters (callsign -> debug_level)
 # When set, overrides DEBUG_LEVEL for specific stations
 # Example: {"K1MAL-7": 5} = debug level 5 for K1MAL-7 only
+# Kept in callsign order by the DEBUG command so it can be displayed as-is
 DEBUG_STATION_FILTERS = {}
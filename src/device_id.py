@@ -11,12 +11,18 @@ License: CC BY-SA 2.0
 
 from src.utils import print_warning, print_error
 
+import functools
 import os
 import yaml
 from pathlib import Path
 from typing import Optional, Dict, List
 from dataclasses import dataclass
 
+# Memoized lookups per identifier. MIC-E destinations encode latitude, so
+# the set of distinct tocalls seen is unbounded and needs an LRU cap.
+_TOCALL_CACHE_SIZE = 4096
+_MICE_CACHE_SIZE = 512
+
 
 @dataclass
 class DeviceInfo:
@@ -58,6 +64,15 @@ class DeviceIdentifier:
 
         self._load_database()
 
+        # Results depend only on the (static) database and the key, so
+        # repeated lookups for the same station are a dict probe
+        self._lookup_tocall = functools.lru_cache(maxsize=_TOCALL_CACHE_SIZE)(
+            self._lookup_tocall
+        )
+        self._lookup_mice = functools.lru_cache(maxsize=_MICE_CACHE_SIZE)(
+            self._lookup_mice
+        )
+
     def _load_database(self):
         """Load and parse the YAML device database."""
         if not self.database_path.exists():
@@ -142,11 +157,13 @@ class DeviceIdentifier:
         """
         # Remove SSID if present
         dest_call = destination.split('-')[0] if '-' in destination else destination
-        dest_call = dest_call.upper()
+        return self._lookup_tocall(dest_call.upper())
 
+    def _lookup_tocall(self, dest_call: str) -> Optional[DeviceInfo]:
+        """Match a normalized tocall against the database (memoized)."""
         # Try exact matches first (no wildcards)
         for entry in self.tocalls:
-            tocall_pattern = entry['tocall'].upper()
+            tocall_pattern = entry.get('tocall', '').upper()
             if '?' not in tocall_pattern and '*' not in tocall_pattern and 'n' not in tocall_pattern.lower():
                 if tocall_pattern == dest_call:
                     return DeviceInfo(
@@ -160,7 +177,7 @@ class DeviceIdentifier:
         # Try wildcarded matches, longest match first
         matches = []
         for entry in self.tocalls:
-            tocall_pattern = entry['tocall'].upper()
+            tocall_pattern = entry.get('tocall', '').upper()
             if self._match_tocall(tocall_pattern, dest_call):
                 # Calculate match quality (number of non-wildcard chars)
                 quality = sum(1 for c in tocall_pattern if c not in '?*n')
@@ -197,10 +214,14 @@ class DeviceIdentifier:
         if not comment or len(comment) < 2:
             return None
 
+        # Only the first character and the last two affect the result
+        return self._lookup_mice(comment[0], comment[-2:])
+
+    def _lookup_mice(self, prefix: str, suffix: str) -> Optional[DeviceInfo]:
+        """Match MIC-E prefix/suffix against the database (memoized)."""
         # Try new-style 2-character suffix
-        suffix = comment[-2:]
         for entry in self.mice:
-            if entry['suffix'] == suffix:
+            if entry.get('suffix') == suffix:
                 return DeviceInfo(
                     vendor=entry.get('vendor', ''),
                     model=entry.get('model', ''),
@@ -210,19 +231,16 @@ class DeviceIdentifier:
                 )
 
         # Try legacy prefix+suffix (old Kenwood)
-        if len(comment) >= 2:
-            prefix = comment[0]
-            suffix = comment[-1]
-
-            for entry in self.micelegacy:
-                if entry.get('prefix') == prefix and entry.get('suffix') == suffix:
-                    return DeviceInfo(
-                        vendor=entry.get('vendor', ''),
-                        model=entry.get('model', ''),
-                        class_type=entry.get('class'),
-                        os=entry.get('os'),
-                        features=entry.get('features')
-                    )
+        last = suffix[-1]
+        for entry in self.micelegacy:
+            if entry.get('prefix') == prefix and entry.get('suffix') == last:
+                return DeviceInfo(
+                    vendor=entry.get('vendor', ''),
+                    model=entry.get('model', ''),
+                    class_type=entry.get('class'),
+                    os=entry.get('os'),
+                    features=entry.get('features')
+                )
 
         return None
 
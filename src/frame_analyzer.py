@@ -20,6 +20,19 @@ import re
 from typing import Dict, List, Optional, Union
 
 
+# APRS weather field patterns (position comments and '_' weather reports)
+_WX_PRESENT_RE = re.compile(r"[cstgrhpPb]\d{2,3}")
+_WX_STRIP_RE = re.compile(r"[cstgrhpPb]\d{2,5}")
+_WX_WIND_RE = re.compile(r"c(\d{3})s(\d{3})")
+_WX_REPORT_WIND_RE = re.compile(r"_(\d{3})/(\d{3})")
+_WX_GUST_RE = re.compile(r"g(\d{3})")
+_WX_TEMP_RE = re.compile(r"t(-?\d{3})")
+_WX_HUMIDITY_RE = re.compile(r"h(\d{2})")
+_WX_PRESSURE_RE = re.compile(r"b(\d{5})")
+_WX_RAIN_1H_RE = re.compile(r"r(\d{3})")
+_WX_RAIN_24H_RE = re.compile(r"p(\d{3})")
+
+
 class Colors:
     """ANSI color codes for terminal output"""
     RESET = '\033[0m'
@@ -267,40 +280,40 @@ def decode_aprs_info(info_str: str, dest_addr: Optional[str] = None) -> Dict:
                 result['details']['comment'] = comment
 
                 # Check for weather data in comment
-                if re.search(r"[cstgrhpPb]\d{2,3}", comment):
+                if _WX_PRESENT_RE.search(comment):
                     result['details']['has_weather'] = True
 
                     # Parse weather fields
-                    match = re.search(r"c(\d{3})s(\d{3})", comment)
+                    match = _WX_WIND_RE.search(comment)
                     if match:
                         result['details']['wind_dir'] = int(match.group(1))
                         result['details']['wind_speed'] = int(match.group(2))
 
-                    match = re.search(r"g(\d{3})", comment)
+                    match = _WX_GUST_RE.search(comment)
                     if match:
                         result['details']['wind_gust'] = int(match.group(1))
 
-                    match = re.search(r"t(-?\d{3})", comment)
+                    match = _WX_TEMP_RE.search(comment)
                     if match:
                         temp = int(match.group(1))
                         if temp > 200:
                             temp = temp - 256
                         result['details']['temperature'] = temp
 
-                    match = re.search(r"h(\d{2})", comment)
+                    match = _WX_HUMIDITY_RE.search(comment)
                     if match:
                         humidity = int(match.group(1))
                         result['details']['humidity'] = 100 if humidity == 0 else humidity
 
-                    match = re.search(r"b(\d{5})", comment)
+                    match = _WX_PRESSURE_RE.search(comment)
                     if match:
                         result['details']['pressure'] = int(match.group(1)) / 10.0
 
-                    match = re.search(r"r(\d{3})", comment)
+                    match = _WX_RAIN_1H_RE.search(comment)
                     if match:
                         result['details']['rain_1h'] = int(match.group(1)) / 100.0
 
-                    match = re.search(r"p(\d{3})", comment)
+                    match = _WX_RAIN_24H_RE.search(comment)
                     if match:
                         result['details']['rain_24h'] = int(match.group(1)) / 100.0
 
@@ -417,36 +430,36 @@ def decode_aprs_info(info_str: str, dest_addr: Optional[str] = None) -> Dict:
         result = {'type': 'APRS Weather', 'details': {}}
         try:
             # Parse weather fields from standalone weather report
-            match = re.search(r"_(\d{3})/(\d{3})", info_str)
+            match = _WX_REPORT_WIND_RE.search(info_str)
             if match:
                 result['details']['wind_dir'] = int(match.group(1))
                 result['details']['wind_speed'] = int(match.group(2))
 
-            match = re.search(r"g(\d{3})", info_str)
+            match = _WX_GUST_RE.search(info_str)
             if match:
                 result['details']['wind_gust'] = int(match.group(1))
 
-            match = re.search(r"t(-?\d{3})", info_str)
+            match = _WX_TEMP_RE.search(info_str)
             if match:
                 temp = int(match.group(1))
                 if temp > 200:
                     temp = temp - 256
                 result['details']['temperature'] = temp
 
-            match = re.search(r"h(\d{2})", info_str)
+            match = _WX_HUMIDITY_RE.search(info_str)
             if match:
                 humidity = int(match.group(1))
                 result['details']['humidity'] = 100 if humidity == 0 else humidity
 
-            match = re.search(r"b(\d{5})", info_str)
+            match = _WX_PRESSURE_RE.search(info_str)
             if match:
                 result['details']['pressure'] = int(match.group(1)) / 10.0
 
-            match = re.search(r"r(\d{3})", info_str)
+            match = _WX_RAIN_1H_RE.search(info_str)
             if match:
                 result['details']['rain_1h'] = int(match.group(1)) / 100.0
 
-            match = re.search(r"p(\d{3})", info_str)
+            match = _WX_RAIN_24H_RE.search(info_str)
             if match:
                 result['details']['rain_24h'] = int(match.group(1)) / 100.0
 
@@ -934,7 +947,7 @@ def _format_position(r: _FrameRenderer, details: Dict) -> None:
     if 'comment' in details and details['comment']:
         comment = details['comment']
         if details.get('has_weather'):
-            comment = re.sub(r'[cstgrhpPb]\d{2,5}', '', comment).strip()
+            comment = _WX_STRIP_RE.sub('', comment).strip()
         if comment:
             r.field("Comment", comment, indent=4)
 
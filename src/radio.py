@@ -5,7 +5,10 @@ This module provides a standalone `RadioController` used by the
 """
 
 import asyncio
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from src import constants
 from src.utils import print_debug, print_error, print_warning
 from src.constants import (
     CMD_GET_HT_STATUS,
@@ -37,6 +40,27 @@ from src.protocol import (
     encode_aprs_packet,
 )
 
+# Back-to-back reads of settings/channels within this window (seconds) are
+# served from cache instead of another radio round trip
+READ_CACHE_TTL = 0.3
+
+# Maximum number of channels kept in the read cache
+CHANNEL_CACHE_SIZE = 64
+
+# BSS settings are only changed from the console, so callers that opt in
+# may reuse the last read/written copy for this long (seconds)
+BSS_CACHE_TTL = 2.0
+
+
+@dataclass(frozen=True)
+class RadioDiagnostics:
+    """Point-in-time snapshot of TNC and heartbeat counters."""
+
+    tnc_idle: int  # seconds since last TNC packet
+    tnc_packets: int
+    heartbeat_failures: int
+    heartbeat_age: int  # seconds since last heartbeat
+
 
 class RadioController:
     """Radio controller wrapper used by `src` modules."""
@@ -56,8 +80,9 @@ class RadioController:
         self.tnc_queue = tnc_queue
         self.running = True
         self.tnc_bridge = None
-        self.last_tnc_packet = datetime.now(timezone.utc)
-        self.last_heartbeat = datetime.now(timezone.utc)
+        # Activity timestamps are time.monotonic() seconds
+        self.last_tnc_packet = time.monotonic()
+        self.last_heartbeat = time.monotonic()
         self.tnc_packet_count = 0
         self.heartbeat_failures = 0
         # KISS callback (AX25Adapter registers here)
@@ -69,6 +94,34 @@ class RadioController:
         # This works even with squelch wide open!
         self.channel_busy = False
         self.last_status_check = 0.0
+        # Radio replies carry no request ID and are matched to commands by
+        # arrival order, so only one command may be in flight at a time
+        self._command_lock = asyncio.Lock()
+        # Short-lived read caches, invalidated by any settings/channel write
+        self._settings_cache = None  # (monotonic timestamp, settings dict)
+        self._channel_cache = OrderedDict()  # channel_id -> (timestamp, channel dict)
+        self._bss_cache = None  # (monotonic timestamp, BSS settings dict)
+        # Bumped on every settings/channel invalidation; a read only caches
+        # its reply if no write started while it waited for the radio
+        self._cache_generation = 0
+        # Long-running monitor tasks, awaited/cancelled on shutdown; the
+        # ones that need to be found again later (e.g. to restart them)
+        # are also kept by task name
+        self.background_tasks = set()
+        self.named_background_tasks = {}
+
+    def start_background_task(self, coro, name=None):
+        """Start a long-running task and track it for shutdown.
+
+        Finished tasks drop out of background_tasks on their own. Tasks
+        given a name are also registered in named_background_tasks.
+        """
+        task = asyncio.create_task(coro, name=name)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        if name:
+            self.named_background_tasks[name] = task
+        return task
 
     async def send_command(self, command_id, body=b"", timeout=2.0):
         """Send radio-specific command (BLE only).
@@ -81,30 +134,59 @@ class RadioController:
             return None
 
         msg = build_message(CMD_GROUP_BASIC, False, command_id, body)
-        try:
-            await self.client.write_gatt_char(
-                RADIO_WRITE_UUID, msg, response=True
-            )
-        except Exception as e:
-            print_error(f"Failed to write to radio: {e}")
-            return None
+        async with self._command_lock:
+            try:
+                await self.client.write_gatt_char(
+                    RADIO_WRITE_UUID, msg, response=True
+                )
+            except Exception as e:
+                print_error(f"Failed to write to radio: {e}")
+                return None
 
-        try:
-            resp = await asyncio.wait_for(self.rx_queue.get(), timeout=timeout)
-            result = parse_message(resp)
-            if result and len(result["body"]) > 0:
-                if result["body"][0] == 0:
-                    return result["body"]
-            return None
-        except asyncio.TimeoutError:
-            return None
+            try:
+                resp = await asyncio.wait_for(self.rx_queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        result = parse_message(resp)
+        if result and len(result["body"]) > 0:
+            if result["body"][0] == 0:
+                return result["body"]
+        return None
+
+    def drain_rx_queue(self):
+        """Discard all queued command responses.
+
+        Returns:
+            Number of responses discarded
+        """
+        q = self.rx_queue
+        count = q.qsize()
+        # Nothing can be added while this runs, so qsize() items are present
+        for _ in range(count):
+            q.get_nowait()
+        return count
 
     def update_tnc_activity(self):
-        self.last_tnc_packet = datetime.now(timezone.utc)
+        self.last_tnc_packet = time.monotonic()
         self.tnc_packet_count += 1
 
     def get_tnc_idle_time(self):
-        return (datetime.now(timezone.utc) - self.last_tnc_packet).total_seconds()
+        return time.monotonic() - self.last_tnc_packet
+
+    def snapshot_diagnostics(self):
+        """Capture TNC/heartbeat counters together as a RadioDiagnostics.
+
+        Synchronous, so no packet or heartbeat update can land between the
+        individual reads.
+        """
+        now = time.monotonic()
+        return RadioDiagnostics(
+            tnc_idle=int(now - self.last_tnc_packet),
+            tnc_packets=self.tnc_packet_count,
+            heartbeat_failures=self.heartbeat_failures,
+            heartbeat_age=int(now - self.last_heartbeat),
+        )
 
     async def check_connection_health(self):
         """Check connection health (BLE only).
@@ -136,7 +218,7 @@ class RadioController:
                     f"Heartbeat OK - RSSI: {status.get('rssi', 0)}/15", level=6
                 )
 
-            self.last_heartbeat = datetime.now(timezone.utc)
+            self.last_heartbeat = time.monotonic()
             return True
         except Exception as e:
             print_error(f"Health check failed: {e}")
@@ -155,6 +237,26 @@ class RadioController:
             return status
         return None
 
+    async def wait_ready(self, powered=True, timeout=2.0, poll=0.05):
+        """Wait until the radio reports the requested power state.
+
+        Polls GET_HT_STATUS with a growing interval (capped at 0.25s)
+        until is_power_on matches `powered` or `timeout` seconds pass.
+
+        Returns:
+            True if the state was reached, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            status = await self.get_status()
+            if status and bool(status.get("is_power_on")) == powered:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(poll, remaining))
+            poll = min(poll * 1.5, 0.25)
+
     async def is_channel_busy(self, max_age=0.5):
         """Check if channel is busy (radio receiving data = carrier detected).
 
@@ -181,20 +283,50 @@ class RadioController:
 
         return self.channel_busy
 
+    def _invalidate_settings_cache(self):
+        """Drop cached settings and channels after anything is written."""
+        self._cache_generation += 1
+        self._settings_cache = None
+        self._channel_cache.clear()
+
     async def get_settings(self):
+        cached = self._settings_cache
+        if cached and time.monotonic() - cached[0] < READ_CACHE_TTL:
+            # Callers modify the returned dict for read-modify-write
+            return dict(cached[1])
+
+        generation = self._cache_generation
         resp = await self.send_command(CMD_READ_SETTINGS)
         if resp:
-            return decode_settings(resp)
+            settings = decode_settings(resp)
+            if settings and generation == self._cache_generation:
+                self._settings_cache = (time.monotonic(), settings)
+                return dict(settings)
+            return settings
         return None
 
     async def write_settings(self, settings):
         settings_bytes = encode_settings(settings)
         if settings_bytes is None:
             return False
+        self._invalidate_settings_cache()
         resp = await self.send_command(CMD_WRITE_SETTINGS, settings_bytes)
+        # A read that completed while this write waited may have cached
+        # the pre-write settings
+        self._invalidate_settings_cache()
         return resp is not None
 
-    async def get_bss_settings(self):
+    async def get_bss_settings(self, use_cache=False):
+        """Read BSS (APRS) settings.
+
+        Args:
+            use_cache: Return the last read/written settings if they are
+                younger than BSS_CACHE_TTL instead of querying the radio
+        """
+        cached = self._bss_cache
+        if use_cache and cached and time.monotonic() - cached[0] < BSS_CACHE_TTL:
+            return dict(cached[1])
+
         print_debug(
             "get_bss_settings: sending READ_BSS_SETTINGS command...", level=6
         )
@@ -204,26 +336,71 @@ class RadioController:
                 f"get_bss_settings: received response of {len(resp)} bytes",
                 level=6,
             )
-            return decode_bss_settings(resp)
+            bss = decode_bss_settings(resp)
+            if bss:
+                self._bss_cache = (time.monotonic(), bss)
+                return dict(bss)
+            return bss
         else:
             print_error("get_bss_settings: no response from radio")
         return None
 
     async def write_bss_settings(self, bss):
         bss_bytes = encode_bss_settings(bss)
+        self._bss_cache = None
         resp = await self.send_command(CMD_WRITE_BSS_SETTINGS, bss_bytes)
-        return resp is not None
+        if resp is None:
+            return False
+        self._bss_cache = (time.monotonic(), dict(bss))
+        return True
 
     async def read_channel(self, channel_id):
+        cached = self._channel_cache.get(channel_id)
+        if cached and time.monotonic() - cached[0] < READ_CACHE_TTL:
+            self._channel_cache.move_to_end(channel_id)
+            return dict(cached[1])
+
         internal_id = channel_id - 1
+        generation = self._cache_generation
         resp = await self.send_command(CMD_READ_RF_CH, bytes([internal_id]))
         if resp:
-            return decode_channel(resp)
+            channel = decode_channel(resp)
+            if channel and generation == self._cache_generation:
+                self._channel_cache[channel_id] = (time.monotonic(), channel)
+                self._channel_cache.move_to_end(channel_id)
+                if len(self._channel_cache) > CHANNEL_CACHE_SIZE:
+                    self._channel_cache.popitem(last=False)
+                return dict(channel)
+            return channel
         return None
 
+    async def read_channel_range(self, start, end):
+        """Read channels start..end (1-based, inclusive).
+
+        The radio has no bulk channel read, so this issues one READ_RF_CH
+        per channel. Replies are matched to commands by arrival order, so
+        the reads go strictly one at a time. Cached channels are served
+        without a round trip.
+
+        Returns:
+            List of (channel_id, channel dict or None) in channel order
+        """
+        if not self.client:
+            # Serial mode: radio commands are unavailable
+            return [(ch_id, None) for ch_id in range(start, end + 1)]
+
+        results = []
+        for ch_id in range(start, end + 1):
+            results.append((ch_id, await self.read_channel(ch_id)))
+        return results
+
     async def write_channel(self, channel_data):
         channel_bytes = encode_channel(channel_data)
+        self._invalidate_settings_cache()
         resp = await self.send_command(CMD_WRITE_RF_CH, channel_bytes)
+        # A read that completed while this write waited may have cached
+        # the pre-write channel
+        self._invalidate_settings_cache()
         return resp is not None
 
     async def set_channel_power(self, channel_id, power_level):
@@ -503,10 +680,11 @@ class RadioController:
         try:
             # Delegate to transport layer
             await self.transport.send_tnc_data(data)
-            print_debug(
-                f"Sent {len(data)} bytes to TNC: {data.hex()}",
-                level=6,
-            )
+            if constants.DEBUG_LEVEL >= 6:
+                print_debug(
+                    f"Sent {len(data)} bytes to TNC: {data.hex()}",
+                    level=6,
+                )
         except Exception as e:
             print_error(f"Failed to send TNC data: {e}")
 
@@ -520,16 +698,26 @@ class RadioController:
         if path is None:
             path = ["WIDE1-1", "WIDE2-1"]
 
+        packet = encode_aprs_packet(from_call, to_call, path, message)
+
+        # Only build the hex dump and decoded preview when they will be shown
+        if constants.DEBUG_LEVEL >= 4:
+            self._debug_tx_packet(from_call, to_call, path, message, packet)
+
+        await self.send_tnc_data(packet)
+
+    def _debug_tx_packet(self, from_call, to_call, path, message, packet):
+        """Print debug details for an outgoing APRS packet."""
         print_debug(
             f"send_aprs: from={from_call}, to={to_call}, path={path}", level=5
         )
         print_debug(f"send_aprs: message='{message}'", level=5)
 
-        packet = encode_aprs_packet(from_call, to_call, path, message)
-
         print_debug(
             f"TX KISS frame ({len(packet)} bytes): {packet.hex()}", level=4
         )
+        if constants.DEBUG_LEVEL < 5:
+            return
         # Decode the packet to show what will be transmitted
         try:
             from src.protocol import (
@@ -555,8 +743,6 @@ class RadioController:
         except Exception as e:
             print_debug(f"TX decode error: {e}", level=5)
 
-        await self.send_tnc_data(packet)
-
     def register_kiss_callback(self, cb):
         self._kiss_callback = cb
 
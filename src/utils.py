@@ -1,5 +1,6 @@
 """Utility functions for the radio console."""
 
+import asyncio
 import html
 import os
 from datetime import datetime
@@ -284,11 +285,29 @@ def print_warning(text):
     print_pt(HTML(f"<orange>[WARNING]</orange> {safe_text}"))
 
 
-def print_table_row(cols, widths, header=False):
-    """Print a formatted table row."""
+async def cancel_tasks(tasks):
+    """Cancel tasks and wait for all of them to finish.
+
+    Every task is cancelled before any is awaited, so their shutdowns run
+    concurrently. Exceptions (including CancelledError) raised by the
+    tasks are discarded.
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def build_table_row(cols, widths):
+    """Build a formatted table row without printing it."""
     row = "  "
-    for i, (col, width) in enumerate(zip(cols, widths)):
+    for col, width in zip(cols, widths):
         row += str(col).ljust(width) + "  "
+    return row
+
+
+def print_table_row(cols, widths, header=False):
+    """Print a formatted table row."""
+    row = build_table_row(cols, widths)
 
     if header:
         print_pt(HTML(f"<b>{row}</b>"))
@@ -55,6 +55,17 @@ class WeatherStationManager:
         self._connected: bool = False
         self._weather_history: List[WeatherData] = []  # Recent readings for averaging
 
+        # get_status() result is reused until _status_version is bumped by
+        # configure()/connect()/disconnect() or a new reading
+        self._status_version: int = 0
+        self._status_cache: Optional[dict] = None
+        self._status_cache_version: int = -1
+
+    @property
+    def configured(self) -> bool:
+        """True once both a backend and an address have been set."""
+        return self.backend is not None and self.address is not None
+
     def configure(
         self,
         backend: Optional[str] = None,
@@ -75,40 +86,45 @@ class WeatherStationManager:
         Returns:
             True if configuration valid, False otherwise
         """
-        # Validate backend
-        if backend is not None:
-            if backend not in self.BACKENDS:
-                valid = ', '.join(self.BACKENDS.keys())
-                print_error(f"Invalid backend '{backend}'. Valid: {valid}")
-                return False
-            self.backend = backend
-
-        # Validate address
-        if address is not None:
-            if not address.strip():
-                print_error("Address cannot be empty")
-                return False
-            self.address = address.strip()
-
-        # Validate port
-        if port is not None:
-            if not (1 <= port <= 65535):
-                print_error(f"Invalid port {port}. Must be 1-65535")
-                return False
-            self.port = port
-
-        # Set enabled state
-        if enabled is not None:
-            self.enabled = enabled
-
-        # Validate update interval
-        if update_interval is not None:
-            if not (30 <= update_interval <= 3600):
-                print_error(f"Invalid interval {update_interval}. Must be 30-3600 seconds")
-                return False
-            self.update_interval = update_interval
+        # Earlier fields may already be assigned when a later one fails
+        # validation, so the cached status is invalidated on every exit
+        try:
+            # Validate backend
+            if backend is not None:
+                if backend not in self.BACKENDS:
+                    valid = ', '.join(self.BACKENDS.keys())
+                    print_error(f"Invalid backend '{backend}'. Valid: {valid}")
+                    return False
+                self.backend = backend
+
+            # Validate address
+            if address is not None:
+                if not address.strip():
+                    print_error("Address cannot be empty")
+                    return False
+                self.address = address.strip()
+
+            # Validate port
+            if port is not None:
+                if not (1 <= port <= 65535):
+                    print_error(f"Invalid port {port}. Must be 1-65535")
+                    return False
+                self.port = port
+
+            # Set enabled state
+            if enabled is not None:
+                self.enabled = enabled
+
+            # Validate update interval
+            if update_interval is not None:
+                if not (30 <= update_interval <= 3600):
+                    print_error(f"Invalid interval {update_interval}. Must be 30-3600 seconds")
+                    return False
+                self.update_interval = update_interval
 
-        return True
+            return True
+        finally:
+            self._status_version += 1
 
     async def connect(self) -> bool:
         """Connect to configured weather station.
@@ -162,6 +178,7 @@ class WeatherStationManager:
                 return False
 
             self._connected = True
+            self._status_version += 1
             print_info(f"✓ Connected to {backend_info['name']}")
 
             # Get station info
@@ -177,6 +194,7 @@ class WeatherStationManager:
             print_error(f"Failed to connect to weather station: {e}")
             self._station = None
             self._connected = False
+            self._status_version += 1
             return False
 
     async def disconnect(self):
@@ -187,6 +205,7 @@ class WeatherStationManager:
         # Clear station
         self._station = None
         self._connected = False
+        self._status_version += 1
         print_info("Weather station disconnected")
 
     async def start_updates(self):
@@ -217,6 +236,7 @@ class WeatherStationManager:
                 if data:
                     self._last_data = data
                     self._last_update = datetime.now(timezone.utc)
+                    self._status_version += 1
 
                     # Add to history for wind averaging
                     self._weather_history.append(data)
@@ -403,12 +423,18 @@ class WeatherStationManager:
     def get_status(self) -> dict:
         """Get weather station status.
 
+        The dict is cached and shared between calls until the station is
+        reconfigured, (dis)connected or receives new data; don't mutate it.
+
         Returns:
             Dictionary with status information
         """
+        if self._status_cache_version == self._status_version:
+            return self._status_cache
+
         status = {
             'enabled': self.enabled,
-            'configured': self.backend is not None and self.address is not None,
+            'configured': self.configured,
             'connected': self._connected,
             'backend': self.backend,
             'address': self.address,
@@ -421,6 +447,8 @@ class WeatherStationManager:
         if self._station:
             status['station_info'] = self._station.get_station_info()
 
+        self._status_cache = status
+        self._status_cache_version = self._status_version
         return status
 
     @classmethod